@@ -33,21 +33,24 @@ let activePattern = null;
 export function startLaserPattern(patternDef) {
     activePattern = {
         def: patternDef,
-        lasers: patternDef.lasers.map((l) => {
-            const loop = l.loop !== false;
-            return {
-                keyframes: l.keyframes,
-                loop,
-                elapsed: 0,
-                cycleDuration: getCycleDuration(l.keyframes),
-                activeStarts: collectActiveStartTimes(l.keyframes, loop),
-            };
-        }),
+        lasers: patternDef.lasers.map(prepareLaser),
         elapsed: 0,
         duration: patternDef.duration,
     };
 }
 
+// Runtime laser state (what sampleLaser needs to enforce warn windows).
+export function prepareLaser(l) {
+    const loop = l.loop !== false;
+    return {
+        keyframes: l.keyframes,
+        loop,
+        elapsed: 0,
+        cycleDuration: getCycleDuration(l.keyframes),
+        activeStarts: collectActiveStartTimes(l.keyframes, loop),
+    };
+}
+
 export function stopLaserPattern() { activePattern = null; }
 export function isLaserPatternActive() { return activePattern !== null; }
 export function getActivePatternName() { return activePattern ? activePattern.def.name : ''; }
@@ -58,7 +61,7 @@ export function getActivePatternDuration() { return activePattern ? activePatter
 // Keyframe interpolation
 // -----------------------------------------------------------------------
 
-function sampleLaser(laser, elapsed) {
+export function sampleLaser(laser, elapsed) {
     const keyframes = laser.keyframes;
     const loop = laser.loop !== false;
     const n = keyframes.length;
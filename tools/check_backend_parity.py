@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Cross-check the event backend's final frontier against the numpy backend.
+
+The two models differ on purpose: the event backend is exact in continuous
+time and counts px, while the numpy grid rounds every tick's reach up to whole
+rows. For every pattern this still requires:
+
+  - the same PASS/FAIL verdict;
+  - event final reachable <= event final safe. The grid is not held to this:
+    its final frontier is cut at the last accumulated tick, which can sit a
+    hair past duration, while final_safe_count is taken at duration itself;
+  - the exact frontier to fit inside the grid frontier: its px span may exceed
+    the grid's row count by at most one per safe interval (len(lasers) + 1);
+  - a grid frontier that covers the whole safe set whenever the exact one does.
+
+Exits non-zero if any pattern breaks one of these.
+
+Usage:
+    python tools/check_backend_parity.py
+    python tools/check_backend_parity.py --pattern H4 --dt 0.004166
+    python tools/check_backend_parity.py --source python
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+from laser_patterns import EPS
+from laser_export import load_patterns
+from laser_grid import analyze_pattern_numpy, np
+from laser_event import analyze_pattern_event
+from laser_cache import DEFAULT_CACHE_DIR
+
+
+def parity_problems(pattern, event, grid):
+    """Broken invariants between one pattern's event and numpy results."""
+    problems = []
+    if event.solvable != grid.solvable:
+        problems.append("verdicts differ (event {}, numpy {})".format(event.solvable, grid.solvable))
+    if event.final_reachable_count > event.final_safe_count + EPS:
+        problems.append("event final reachable {:g} exceeds final safe {:g}".format(
+            event.final_reachable_count, event.final_safe_count))
+    if event.final_reachable_count > grid.final_reachable_count + len(pattern["lasers"]) + 1:
+        problems.append("event frontier {:g}px does not fit in numpy frontier {:g} rows".format(
+            event.final_reachable_count, grid.final_reachable_count))
+    event_full = event.final_reachable_count >= event.final_safe_count - EPS
+    if event_full and grid.final_reachable_count < grid.final_safe_count:
+        problems.append("event frontier covers the safe set but numpy's does not")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event vs numpy backend final-frontier parity")
+    parser.add_argument("--pattern", help="Only check one pattern ID (e.g. H4)")
+    parser.add_argument("--source", choices=("js", "python"), default="js",
+                        help="js: patterns/config via the Node export; python: the hand-ported copies")
+    parser.add_argument("--dt", type=float, default=1.0 / 60.0, help="Simulation step in seconds")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Pattern export snapshot directory")
+    args = parser.parse_args()
+
+    if np is None:
+        print("ERROR: the numpy backend requires NumPy (pip install numpy)", file=sys.stderr)
+        return 1
+    try:
+        cfg, patterns = load_patterns(args.source, args.cache_dir, args.pattern)
+    except (RuntimeError, ValueError) as e:
+        print("ERROR: {}".format(e), file=sys.stderr)
+        return 1
+
+    print("Backend Parity (event vs numpy final frontier)")
+    print("==============================================")
+    failed = 0
+    for pattern in patterns:
+        event = analyze_pattern_event(pattern, cfg, args.dt)
+        grid = analyze_pattern_numpy(pattern, cfg, args.dt)
+        problems = parity_problems(pattern, event, grid)
+        failed += bool(problems)
+        print("[{}] {:<3} event {:g}/{:g}px, numpy {:g}/{:g} rows".format(
+            "FAIL" if problems else "OK", event.pattern_id,
+            event.final_reachable_count, event.final_safe_count,
+            grid.final_reachable_count, grid.final_safe_count))
+        for problem in problems:
+            print("       {}".format(problem))
+    print("\nFailed: {}/{}".format(failed, len(patterns)))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Differential parity check between the Python laser model and js/laserPattern.js.
+
+Starts one long-lived Node process (tools/laser_parity_server.mjs), streams
+batches of random (pattern, t) queries to it as NDJSON and compares:
+
+  - getSafeCenterBandsAtTime, rasterized to integer center rows, against
+    compute_safe_rows (rows within PARITY_EDGE_EPS_PX of a band edge are
+    skipped: the JS bands do not say whether an edge row is blocked);
+  - sampleLaser geometry and displayed state (warn-window enforcement
+    included) against sample_laser.
+
+Times are mostly uniform over each pattern's duration; the rest sit on and
+one ulp around keyframe times, loop wraps and warn-window edges, where the
+two ports are most likely to disagree. Exits non-zero on any divergence.
+
+Usage:
+    python tools/check_laser_parity.py
+    python tools/check_laser_parity.py --samples 5000000 --pattern X3
+    python tools/check_laser_parity.py --source python --seed 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import List
+
+from laser_export import PROJECT_ROOT, load_patterns
+from laser_model import (
+    REQUIRED_WARN_DURATION,
+    STATE_CODES,
+    compute_safe_rows,
+    grid_bounds,
+    pattern_cursors,
+    sample_laser,
+)
+from laser_cache import DEFAULT_CACHE_DIR
+
+PARITY_SERVER = os.path.join(PROJECT_ROOT, "tools", "laser_parity_server.mjs")
+PARITY_BATCH = 4096
+PARITY_DEFAULT_SAMPLES = 200000
+PARITY_EDGE_FRACTION = 0.1  # share of samples placed on/around critical times
+PARITY_EDGE_EPS_PX = 1e-6
+PARITY_GEOMETRY_TOL_PX = 1e-9
+PARITY_MAX_EXAMPLES = 5
+STATE_NAMES = {code: name for name, code in STATE_CODES.items()}
+
+
+@dataclass
+class PatternParity:
+    pattern_id: str
+    samples: int = 0
+    band_divergences: int = 0
+    sample_divergences: int = 0
+    examples: List[str] = field(default_factory=list)
+
+    def note(self, text):
+        if len(self.examples) < PARITY_MAX_EXAMPLES:
+            self.examples.append(text)
+
+
+# ---------------------------------------------------------------------------
+# Node server
+# ---------------------------------------------------------------------------
+
+class ParityServer:
+    """One Node process answering NDJSON requests in order."""
+
+    def __init__(self):
+        try:
+            self.proc = subprocess.Popen(["node", PARITY_SERVER], stdin=subprocess.PIPE,
+                                         stdout=subprocess.PIPE, text=True, cwd=PROJECT_ROOT)
+        except FileNotFoundError:
+            raise RuntimeError("node not found on PATH (needed to run js/laserPattern.js)")
+
+    def request(self, message):
+        self.proc.stdin.write(json.dumps(message) + "\n")
+        self.proc.stdin.flush()
+        line = self.proc.stdout.readline()
+        if not line:
+            raise RuntimeError("laser_parity_server.mjs exited (code {})".format(self.proc.wait()))
+        return json.loads(line)
+
+    def close(self):
+        self.proc.stdin.close()
+        self.proc.wait()
+
+
+# ---------------------------------------------------------------------------
+# Query times
+# ---------------------------------------------------------------------------
+
+def critical_times(pattern):
+    """Keyframe times, loop wraps and warn-window edges inside the pattern duration."""
+    duration = float(pattern["duration"])
+    out = set()
+    for laser in pattern["lasers"]:
+        keyframes = laser["keyframes"]
+        if not keyframes:
+            continue
+        local = [float(k["t"]) for k in keyframes]
+        local += [t - REQUIRED_WARN_DURATION for t in local]
+        cycle = local[len(keyframes) - 1]
+        repeats = int(duration // cycle) + 1 if laser.get("loop", True) and cycle > 0 else 1
+        for n in range(repeats):
+            out.update(t + n * cycle for t in local if 0 <= t + n * cycle <= duration)
+    return sorted(out)
+
+
+def query_times(pattern, count, rng):
+    duration = float(pattern["duration"])
+    edges = critical_times(pattern)
+    times = []
+    for _ in range(count):
+        if edges and rng.random() < PARITY_EDGE_FRACTION:
+            t = rng.choice(edges)
+            t = rng.choice((t, math.nextafter(t, -math.inf), math.nextafter(t, math.inf)))
+            times.append(max(0.0, t))
+        else:
+            times.append(rng.uniform(0.0, duration))
+    return sorted(times)
+
+
+# ---------------------------------------------------------------------------
+# Comparison
+# ---------------------------------------------------------------------------
+
+def rows_from_bands(bands, safe, grid_min_y, grid_max_y):
+    """JS bands as a row list aligned with safe; edge rows copy safe (not compared)."""
+    expected = [False] * (grid_max_y + 1)
+    for lo, hi in bands:
+        first = max(grid_min_y, math.ceil(lo + PARITY_EDGE_EPS_PX))
+        last = min(grid_max_y, math.floor(hi - PARITY_EDGE_EPS_PX))
+        if last >= first:
+            expected[first:last + 1] = [True] * (last - first + 1)
+    for edge in (e for band in bands for e in band):
+        for y in range(math.ceil(edge - PARITY_EDGE_EPS_PX), math.floor(edge + PARITY_EDGE_EPS_PX) + 1):
+            if grid_min_y <= y <= grid_max_y:
+                expected[y] = safe[y]
+    return expected
+
+
+def samples_match(py, js):
+    if js is None:
+        return False
+    geometry_ok = all(abs(a - b) <= PARITY_GEOMETRY_TOL_PX for a, b in zip(py[:4], js[:4]))
+    return geometry_ok and py.state == STATE_CODES[js[4]]
+
+
+def compare_batch(parity, pattern, times, reply, cfg, grid_min_y, grid_max_y):
+    cursors = pattern_cursors(pattern)
+    keyed = [i for i, laser in enumerate(pattern["lasers"]) if laser["keyframes"]]
+    for t, bands, js_samples in zip(times, reply["bands"], reply["samples"]):
+        safe = compute_safe_rows(cursors, t, cfg, grid_min_y, grid_max_y)
+        expected = rows_from_bands(bands, safe, grid_min_y, grid_max_y)
+        if expected != safe:
+            parity.band_divergences += 1
+            rows = [y for y in range(grid_min_y, grid_max_y + 1) if expected[y] != safe[y]]
+            parity.note("t={!r}: rows {} disagree (JS bands {})".format(t, rows, bands))
+        for cursor, index in zip(cursors, keyed):
+            py = sample_laser(cursor, t)
+            if not samples_match(py, js_samples[index]):
+                parity.sample_divergences += 1
+                parity.note("t={!r} laser {}: JS {} vs Python {}".format(
+                    t, index, js_samples[index], list(py[:4]) + [STATE_NAMES[py.state]]))
+    parity.samples += len(times)
+
+
+def check_pattern(server, index, pattern, count, cfg, rng):
+    grid_min_y, grid_max_y = grid_bounds(cfg)
+    parity = PatternParity(pattern["id"])
+    for start in range(0, count, PARITY_BATCH):
+        times = query_times(pattern, min(PARITY_BATCH, count - start), rng)
+        reply = server.request({"op": "query", "pattern": index, "times": times})
+        compare_batch(parity, pattern, times, reply, cfg, grid_min_y, grid_max_y)
+    return parity
+
+
+def print_parity(results):
+    print("Laser Parity (Python vs js/laserPattern.js)")
+    print("===========================================")
+    for r in results:
+        print("{}: {} samples, {} band divergences, {} sample divergences".format(
+            r.pattern_id, r.samples, r.band_divergences, r.sample_divergences))
+        for example in r.examples:
+            print("  {}".format(example))
+    diverged = sum(1 for r in results if r.band_divergences or r.sample_divergences)
+    print("\nDiverged: {}/{}".format(diverged, len(results)))
+    return 1 if diverged else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Python vs JS laser model parity check")
+    parser.add_argument("--pattern", help="Only check one pattern ID (e.g. M2)")
+    parser.add_argument("--source", choices=("js", "python"), default="js",
+                        help="js: patterns/config via the Node export; python: the hand-ported copies")
+    parser.add_argument("--samples", type=int, default=PARITY_DEFAULT_SAMPLES,
+                        help="Total (pattern, t) samples, split evenly across patterns "
+                             "(default %(default)s, ~20 s; 1000000 takes ~75 s)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for query times")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Pattern export snapshot directory")
+    args = parser.parse_args()
+
+    if args.samples < 1:
+        print("ERROR: --samples must be >= 1", file=sys.stderr)
+        return 1
+    try:
+        cfg, patterns = load_patterns(args.source, args.cache_dir, args.pattern)
+        rng = random.Random(args.seed)
+        per_pattern = max(1, args.samples // len(patterns))
+        server = ParityServer()
+        try:
+            server.request({"op": "load", "patterns": patterns})
+            results = [check_pattern(server, i, p, per_pattern, cfg, rng) for i, p in enumerate(patterns)]
+        finally:
+            server.close()
+    except (RuntimeError, ValueError) as e:
+        print("ERROR: {}".format(e), file=sys.stderr)
+        return 1
+    return print_parity(results)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Check that --margins measures something on the shipped patterns.
+
+Runs the verifier's margin bisection on every pattern and fails unless at
+least one pattern gets a bounded (non-saturated) velocity margin and at least
+one gets a bounded timing slack. A model whose probes can never fail would
+report "unbounded" everywhere and trip this check.
+
+Usage:
+    python tools/check_margins.py
+    python tools/check_margins.py --source python --dt 0.008333
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+
+from laser_export import load_patterns
+from laser_cache import DEFAULT_CACHE_DIR
+from laser_margins import MarginJob, np, pattern_margins, print_margins
+
+BOUNDED_FIELDS = ("velocity_reduction", "timing_slack_s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Require bounded solvability margins on shipped patterns")
+    parser.add_argument("--source", choices=("js", "python"), default="js",
+                        help="js: patterns/config via the Node export; python: the hand-ported copies")
+    parser.add_argument("--dt", type=float, default=1.0 / 60.0, help="Simulation step in seconds")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Pattern export snapshot directory")
+    args = parser.parse_args()
+
+    if np is None:
+        print("ERROR: margins require NumPy (pip install numpy)", file=sys.stderr)
+        return 1
+    try:
+        cfg, patterns = load_patterns(args.source, args.cache_dir)
+    except RuntimeError as e:
+        print("ERROR: {}".format(e), file=sys.stderr)
+        return 1
+
+    margins = [pattern_margins(MarginJob(p, cfg, args.dt)) for p in patterns]
+    print_margins(margins)
+    print()
+    saturated = []
+    for name in BOUNDED_FIELDS:
+        bounded = [m.pattern_id for m in margins if getattr(m, name) not in (None, math.inf)]
+        print("{}: bounded for {}".format(name, ", ".join(bounded) or "no pattern"))
+        if not bounded:
+            saturated.append(name)
+    if saturated:
+        print("ERROR: saturated on every pattern: {}".format(", ".join(saturated)), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Check --monte-carlo on a pattern with no safe row at t = 0.
+
+The witness of such a pattern has no path at all, so every trajectory must be
+reported dead on the first tick: 0 survivors, a Wilson interval starting at 0
+and a median death time of 0 s.
+
+Usage:
+    python tools/check_monte_carlo.py
+"""
+
+from __future__ import annotations
+
+import sys
+
+from laser_patterns import GROUND_Y, SimConfig, h_beam
+from laser_monte_carlo import MonteCarloJob, monte_carlo_survival, np, print_monte_carlo
+
+WALL_SPACING_PX = 20
+WALL_DURATION_S = 2.0
+TRAJECTORIES = 200
+
+
+def wall_pattern():
+    """Horizontal beams every WALL_SPACING_PX from the top to the ground, active from t = 0."""
+    return {
+        "id": "W0", "name": "W0: Full Wall", "tier": "test",
+        "duration": WALL_DURATION_S,
+        "lasers": [
+            {"loop": False, "keyframes": [h_beam(0.0, y, "active"), h_beam(WALL_DURATION_S, y, "active")]}
+            for y in range(0, GROUND_Y + 1, WALL_SPACING_PX)
+        ],
+    }
+
+
+def main():
+    if np is None:
+        print("ERROR: --monte-carlo requires NumPy (pip install numpy)", file=sys.stderr)
+        return 1
+    result = monte_carlo_survival(MonteCarloJob(wall_pattern(), SimConfig(), 1.0 / 60.0, TRAJECTORIES))
+    print_monte_carlo([result])
+    if result.survivors != 0 or result.ci_low != 0.0 or result.median_death_time != 0.0:
+        print("ERROR: expected 0 survivors dying at t=0, got {}".format(result), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
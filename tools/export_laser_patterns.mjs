@@ -2,7 +2,9 @@ import { LASER_PATTERNS } from '../js/data/laserPatterns.js';
 import {
     GROUND_Y,
     PLAYER_HEIGHT, PLAYER_WIDTH, PLAYER_START_X,
+    PLAYER_RENDER_HEIGHT, PLAYER_SPRITE_BOTTOM_PAD, PLAYER_HITBOX_OFFSET_Y,
     LASER_BEAM_THICKNESS,
+    GRAVITY, THRUST,
     TERMINAL_VEL_UP, TERMINAL_VEL_DOWN
 } from '../js/config.js';
 
@@ -12,7 +14,12 @@ const payload = {
         PLAYER_HEIGHT,
         PLAYER_WIDTH,
         PLAYER_START_X,
+        PLAYER_RENDER_HEIGHT,
+        PLAYER_SPRITE_BOTTOM_PAD,
+        PLAYER_HITBOX_OFFSET_Y,
         LASER_BEAM_THICKNESS,
+        GRAVITY,
+        THRUST,
         TERMINAL_VEL_UP,
         TERMINAL_VEL_DOWN,
     },
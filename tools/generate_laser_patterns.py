@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Procedural laser pattern generator with the solvability checker in the loop.
+
+Samples candidate patterns from parameter ranges around the hand-made ones,
+built with the same helpers laser_patterns.py ports from
+js/data/laserPatterns.js (corridors, down-up waves, timed gates, arc sweeps).
+Each candidate is solved on the reachability grid; unsolvable ones and ones
+outside the target band are rejected. Solves stop as soon as the frontier
+empties or drops below the band, and candidates fan out over worker processes.
+
+Metrics:
+    min-reachable  fewest reachable rows (px) at any tick
+    margin         extra beam thickness (px) the pattern still survives
+
+Accepted patterns are written as JSON (pattern dicts plus the parameters that
+produced them) for porting into js/data/laserPatterns.js.
+
+Usage:
+    python tools/generate_laser_patterns.py --tier hard --count 10 --out debug/generated.json
+    python tools/generate_laser_patterns.py --family corridor --family gates --band 40:90
+    python tools/generate_laser_patterns.py --metric margin --band 8:24 --seed 7
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Dict, Optional, Tuple
+
+from laser_patterns import (
+    CANVAS_WIDTH,
+    GROUND_Y,
+    SimConfig,
+    arc_sweep,
+    build_corridor_pattern,
+    build_down_up_sine_waypoints,
+    build_sine_waypoints,
+    build_timed_gate_pattern,
+)
+from laser_export import load_patterns
+from laser_model import (
+    grid_bounds,
+    pattern_cursors,
+    reach_rows,
+    row_mask,
+    safe_bitset,
+    step_frontier,
+    tick_times,
+)
+from laser_cache import DEFAULT_CACHE_DIR
+from laser_margins import bisect_margin
+
+# ---------------------------------------------------------------------------
+# Search parameters -- tweak these and re-run
+# ---------------------------------------------------------------------------
+
+TIER_BANDS = {  # default (lo, hi) per metric, in px
+    "medium": {"min-reachable": (120, 240), "margin": (40, 120)},
+    "hard": {"min-reachable": (60, 140), "margin": (16, 48)},
+    "extreme": {"min-reachable": (30, 90), "margin": (4, 20)},
+}
+TIER_PREFIX = {"medium": "GM", "hard": "GH", "extreme": "GX"}
+
+PATTERN_DURATION = 12.0
+CYCLE_RANGE = (6.0, 7.5)
+CORRIDOR_GAP_RANGE = (140, 240)
+SINE_START_T = 1.0
+SINE_END_RANGE = (4.4, 5.4)
+SINE_SAMPLES = 24
+SINE_CENTER_RANGE = (160, 230)
+SINE_AMPLITUDE_RANGE = (30, 85)
+SINE_PERIOD_RANGE = (2.2, 4.6)
+WAVE_AMPLITUDE_RANGE = (20, 45)
+WAVE_PERIOD_RANGE = (1.8, 3.0)
+WAVE_TREND_RANGE = (30, 80)
+GATE_BEAM_COUNT_RANGE = (2, 6)
+GATE_Y_MARGIN = 60
+GATE_WINDOW_RANGE = (0.6, 1.0)
+GATE_FIRST_WINDOW_T = 1.0
+SWEEP_LENGTH = 1000
+SWEEP_STEPS = 24
+SWEEP_ANGLE_RANGE = (0.35, 0.9)  # radians swept either side of horizontal
+SWEEP_WARN_RANGE = (1.0, 1.8)
+SWEEP_ACTIVE_RANGE = (0.9, 1.5)
+
+MARGIN_MAX_PX = 120
+MARGIN_TOLERANCE_PX = 1.0
+BATCH_PER_WORKER = 32
+
+
+def uniform(rng, bounds):
+    return rng.uniform(*bounds)
+
+
+# ---------------------------------------------------------------------------
+# Candidate families: each returns (params, lasers)
+# ---------------------------------------------------------------------------
+
+def sample_corridor(rng):
+    params = {
+        "gap": round(uniform(rng, CORRIDOR_GAP_RANGE)),
+        "end_t": round(uniform(rng, SINE_END_RANGE), 2),
+        "center_y": round(uniform(rng, SINE_CENTER_RANGE)),
+        "amplitude": round(uniform(rng, SINE_AMPLITUDE_RANGE)),
+        "period": round(uniform(rng, SINE_PERIOD_RANGE), 2),
+        "cycle": round(uniform(rng, CYCLE_RANGE), 1),
+    }
+    waypoints = build_sine_waypoints(SINE_START_T, params["end_t"], SINE_SAMPLES,
+                                     params["center_y"], params["amplitude"], params["period"])
+    pattern = build_corridor_pattern("", "", "", PATTERN_DURATION, params["cycle"], params["gap"], waypoints)
+    return params, pattern["lasers"]
+
+
+def sample_wave(rng):
+    params = {
+        "gap": round(uniform(rng, CORRIDOR_GAP_RANGE)),
+        "end_t": round(uniform(rng, SINE_END_RANGE), 2),
+        "center_y": round(uniform(rng, SINE_CENTER_RANGE)) - 40,
+        "wave_amplitude": round(uniform(rng, WAVE_AMPLITUDE_RANGE)),
+        "wave_period": round(uniform(rng, WAVE_PERIOD_RANGE), 2),
+        "trend_amplitude": round(uniform(rng, WAVE_TREND_RANGE)),
+        "cycle": round(uniform(rng, CYCLE_RANGE), 1),
+    }
+    waypoints = build_down_up_sine_waypoints(
+        SINE_START_T, params["end_t"], SINE_SAMPLES, params["center_y"],
+        params["wave_amplitude"], params["wave_period"], params["trend_amplitude"])
+    pattern = build_corridor_pattern("", "", "", PATTERN_DURATION, params["cycle"], params["gap"], waypoints)
+    return params, pattern["lasers"]
+
+
+def sample_gates(rng):
+    cycle = round(uniform(rng, CYCLE_RANGE), 1)
+    count = rng.randint(*GATE_BEAM_COUNT_RANGE)
+    spacing = (GROUND_Y - 2 * GATE_Y_MARGIN) / max(1, count - 1)
+    half = cycle / 2
+    beams = []
+    for i in range(count):
+        # Each beam fires early or late in each half cycle, like M2/X2's two groups.
+        length = round(uniform(rng, GATE_WINDOW_RANGE), 1)
+        offset = rng.choice((0.0, half / 2))
+        start = round(GATE_FIRST_WINDOW_T + offset + rng.uniform(0, half / 2 - length), 1)
+        start = max(GATE_FIRST_WINDOW_T, start)
+        windows = [{"start": start, "end": round(start + length, 1)}]
+        if start + half + length < cycle:
+            windows.append({"start": round(start + half, 1), "end": round(start + half + length, 1)})
+        beams.append({"y": round(GATE_Y_MARGIN + i * spacing), "windows": windows})
+    params = {"cycle": cycle, "beams": beams}
+    pattern = build_timed_gate_pattern("", "", "", PATTERN_DURATION, cycle, beams)
+    return params, pattern["lasers"]
+
+
+def sample_sweep(rng):
+    params = {
+        "pivot_x": rng.choice([0, CANVAS_WIDTH]),
+        "pivot_y": round(rng.uniform(0.25, 0.75) * GROUND_Y),
+        "angle": round(uniform(rng, SWEEP_ANGLE_RANGE), 2),
+        "warn_s": round(uniform(rng, SWEEP_WARN_RANGE), 2),
+        "active_s": round(uniform(rng, SWEEP_ACTIVE_RANGE), 2),
+    }
+    facing = 0.0 if params["pivot_x"] == 0 else math.pi
+    a0, a1 = facing - params["angle"], facing + params["angle"]
+    warn, active = params["warn_s"], params["active_s"]
+    keyframes = arc_sweep(params["pivot_x"], params["pivot_y"], SWEEP_LENGTH,
+                          0.0, warn, a0, a1, SWEEP_STEPS, "warn")
+    keyframes += arc_sweep(params["pivot_x"], params["pivot_y"], SWEEP_LENGTH,
+                           warn, warn + active, a1, a0, SWEEP_STEPS, "active")[1:]
+    return params, [{"loop": True, "keyframes": keyframes}]
+
+
+FAMILIES = {
+    "corridor": sample_corridor,
+    "wave": sample_wave,
+    "gates": sample_gates,
+    "sweep": sample_sweep,
+}
+
+
+# ---------------------------------------------------------------------------
+# Early-stopping solve
+# Same reachability grid and ceil'd reach as the python backend, on int
+# bitsets. Stops as soon as the frontier empties or its span drops below
+# `floor` rows: the candidate is rejected either way.
+# ---------------------------------------------------------------------------
+
+def min_reachable_rows(pattern, cfg, dt, floor=1):
+    """Fewest reachable rows over the pattern, or None if that ever drops below floor."""
+    grid_min_y, grid_max_y = grid_bounds(cfg)
+    units = grid_max_y - grid_min_y + 1
+    mask = row_mask(units)
+    up_rows, down_rows = reach_rows(cfg, dt)
+    cursors = pattern_cursors(pattern)
+
+    reachable = safe_bitset(cursors, 0.0, cfg, grid_min_y, 1.0, units)
+    lowest = bin(reachable).count("1")
+    for t in tick_times(float(pattern["duration"]), dt):
+        safe = safe_bitset(cursors, t, cfg, grid_min_y, 1.0, units)
+        reachable = step_frontier(reachable, safe, up_rows, down_rows, mask)
+        lowest = min(lowest, bin(reachable).count("1"))
+        if lowest < floor:
+            return None
+    return lowest
+
+
+def beam_margin_px(pattern, cfg, dt):
+    """Extra beam thickness the pattern still survives (bisection of early-stopping solves)."""
+    def survives(extra):
+        probe = replace(cfg, laser_beam_thickness=cfg.laser_beam_thickness + extra)
+        return min_reachable_rows(pattern, probe, dt) is not None
+    return bisect_margin(survives, MARGIN_MAX_PX, MARGIN_TOLERANCE_PX)
+
+
+# ---------------------------------------------------------------------------
+# Candidate evaluation (runs in workers)
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class CandidateJob:
+    index: int
+    seed: int
+    family: str
+    cfg: SimConfig
+    dt: float
+    metric: str
+    band: Tuple[float, float]
+
+
+@dataclass(frozen=True)
+class Candidate:
+    index: int
+    family: str
+    params: Dict
+    pattern: Dict
+    # "accepted", "unsolvable", "below band" or "above band"; the early-stopping
+    # min-reachable solve cannot tell unsolvable from below band.
+    verdict: str
+    value: Optional[float]
+
+
+def evaluate_candidate(job):
+    # Per-candidate RNG: results do not depend on worker count or scheduling.
+    rng = random.Random("{}:{}".format(job.seed, job.index))
+    params, lasers = FAMILIES[job.family](rng)
+    pattern = {"id": "", "name": "", "tier": "", "duration": PATTERN_DURATION, "lasers": lasers}
+    lo, hi = job.band
+    if job.metric == "min-reachable":
+        value = min_reachable_rows(pattern, job.cfg, job.dt, floor=lo)
+        verdict = "below band" if value is None else None
+    else:
+        solvable = min_reachable_rows(pattern, job.cfg, job.dt) is not None
+        value = beam_margin_px(pattern, job.cfg, job.dt) if solvable else None
+        verdict = "unsolvable" if value is None else ("below band" if value < lo else None)
+    if verdict is None:
+        verdict = "above band" if value > hi else "accepted"
+    return Candidate(job.index, job.family, params, pattern, verdict, value)
+
+
+def search(families, cfg, dt, metric, band, count, max_candidates, seed, workers):
+    """Evaluate candidates in batches until `count` are accepted or the budget runs out.
+
+    Returns (accepted candidates in index order, verdict tallies).
+    """
+    accepted = []
+    tallies = {}
+    batch = BATCH_PER_WORKER * workers
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for start in range(0, max_candidates, batch):
+            jobs = [CandidateJob(i, seed, families[i % len(families)], cfg, dt, metric, band)
+                    for i in range(start, min(start + batch, max_candidates))]
+            results = pool.map(evaluate_candidate, jobs) if pool else map(evaluate_candidate, jobs)
+            for candidate in results:
+                tallies[candidate.verdict] = tallies.get(candidate.verdict, 0) + 1
+                if candidate.verdict == "accepted" and len(accepted) < count:
+                    accepted.append(candidate)
+            if len(accepted) >= count:
+                break
+    finally:
+        if pool:
+            pool.shutdown()
+    return accepted, tallies
+
+
+def finalize(candidates, tier):
+    """Give accepted candidates ids/names/tier; returns the JSON-ready entries."""
+    entries = []
+    for n, c in enumerate(candidates, start=1):
+        pattern_id = "{}{:02d}".format(TIER_PREFIX[tier], n)
+        pattern = dict(c.pattern, id=pattern_id, name="{}: Generated {}".format(pattern_id, c.family.title()),
+                       tier=tier)
+        entries.append({"pattern": pattern, "family": c.family, "params": c.params,
+                        "candidate": c.index, "value": c.value})
+    return entries
+
+
+def parse_band(text):
+    try:
+        lo, hi = (float(v) for v in text.split(":"))
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected LO:HI, got '{}'".format(text))
+    if lo > hi:
+        raise argparse.ArgumentTypeError("band LO must be <= HI")
+    return lo, hi
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate solvable laser patterns")
+    parser.add_argument("--tier", choices=sorted(TIER_BANDS), default="hard",
+                        help="Tier to label patterns with; picks the default --band")
+    parser.add_argument("--family", action="append", choices=sorted(FAMILIES),
+                        help="Candidate family (repeatable; default: all)")
+    parser.add_argument("--metric", choices=("min-reachable", "margin"), default="min-reachable")
+    parser.add_argument("--band", type=parse_band, help="Accepted metric range LO:HI in px (default: per tier)")
+    parser.add_argument("--count", type=int, default=10, help="Patterns to accept")
+    parser.add_argument("--max-candidates", type=int, default=5000, help="Give up after this many candidates")
+    parser.add_argument("--dt", type=float, default=1.0 / 60.0, help="Simulation step in seconds")
+    parser.add_argument("--seed", type=int, help="Search seed (default: random, printed)")
+    parser.add_argument("--source", choices=("js", "python"), default="js",
+                        help="Config from js/config.js via the Node export, or the Python constants")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--out", help="Output JSON path (default: stdout)")
+    args = parser.parse_args()
+
+    if args.dt <= 0 or args.jobs < 1 or args.count < 1 or args.max_candidates < 1:
+        print("ERROR: --dt, --jobs, --count and --max-candidates must be positive", file=sys.stderr)
+        return 1
+
+    try:
+        cfg, _ = load_patterns(args.source, DEFAULT_CACHE_DIR)
+    except RuntimeError as e:
+        print("ERROR: {}".format(e), file=sys.stderr)
+        return 1
+
+    families = args.family or sorted(FAMILIES)
+    band = args.band or TIER_BANDS[args.tier][args.metric]
+    seed = args.seed if args.seed is not None else random.SystemRandom().randrange(1 << 32)
+
+    started = time.monotonic()
+    accepted, tallies = search(families, cfg, args.dt, args.metric, band, args.count,
+                               args.max_candidates, seed, args.jobs)
+    elapsed = time.monotonic() - started
+    evaluated = sum(tallies.values())
+
+    output = {
+        "seed": seed,
+        "tier": args.tier,
+        "metric": args.metric,
+        "band": list(band),
+        "dt": args.dt,
+        "patterns": finalize(accepted, args.tier),
+    }
+    text = json.dumps(output, indent=2)
+    if args.out:
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    print("Seed {}: {} of {} wanted after {} candidates in {:.1f}s ({:.0f}/min)".format(
+        seed, len(accepted), args.count, evaluated, elapsed, evaluated / max(elapsed, 1e-9) * 60),
+        file=sys.stderr)
+    print("  " + ", ".join("{}: {}".format(k, v) for k, v in sorted(tallies.items())), file=sys.stderr)
+    if args.out:
+        print("Wrote {}".format(args.out), file=sys.stderr)
+    return 0 if len(accepted) >= args.count else 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
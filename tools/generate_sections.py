@@ -9,15 +9,21 @@ spawn points.
 
 Usage:
     python tools/generate_sections.py
+    python tools/generate_sections.py --seed 1234
+    python tools/generate_sections.py --seed 1234 --jobs 4
 
 Tweak the TIER_PARAMS and generation constants below, then re-run.
 """
 
+import argparse
+import bisect
 import json
 import math
 import os
 import random
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
 # ---------------------------------------------------------------------------
 # Game constants (must match js/config.js and js/sectionPath.js)
@@ -187,6 +193,24 @@ def pixel_y_to_normalized(py):
     return (py - PATH_MARGIN_TOP) / USABLE_Y
 
 
+def segment_at(a, b, x):
+    """Interpolate the path segment a->b at x."""
+    span = b["x"] - a["x"]
+    t = (x - a["x"]) / span if span > 0 else 0
+    ny = a["y"] + t * (b["y"] - a["y"])
+    w = a["width"] + t * (b["width"] - a["width"])
+    return normalized_y_to_pixel(ny), w
+
+
+def segment_columns(a, b, xs):
+    """segment_at over a range of x, as (centers, widths) lists."""
+    ax, ay, aw = a["x"], a["y"], a["width"]
+    span, dy, dw = b["x"] - ax, b["y"] - ay, b["width"] - aw
+    ts = [(x - ax) / span for x in xs] if span > 0 else [0] * len(xs)
+    return ([PATH_MARGIN_TOP + (ay + t * dy) * USABLE_Y for t in ts],
+            [aw + t * dw for t in ts])
+
+
 def interpolate_path(path, x):
     """Return (pixel_y, width) at the given x along the path."""
     if not path:
@@ -200,27 +224,281 @@ def interpolate_path(path, x):
     for i in range(len(path) - 1):
         a, b = path[i], path[i + 1]
         if a["x"] <= x <= b["x"]:
-            span = b["x"] - a["x"]
-            t = (x - a["x"]) / span if span > 0 else 0
-            ny = a["y"] + t * (b["y"] - a["y"])
-            w = a["width"] + t * (b["width"] - a["width"])
-            return normalized_y_to_pixel(ny), w
+            return segment_at(a, b, x)
     return normalized_y_to_pixel(path[-1]["y"]), path[-1]["width"]
 
 
-def is_inside_corridor(path, x, pixel_y):
-    center_y, width = interpolate_path(path, x)
-    half = width / 2
-    return center_y - half <= pixel_y <= center_y + half
+class CorridorTable:
+    """A path's center/width precomputed at every integer x in [0, end].
+
+    Placers and validators query thousands of integer x positions per path;
+    at() is a list lookup instead of interpolate_path's waypoint scan and
+    returns bit-identical values (same formula, same segment choice at
+    waypoints). x outside [0, end] clamps like interpolate_path does.
+
+    envelope() answers exact min-top / max-bottom range queries: both edges
+    are linear between waypoints, so their extremes over [x0, x1] lie at x0,
+    x1 or a waypoint inside, and waypoint extremes come from sparse tables.
+    window_tops()/window_bottoms() give the same answers for every x at once.
+
+    keep_out lists inclusive x ranges where no obstacle may start (bird
+    dodge zones).
+    """
+
+    def __init__(self, path, keep_out=()):
+        self.path = path
+        self.end = int(path[-1]["x"])
+        self.keep_out = sorted(keep_out)
+        self.fits = {}
+        head_y, head_w = interpolate_path(path, 0)
+        self.center = [head_y] * (int(path[0]["x"]) + 1)
+        self.width = [head_w] * len(self.center)
+        for a, b in zip(path, path[1:]):
+            # x == b["x"] stays on segment a->b (t=1), as in interpolate_path.
+            center, width = segment_columns(a, b, range(len(self.center), int(b["x"]) + 1))
+            self.center += center
+            self.width += width
+        self.center[-1], self.width[-1] = interpolate_path(path, self.end)
+        self.tops = [c - w / 2 for c, w in zip(self.center, self.width)]
+        self.bottoms = [c + w / 2 for c, w in zip(self.center, self.width)]
+        self.knots = [int(wp["x"]) for wp in path]
+        self.knot_tops = sparse_table([self.top(x) for x in self.knots], min)
+        self.knot_bottoms = sparse_table([self.bottom(x) for x in self.knots], max)
+
+    def at(self, x):
+        """(pixel_y, width) at integer x, same as interpolate_path(path, x)."""
+        i = min(max(x, 0), self.end)
+        return self.center[i], self.width[i]
+
+    def top(self, x):
+        return self.tops[min(max(x, 0), self.end)]
+
+    def bottom(self, x):
+        return self.bottoms[min(max(x, 0), self.end)]
+
+    def envelope(self, x0, x1):
+        """(min corridor top, max corridor bottom) over integer x in [x0, x1]."""
+        x0, x1 = min(max(x0, 0), self.end), min(max(x1, 0), self.end)
+        top = min(self.top(x0), self.top(x1))
+        bottom = max(self.bottom(x0), self.bottom(x1))
+        first = bisect.bisect_right(self.knots, x0)
+        last = bisect.bisect_left(self.knots, x1) - 1
+        if first <= last:
+            top = min(top, sparse_query(self.knot_tops, first, last, min))
+            bottom = max(bottom, sparse_query(self.knot_bottoms, first, last, max))
+        return top, bottom
+
+    def window_tops(self, a, b):
+        """envelope(x + a, x + b)[0] for every x in [0, end]."""
+        tops = [p if p < q else q for p, q in zip(shifted(self.tops, a), shifted(self.tops, b))]
+        for lo, hi, k in self.window_knots(a, b):
+            kt = self.tops[k]
+            tops[lo:hi + 1] = [t if t < kt else kt for t in tops[lo:hi + 1]]
+        return tops
+
+    def window_bottoms(self, a, b):
+        """envelope(x + a, x + b)[1] for every x in [0, end]."""
+        bottoms = [p if p > q else q for p, q in zip(shifted(self.bottoms, a), shifted(self.bottoms, b))]
+        for lo, hi, k in self.window_knots(a, b):
+            kb = self.bottoms[k]
+            bottoms[lo:hi + 1] = [v if v > kb else kb for v in bottoms[lo:hi + 1]]
+        return bottoms
+
+    def window_knots(self, a, b):
+        """(lo, hi, k): waypoint k lies strictly inside [x + a, x + b] for x in [lo, hi]."""
+        for k in self.knots:
+            lo, hi = max(0, k - b + 1), min(self.end, k - a - 1)
+            if lo <= hi:
+                yield lo, hi, k
+
+    def fit_runs(self, key, lo, hi, fits):
+        """Runs of x in [lo, hi] where fits() (flags over [0, end]) holds, cached per key."""
+        if key not in self.fits:
+            hi = min(hi, self.end)
+            self.fits[key] = true_runs(fits(), lo, hi) if fits else [(lo, hi)] if lo <= hi else []
+        return self.fits[key]
+
+
+def shifted(values, s):
+    """values[clamp(x + s)] for every index x of values."""
+    if s >= 0:
+        return (values[s:] + [values[-1]] * s)[:len(values)]
+    return ([values[0]] * -s + values)[:len(values)]
+
+
+def true_runs(flags, lo, hi):
+    """Inclusive (start, end) runs of True in flags[lo..hi]."""
+    if hi < lo:
+        return []
+    bounds = [lo] + [x for x in range(lo + 1, hi + 1) if flags[x] != flags[x - 1]] + [hi + 1]
+    return [(a, b - 1) for a, b in zip(bounds, bounds[1:]) if flags[a]]
+
+
+def subtract_intervals(intervals, cuts):
+    """Inclusive integer intervals minus the (sorted) inclusive cuts."""
+    out = []
+    for lo, hi in intervals:
+        for cut_lo, cut_hi in cuts:
+            if cut_hi < lo or cut_lo > hi:
+                continue
+            if cut_lo > lo:
+                out.append((lo, cut_lo - 1))
+            lo = cut_hi + 1
+            if lo > hi:
+                break
+        if lo <= hi:
+            out.append((lo, hi))
+    return out
+
+
+def sparse_table(values, pick):
+    """levels[k][i] = pick over values[i : i + 2**k]."""
+    levels = [values]
+    while 1 << len(levels) <= len(values):
+        prev, half = levels[-1], 1 << (len(levels) - 1)
+        levels.append([pick(a, b) for a, b in zip(prev, prev[half:])])
+    return levels
+
+
+def sparse_query(levels, lo, hi, pick):
+    """pick over values[lo..hi] (inclusive) in O(1)."""
+    k = (hi - lo + 1).bit_length() - 1
+    row = levels[k]
+    return pick(row[lo], row[hi - (1 << k) + 1])
+
+
+SORTED_BLOCK_SIZE = 64  # items per SortedBlocks block; a block splits at twice this
+
+
+class SortedBlocks:
+    """Sorted tuples in short sorted blocks, with the total weight(item) per block.
+
+    A bisect over block heads finds an item's block and a second bisect its
+    slot, so insert/remove shift one block instead of one long list. nth()
+    finds the item holding the k-th unit of weight by walking block totals.
+    """
+
+    def __init__(self, items=(), weight=None):
+        self.weight = weight or (lambda item: 1)
+        items = sorted(items)
+        self.blocks = [items[i:i + SORTED_BLOCK_SIZE] for i in range(0, len(items), SORTED_BLOCK_SIZE)]
+        self.heads = [block[0] for block in self.blocks]
+        self.totals = [sum(map(self.weight, block)) for block in self.blocks]
+
+    def __iter__(self):
+        for block in self.blocks:
+            yield from block
+
+    def total(self):
+        return sum(self.totals)
+
+    def block_of(self, item):
+        return max(0, bisect.bisect_right(self.heads, item) - 1)
+
+    def insert(self, item):
+        if not self.blocks:
+            self.blocks, self.heads, self.totals = [[item]], [item], [self.weight(item)]
+            return
+        i = self.block_of(item)
+        block = self.blocks[i]
+        bisect.insort(block, item)
+        self.heads[i] = block[0]
+        self.totals[i] += self.weight(item)
+        if len(block) > 2 * SORTED_BLOCK_SIZE:
+            tail = block[SORTED_BLOCK_SIZE:]
+            del block[SORTED_BLOCK_SIZE:]
+            self.blocks.insert(i + 1, tail)
+            self.heads.insert(i + 1, tail[0])
+            self.totals[i] -= sum(map(self.weight, tail))
+            self.totals.insert(i + 1, sum(map(self.weight, tail)))
+
+    def remove(self, item):
+        i = self.block_of(item)
+        block = self.blocks[i]
+        del block[bisect.bisect_left(block, item)]
+        self.totals[i] -= self.weight(item)
+        if block:
+            self.heads[i] = block[0]
+        else:
+            del self.blocks[i], self.heads[i], self.totals[i]
+
+    def floor(self, item):
+        """Largest stored item <= item, or None."""
+        i = bisect.bisect_right(self.heads, item) - 1
+        if i < 0:
+            return None
+        block = self.blocks[i]
+        return block[bisect.bisect_right(block, item) - 1]
+
+    def irange(self, lo, hi):
+        """Stored items with lo <= item < hi, in order."""
+        i = self.block_of(lo)
+        j = bisect.bisect_left(self.blocks[i], lo) if self.blocks else 0
+        while i < len(self.blocks):
+            block = self.blocks[i]
+            while j < len(block):
+                if not block[j] < hi:
+                    return
+                yield block[j]
+                j += 1
+            i, j = i + 1, 0
+
+    def nth(self, k):
+        """(item, offset) with the item covering weight unit k (0 <= k < total())."""
+        for block, total in zip(self.blocks, self.totals):
+            if k >= total:
+                k -= total
+                continue
+            for item in block:
+                w = self.weight(item)
+                if k < w:
+                    return item, k
+                k -= w
+        raise IndexError("weight index out of range")
+
+
+def interval_size(interval):
+    return interval[1] - interval[0] + 1
+
+
+class FreeIntervals:
+    """Disjoint inclusive integer intervals, sorted, that can be cut and sampled."""
+
+    def __init__(self, intervals):
+        self.items = SortedBlocks(intervals, interval_size)
+
+    def cut(self, lo, hi):
+        """Remove [lo, hi], keeping the parts of touched intervals outside it."""
+        first = self.items.floor((lo, math.inf))
+        touched = [first] if first and first[1] >= lo else []
+        touched += list(self.items.irange((lo, math.inf), (hi + 1,)))
+        for iv_lo, iv_hi in touched:
+            self.items.remove((iv_lo, iv_hi))
+            if iv_lo < lo:
+                self.items.insert((iv_lo, lo - 1))
+            if iv_hi > hi:
+                self.items.insert((hi + 1, iv_hi))
+
+    def first(self):
+        """Smallest member, or None if the set is empty."""
+        return next(iter(self.items), (None,))[0]
+
+    def sample(self, rng):
+        """Uniform random member (from rng), or None if the set is empty."""
+        total = self.items.total()
+        if total == 0:
+            return None
+        (lo, _), offset = self.items.nth(rng.randrange(total))
+        return lo + offset
 
 
 # ---------------------------------------------------------------------------
 # Path generation
 # ---------------------------------------------------------------------------
 
-def generate_path(params):
+def generate_path(params, rng):
     """Generate a safe-path curve as a list of waypoints."""
-    section_len = random.randint(params["section_length_min"],
+    section_len = rng.randint(params["section_length_min"],
                                  params["section_length_max"])
     width = params["path_width"]
     max_delta = params["max_y_delta"]
@@ -228,16 +506,16 @@ def generate_path(params):
     x_max_step = params["x_step_max"]
 
     # Start at a random y
-    y = random.uniform(0.15, 0.85)
+    y = rng.uniform(0.15, 0.85)
     waypoints = [{"x": 0, "y": round(y, 3), "width": width}]
 
     x = 0
     while x < section_len:
-        step = random.randint(x_min_step, x_max_step)
+        step = rng.randint(x_min_step, x_max_step)
         x = min(x + step, section_len)
 
         # Random y delta, clamped to [0, 1]
-        delta = random.uniform(-max_delta, max_delta)
+        delta = rng.uniform(-max_delta, max_delta)
         y = max(0.05, min(0.95, y + delta))
 
         waypoints.append({"x": x, "y": round(y, 3), "width": width})
@@ -249,267 +527,327 @@ def generate_path(params):
 # Obstacle placement
 # ---------------------------------------------------------------------------
 
-def place_ground_hazard(path, params, occupied_xs, elevation=None):
-    """Place a ground hazard at an x that doesn't overlap the corridor at ground level.
+# Obstacle footprint along x: type -> (width px from offsetX, clearance px).
+# Two obstacles keep max(their clearances) px between footprints.
+OBSTACLE_FOOTPRINTS = {
+    "ground": (MAX_GROUND_HAZARD_WIDTH, 0),
+    "zapper": (ZAPPER_WIDTH, 50),
+    "zapperBottomOpen": (ZAPPER_WIDTH, 50),
+    "laserStatic": (LASER_STATIC_WIDTH, 0),
+    "laserSweep": (0, 150),
+    "skyBlocker": (LARGE_SKY_BLOCKER_SIZE, 40),
+    "skyBlockerSmall": (SMALL_SKY_BLOCKER_SIZE, 40),
+}
+# Farthest a footprint can reach into a neighbor's clearance
+MAX_FOOTPRINT_REACH = (max(w for w, _ in OBSTACLE_FOOTPRINTS.values())
+                       + max(c for _, c in OBSTACLE_FOOTPRINTS.values()))
 
-    Uses worst-case dimensions because the spawner replaces subType with
-    the current biome's hazard types at runtime.  Avoids slope tiles when
-    elevation data is present.
+
+class OccupancyIndex:
+    """Placed obstacle footprints [offsetX, offsetX + width], sorted by offsetX,
+    plus per obstacle kind the offsetX values still free for it.
+
+    Footprints are kept apart by their clearance rules, so clear_of() only
+    visits the few neighbors within MAX_FOOTPRINT_REACH. A kind's free set is
+    built once (track()) and each add() then cuts just the new footprint's
+    blocked range from every tracked set, so placing n obstacles costs
+    O(n log n) plus block shifts rather than rescanning every footprint.
     """
-    section_end = path[-1]["x"]
-    sub_type = random.choice(params["ground_types"])
-    hw = MAX_GROUND_HAZARD_WIDTH
-    hh = MAX_GROUND_HAZARD_HEIGHT
 
-    for _ in range(40):
-        offset_x = random.randint(20, max(20, int(section_end) - hw))
+    def __init__(self):
+        self.spans = SortedBlocks()  # (lo, hi, clearance)
+        self.free = {}  # kind -> FreeIntervals of offsetX
+
+    def add(self, kind, offset_x):
+        width, clearance = OBSTACLE_FOOTPRINTS[kind]
+        span = (offset_x, offset_x + width, clearance)
+        self.spans.insert(span)
+        for tracked, free in self.free.items():
+            free.cut(*blocked_starts(tracked, span))
+
+    def clear_of(self, kind, offset_x):
+        """True if an obstacle of kind at offset_x keeps clear of every footprint."""
+        width, clearance = OBSTACLE_FOOTPRINTS[kind]
+        lo, hi = offset_x, offset_x + width
+        for s_lo, s_hi, s_clearance in self.spans.irange((lo - MAX_FOOTPRINT_REACH,),
+                                                         (hi + MAX_FOOTPRINT_REACH + 1,)):
+            gap = max(clearance, s_clearance)
+            if hi + gap > s_lo and s_hi + gap > lo:
+                return False
+        return True
+
+    def track(self, kind, intervals):
+        """Start keeping kind's free offsetX set: `intervals` minus every footprint so far."""
+        free = FreeIntervals(intervals)
+        for span in self.spans:
+            free.cut(*blocked_starts(kind, span))
+        self.free[kind] = free
+
+
+def blocked_starts(kind, span):
+    """Inclusive offsetX range where an obstacle of kind would crowd the footprint span."""
+    width, clearance = OBSTACLE_FOOTPRINTS[kind]
+    s_lo, s_hi, s_clearance = span
+    gap = max(clearance, s_clearance)
+    return s_lo - width - gap + 1, s_hi + gap - 1
+
+
+def pick_offset_x(corridor, kind, occupied, rng, elevation=None):
+    """Uniform random x from obstacle_starts(), clear of occupied footprints;
+    None if there is no such x.
+
+    The free set is kept as intervals and sampled directly, so a placer
+    either finds a spot in one draw or knows none exists.
+    """
+    if kind not in occupied.free:
+        occupied.track(kind, obstacle_starts(corridor, kind, elevation))
+    return occupied.free[kind].sample(rng)
 
-        if any(abs(offset_x - ox) < 60 for ox in occupied_xs):
-            continue
 
-        # Skip slope tiles
-        if elevation and is_on_slope(elevation, offset_x):
-            continue
+def tile_columns(values_by_tile, end):
+    """Expand one value per TILE_SIZE column to every x in [0, end]."""
+    return [values_by_tile[x // TILE_SIZE] for x in range(end + 1)]
 
-        local_ground_y = get_ground_y_at_elevation(elevation, offset_x)
-        hazard_top_y = local_ground_y - hh
-
-        # Verify the path corridor doesn't overlap the hazard rect.
-        buffer = 20
-        overlaps = False
-        for sx in range(max(0, offset_x - 10), offset_x + hw + 11, max(1, hw // 8)):
-            center_y, w = interpolate_path(path, sx)
-            corridor_bottom = center_y + w / 2
-            if corridor_bottom + buffer >= hazard_top_y:
-                overlaps = True
-                break
 
-        if not overlaps:
-            occupied_xs.append(offset_x)
-            return {"type": "ground", "subType": sub_type, "offsetX": offset_x}
+GROUND_HAZARD_BUFFER = 20
 
-    return None
 
+def ground_hazard_range(corridor, elevation):
+    """(lo, hi, fits) for a ground hazard's offsetX: the path corridor (10px
+    either side of the hazard) must clear the hazard rect on the local
+    ground, off slope tiles."""
+    section_end = corridor.end
+    hw = MAX_GROUND_HAZARD_WIDTH
 
-def place_zapper(path, params, occupied_xs, elevation=None):
-    """Place a zapper whose gap is aligned with the path at that x."""
-    section_end = path[-1]["x"]
+    def fits():
+        bottoms = corridor.window_bottoms(-10, hw + 10)
+        tiles = range(section_end // TILE_SIZE + 1)
+        hazard_tops = tile_columns([get_ground_y_at_elevation(elevation, t * TILE_SIZE) - MAX_GROUND_HAZARD_HEIGHT
+                                    for t in tiles], section_end)
+        slopes = tile_columns([is_on_slope(elevation, t * TILE_SIZE) for t in tiles], section_end)
+        return [b + GROUND_HAZARD_BUFFER < top and not slope for b, top, slope in zip(bottoms, hazard_tops, slopes)]
 
-    for _ in range(40):
-        offset_x = random.randint(30, max(30, int(section_end) - ZAPPER_WIDTH))
+    return 20, max(20, section_end - hw), fits
 
-        if any(abs(offset_x - ox) < 80 for ox in occupied_xs):
-            continue
 
-        # Get path center at this x
-        center_y, corridor_w = interpolate_path(path, offset_x)
+def place_ground_hazard(corridor, params, occupied, rng, elevation=None):
+    """Place a ground hazard at an x that doesn't overlap the corridor at ground level.
 
-        # Gap size: use corridor width as guide, but clamp to game limits
-        gap_h = max(ZAPPER_GAP_MIN, min(ZAPPER_GAP_MAX, int(corridor_w * 0.85)))
+    Uses worst-case dimensions because the spawner replaces subType with
+    the current biome's hazard types at runtime.  Avoids slope tiles when
+    elevation data is present.
+    """
+    sub_type = rng.choice(params["ground_types"])
+    offset_x = pick_offset_x(corridor, "ground", occupied, rng, elevation)
+    if offset_x is None:
+        return None
+    occupied.add("ground", offset_x)
+    return {"type": "ground", "subType": sub_type, "offsetX": offset_x}
 
-        # Position gap so its center aligns with the path center
-        gap_y = center_y - gap_h / 2
 
-        # Clamp to respect margins
-        gap_y = max(ZAPPER_GAP_MARGIN, min(GROUND_Y - ZAPPER_GAP_MARGIN - gap_h, gap_y))
+def place_zapper(corridor, params, occupied, rng, elevation=None):
+    """Place a zapper whose gap is aligned with the path at that x."""
+    offset_x = pick_offset_x(corridor, "zapper", occupied, rng)
+    if offset_x is None:
+        return None
 
-        # Convert gapY to a gapCenter fraction (0-1) for compatibility with spawner
-        available = GROUND_Y - 2 * ZAPPER_GAP_MARGIN - gap_h
-        if available > 0:
-            gap_center = (gap_y - ZAPPER_GAP_MARGIN) / available
-        else:
-            gap_center = 0.5
+    # Center the gap on the corridor across the zapper's whole width
+    _, corridor_w = corridor.at(offset_x)
+    corridor_top, corridor_bottom = corridor.envelope(offset_x, offset_x + ZAPPER_WIDTH)
+    center_y = (corridor_top + corridor_bottom) / 2
 
-        gap_center = round(max(0, min(1, gap_center)), 3)
+    # Gap size: use corridor width as guide, but clamp to game limits
+    gap_h = max(ZAPPER_GAP_MIN, min(ZAPPER_GAP_MAX, int(corridor_w * 0.85)))
 
-        occupied_xs.append(offset_x)
-        return {
-            "type": "zapper",
-            "offsetX": offset_x,
-            "gapCenter": gap_center,
-            "gapH": gap_h,
-        }
+    # Position gap so its center aligns with the path center
+    gap_y = center_y - gap_h / 2
 
-    return None
+    # Clamp to respect margins
+    gap_y = max(ZAPPER_GAP_MARGIN, min(GROUND_Y - ZAPPER_GAP_MARGIN - gap_h, gap_y))
 
+    # Convert gapY to a gapCenter fraction (0-1) for compatibility with spawner
+    available = GROUND_Y - 2 * ZAPPER_GAP_MARGIN - gap_h
+    if available > 0:
+        gap_center = (gap_y - ZAPPER_GAP_MARGIN) / available
+    else:
+        gap_center = 0.5
 
-def place_static_laser(path, params, occupied_xs, elevation=None):
-    """Place a static laser beam outside the corridor."""
-    section_end = path[-1]["x"]
+    gap_center = round(max(0, min(1, gap_center)), 3)
 
-    for _ in range(40):
-        offset_x = random.randint(0, max(0, int(section_end) - 100))
+    occupied.add("zapper", offset_x)
+    return {
+        "type": "zapper",
+        "offsetX": offset_x,
+        "gapCenter": gap_center,
+        "gapH": gap_h,
+    }
 
-        if any(abs(offset_x - ox) < 120 for ox in occupied_xs):
-            continue
 
-        # Get path center at this x
-        center_y, corridor_w = interpolate_path(path, offset_x)
-        half_corridor = corridor_w / 2
-        half_beam = LASER_BEAM_THICKNESS / 2
-
-        # Decide: above or below the corridor
-        space_above = center_y - half_corridor - PATH_MARGIN_TOP
-        space_below = GROUND_Y - (center_y + half_corridor) - PATH_MARGIN_BOTTOM
-
-        if space_above > half_beam + 10 and (space_above >= space_below or space_below < half_beam + 10):
-            beam_y = random.uniform(
-                PATH_MARGIN_TOP + half_beam,
-                center_y - half_corridor - half_beam - 5
-            )
-        elif space_below > half_beam + 10:
-            beam_y = random.uniform(
-                center_y + half_corridor + half_beam + 5,
-                GROUND_Y - PATH_MARGIN_BOTTOM - half_beam
-            )
-        else:
-            continue
+STATIC_LASER_MIN_SPACE = LASER_BEAM_THICKNESS / 2 + 10
 
-        beam_center = (beam_y - LASER_BEAM_THICKNESS) / (GROUND_Y - 2 * LASER_BEAM_THICKNESS)
-        beam_center = round(max(0, min(1, beam_center)), 3)
 
-        occupied_xs.append(offset_x)
-        return {
-            "type": "laserStatic",
-            "offsetX": offset_x,
-            "beamCenter": beam_center,
-        }
+def static_laser_range(corridor, elevation):
+    """(lo, hi, fits) for a static laser's offsetX: room for the beam above or below the corridor."""
+    def fits():
+        return [top - PATH_MARGIN_TOP > STATIC_LASER_MIN_SPACE
+                or GROUND_Y - bottom - PATH_MARGIN_BOTTOM > STATIC_LASER_MIN_SPACE
+                for top, bottom in zip(corridor.tops, corridor.bottoms)]
 
-    return None
+    return 0, max(0, corridor.end - 100), fits
 
 
-def place_sweep_laser(path, params, occupied_xs, elevation=None):
-    """Place a sweep laser with pivot at ceiling or ground."""
-    section_end = path[-1]["x"]
+def place_static_laser(corridor, params, occupied, rng, elevation=None):
+    """Place a static laser beam outside the corridor."""
+    half_beam = LASER_BEAM_THICKNESS / 2
 
-    for _ in range(40):
-        offset_x = random.randint(50, max(50, int(section_end) - 50))
+    offset_x = pick_offset_x(corridor, "laserStatic", occupied, rng)
+    if offset_x is None:
+        return None
 
-        if any(abs(offset_x - ox) < 150 for ox in occupied_xs):
-            continue
+    # Get path center at this x
+    center_y, corridor_w = corridor.at(offset_x)
+    half_corridor = corridor_w / 2
 
-        # Choose pivot side based on where the path is
-        center_y, _ = interpolate_path(path, offset_x)
-        if center_y < GROUND_Y / 2:
-            pivot_side = "ground"
-        else:
-            pivot_side = "ceiling"
+    # Decide: above or below the corridor
+    space_above = center_y - half_corridor - PATH_MARGIN_TOP
+    space_below = GROUND_Y - (center_y + half_corridor) - PATH_MARGIN_BOTTOM
 
-        occupied_xs.append(offset_x)
-        return {
-            "type": "laserSweep",
-            "offsetX": offset_x,
-            "pivotSide": pivot_side,
-        }
+    if space_above > STATIC_LASER_MIN_SPACE and (space_above >= space_below or space_below < STATIC_LASER_MIN_SPACE):
+        beam_y = rng.uniform(
+            PATH_MARGIN_TOP + half_beam,
+            center_y - half_corridor - half_beam - 5
+        )
+    else:
+        beam_y = rng.uniform(
+            center_y + half_corridor + half_beam + 5,
+            GROUND_Y - PATH_MARGIN_BOTTOM - half_beam
+        )
 
-    return None
+    beam_center = (beam_y - LASER_BEAM_THICKNESS) / (GROUND_Y - 2 * LASER_BEAM_THICKNESS)
+    beam_center = round(max(0, min(1, beam_center)), 3)
 
+    occupied.add("laserStatic", offset_x)
+    return {
+        "type": "laserStatic",
+        "offsetX": offset_x,
+        "beamCenter": beam_center,
+    }
 
-def place_bottom_open_zapper(path, params, occupied_xs, elevation=None):
-    """Place a bottom-open zapper (top bar only, open below).
 
-    The corridor must pass below the bar, so the bar height must be less than
-    the corridor's upper edge at that x.
-    """
-    section_end = path[-1]["x"]
+def place_sweep_laser(corridor, params, occupied, rng, elevation=None):
+    """Place a sweep laser with pivot at ceiling or ground."""
+    offset_x = pick_offset_x(corridor, "laserSweep", occupied, rng)
+    if offset_x is None:
+        return None
+
+    # Choose pivot side based on where the path is
+    center_y, _ = corridor.at(offset_x)
+    if center_y < GROUND_Y / 2:
+        pivot_side = "ground"
+    else:
+        pivot_side = "ceiling"
 
-    for _ in range(40):
-        offset_x = random.randint(30, max(30, int(section_end) - ZAPPER_WIDTH))
+    occupied.add("laserSweep", offset_x)
+    return {
+        "type": "laserSweep",
+        "offsetX": offset_x,
+        "pivotSide": pivot_side,
+    }
 
-        if any(abs(offset_x - ox) < 80 for ox in occupied_xs):
-            continue
 
-        # Get path center at this x -- corridor must pass below the bar
-        center_y, corridor_w = interpolate_path(path, offset_x)
-        corridor_top = center_y - corridor_w / 2
+def bottom_open_zapper_range(corridor, elevation):
+    """(lo, hi, fits) for a bottom-open zapper's offsetX: the shortest bar
+    must end above the corridor (with 10px buffer)."""
+    def fits():
+        return [top - 10 >= ZAPPER_BOTTOM_OPEN_MIN_HEIGHT for top in corridor.window_tops(0, ZAPPER_WIDTH)]
 
-        # Bar must end above the corridor (with 10px buffer)
-        max_bar = corridor_top - 10
-        if max_bar < ZAPPER_BOTTOM_OPEN_MIN_HEIGHT:
-            continue
+    return 30, max(30, corridor.end - ZAPPER_WIDTH), fits
 
-        bar_height = random.randint(
-            ZAPPER_BOTTOM_OPEN_MIN_HEIGHT,
-            min(ZAPPER_BOTTOM_OPEN_MAX_HEIGHT, int(max_bar))
-        )
 
-        occupied_xs.append(offset_x)
-        return {
-            "type": "zapperBottomOpen",
-            "offsetX": offset_x,
-            "barHeight": bar_height,
-        }
+def place_bottom_open_zapper(corridor, params, occupied, rng, elevation=None):
+    """Place a bottom-open zapper (top bar only, open below).
 
-    return None
+    The corridor must pass below the bar, so the bar height must be less than
+    the corridor's upper edge across the zapper's width.
+    """
+    offset_x = pick_offset_x(corridor, "zapperBottomOpen", occupied, rng)
+    if offset_x is None:
+        return None
+
+    corridor_top, _ = corridor.envelope(offset_x, offset_x + ZAPPER_WIDTH)
+    bar_height = rng.randint(
+        ZAPPER_BOTTOM_OPEN_MIN_HEIGHT,
+        min(ZAPPER_BOTTOM_OPEN_MAX_HEIGHT, int(corridor_top - 10))
+    )
+
+    occupied.add("zapperBottomOpen", offset_x)
+    return {
+        "type": "zapperBottomOpen",
+        "offsetX": offset_x,
+        "barHeight": bar_height,
+    }
 
 
-def _place_sky_blocker_impl(path, params, occupied_xs, size, elem_type):
-    """Place a sky blocker at a Y that avoids the corridor."""
-    section_end = path[-1]["x"]
-    buffer = 40
+SKY_BLOCKER_BUFFER = 40
 
-    for _ in range(40):
-        offset_x = random.randint(40, max(40, int(section_end) - size))
 
-        if any(abs(offset_x - ox) < size + 40 for ox in occupied_xs):
-            continue
+def sky_blocker_bands(corridor_top, corridor_bottom, size):
+    """Y ranges for a sky blocker's top edge that keep it clear of the corridor."""
+    candidates = []
 
-        corridor_top = float("inf")
-        corridor_bottom = float("-inf")
-        for sx in range(max(0, offset_x), offset_x + size + 1, 10):
-            center_y, w = interpolate_path(path, sx)
-            corridor_top = min(corridor_top, center_y - w / 2)
-            corridor_bottom = max(corridor_bottom, center_y + w / 2)
+    above_max_y = corridor_top - SKY_BLOCKER_BUFFER - size
+    if above_max_y >= SKY_BLOCKER_Y_MIN:
+        candidates.append((SKY_BLOCKER_Y_MIN, above_max_y))
 
-        candidates = []
+    below_min_y = corridor_bottom + SKY_BLOCKER_BUFFER
+    below_max_y = min(SKY_BLOCKER_Y_MAX, GROUND_Y - size - 10)
+    if below_min_y <= below_max_y:
+        candidates.append((below_min_y, below_max_y))
 
-        above_max_y = corridor_top - buffer - size
-        if above_max_y >= SKY_BLOCKER_Y_MIN:
-            candidates.append((SKY_BLOCKER_Y_MIN, above_max_y))
+    return candidates
 
-        below_min_y = corridor_bottom + buffer
-        below_max_y = min(SKY_BLOCKER_Y_MAX, GROUND_Y - size - 10)
-        if below_min_y <= below_max_y:
-            candidates.append((below_min_y, below_max_y))
 
-        candidates = [(lo, hi) for lo, hi in candidates if hi >= lo]
-        if not candidates:
-            continue
+def sky_blocker_range(corridor, size):
+    """(lo, hi, fits) for a sky blocker's offsetX: some band keeps it clear of the corridor."""
+    def fits():
+        return [bool(sky_blocker_bands(top, bottom, size))
+                for top, bottom in zip(corridor.window_tops(0, size), corridor.window_bottoms(0, size))]
 
-        total = sum(hi - lo for lo, hi in candidates)
-        pick = random.random() * total
-        chosen_y = None
-        for lo, hi in candidates:
-            span = hi - lo
-            if pick <= span:
-                chosen_y = lo + pick
-                break
-            pick -= span
-        if chosen_y is None:
-            chosen_y = candidates[-1][0]
-
-        chosen_y = round(chosen_y, 1)
-        occupied_xs.append(offset_x)
-        occupied_xs.append(offset_x + size // 2)
-        occupied_xs.append(offset_x + size)
-        return {
-            "type": elem_type,
-            "offsetX": offset_x,
-            "y": chosen_y,
-        }
+    return 40, max(40, corridor.end - size), fits
 
-    return None
+
+def _place_sky_blocker_impl(corridor, params, occupied, rng, size, elem_type):
+    """Place a sky blocker at a Y that avoids the corridor."""
+    offset_x = pick_offset_x(corridor, elem_type, occupied, rng)
+    if offset_x is None:
+        return None
+
+    candidates = sky_blocker_bands(*corridor.envelope(offset_x, offset_x + size), size)
+    # pick < total, so it always lands inside some band.
+    pick = rng.random() * sum(hi - lo for lo, hi in candidates)
+    for lo, hi in candidates:
+        if pick <= hi - lo:
+            break
+        pick -= hi - lo
+
+    chosen_y = round(lo + pick, 1)
+    occupied.add(elem_type, offset_x)
+    return {
+        "type": elem_type,
+        "offsetX": offset_x,
+        "y": chosen_y,
+    }
 
 
-def place_sky_blocker(path, params, occupied_xs, elevation=None):
+def place_sky_blocker(corridor, params, occupied, rng, elevation=None):
     """Place a large sky blocker (pufferfish-sized clearance)."""
-    return _place_sky_blocker_impl(path, params, occupied_xs,
+    return _place_sky_blocker_impl(corridor, params, occupied, rng,
                                    LARGE_SKY_BLOCKER_SIZE, "skyBlocker")
 
 
-def place_sky_blocker_small(path, params, occupied_xs, elevation=None):
+def place_sky_blocker_small(corridor, params, occupied, rng, elevation=None):
     """Place a small sky blocker (asteroid-sized clearance)."""
-    return _place_sky_blocker_impl(path, params, occupied_xs,
+    return _place_sky_blocker_impl(corridor, params, occupied, rng,
                                    SMALL_SKY_BLOCKER_SIZE, "skyBlockerSmall")
 
 
@@ -524,19 +862,95 @@ OBSTACLE_PLACERS = {
 }
 
 
-def place_obstacles(path, params, elevation=None):
-    """Place a random number of obstacles outside the path corridor."""
-    count = random.randint(params["obstacle_count_min"],
-                           params["obstacle_count_max"])
+# Obstacle type -> (corridor, elevation) -> (lo, hi, fits): the offsetX range
+# its placer may use, and an optional fits() giving per-x flags over [0, end].
+OBSTACLE_RANGES = {
+    "ground": ground_hazard_range,
+    "zapper": lambda corridor, elevation: (30, max(30, corridor.end - ZAPPER_WIDTH), None),
+    "zapperBottomOpen": bottom_open_zapper_range,
+    "laserStatic": static_laser_range,
+    "laserSweep": lambda corridor, elevation: (50, max(50, corridor.end - 50), None),
+    "skyBlocker": lambda corridor, elevation: sky_blocker_range(corridor, LARGE_SKY_BLOCKER_SIZE),
+    "skyBlockerSmall": lambda corridor, elevation: sky_blocker_range(corridor, SMALL_SKY_BLOCKER_SIZE),
+}
+
+
+def obstacle_starts(corridor, kind, elevation=None):
+    """Inclusive offsetX runs where an obstacle of kind fits the corridor, outside keep_out."""
+    lo, hi, fits = OBSTACLE_RANGES[kind](corridor, elevation)
+    return subtract_intervals(corridor.fit_runs(kind, lo, hi, fits), corridor.keep_out)
+
+
+PLACEMENT_ATTEMPTS = 20
+
+
+def placement_capacity(corridor, kinds, elevation):
+    """How many obstacles of `kinds` fit the section together, by greedy
+    packing (earliest footprint end first). A lower bound on the true maximum."""
+    occupied = OccupancyIndex()
+    for kind in set(kinds):
+        occupied.track(kind, obstacle_starts(corridor, kind, elevation))
+    placed = 0
+    while True:
+        starts = [(free.first(), kind) for kind, free in occupied.free.items()]
+        ends = [(x + OBSTACLE_FOOTPRINTS[kind][0], x, kind) for x, kind in starts if x is not None]
+        if not ends:
+            return placed
+        _, x, kind = min(ends)
+        occupied.add(kind, x)
+        placed += 1
+
+
+def place_obstacle_set(corridor, params, elevation, rng, count, stats):
+    """One random attempt at placing `count` obstacles; may stop short.
+
+    A type whose placer finds no free x is dropped for the rest of the
+    attempt (free space only shrinks) and the slot falls back to the tier's
+    other types.
+    """
     elements = []
-    occupied_xs = []
+    occupied = OccupancyIndex()
+    types = list(params["obstacle_types"])
 
     for _ in range(count):
-        obs_type = random.choice(params["obstacle_types"])
-        placer = OBSTACLE_PLACERS[obs_type]
-        elem = placer(path, params, occupied_xs, elevation)
-        if elem is not None:
-            elements.append(elem)
+        elem = None
+        while elem is None and types:
+            obs_type = rng.choice(types)
+            stats[(obs_type, "attempts")] += 1
+            elem = OBSTACLE_PLACERS[obs_type](corridor, params, occupied, rng, elevation)
+            if elem is None:
+                stats[(obs_type, "rejections")] += 1
+                types = [t for t in types if t != obs_type]
+        if elem is None:
+            break
+        elements.append(elem)
+    return elements
+
+
+def place_obstacles(corridor, params, elevation, rng, stats):
+    """Place a random number of obstacles outside the path corridor.
+
+    The drawn count is clamped to the section's placement_capacity(), so
+    the target is one the section can hold. Random x picks can fragment the
+    free space before the target is met, so up to PLACEMENT_ATTEMPTS sets
+    are drawn and the first full (else the largest) one is kept. stats
+    counts per-type attempts/rejections and the tier's target, placed,
+    shortfall and over-capacity totals.
+    """
+    drawn = rng.randint(params["obstacle_count_min"], params["obstacle_count_max"])
+    count = min(drawn, placement_capacity(corridor, params["obstacle_types"], elevation))
+    elements = []
+    for _ in range(PLACEMENT_ATTEMPTS):
+        candidate = place_obstacle_set(corridor, params, elevation, rng, count, stats)
+        if len(candidate) > len(elements) or not elements:
+            elements = candidate
+        if len(elements) == count:
+            break
+
+    stats["over_capacity"] += drawn - count
+    stats["target"] += count
+    stats["placed"] += len(elements)
+    stats["shortfall"] += count - len(elements)
 
     # Sort by offsetX for readability
     elements.sort(key=lambda e: e["offsetX"])
@@ -547,22 +961,22 @@ def place_obstacles(path, params, elevation=None):
 # Bird placement
 # ---------------------------------------------------------------------------
 
-def place_birds(path, params):
+def place_birds(path, params, rng):
     """Optionally place bird spawn points with dodge width.
 
     Bird arrival time is deterministic (constant x-speed). The dodgeWidth
     widens the corridor at the bird's offsetX so the player has room to
     dodge vertically when the bird arrives.
     """
-    if random.random() >= params["bird_chance"]:
+    if rng.random() >= params["bird_chance"]:
         return []
 
     section_end = path[-1]["x"]
-    bird_count = 1 if random.random() < 0.7 else 2
+    bird_count = 1 if rng.random() < 0.7 else 2
     birds = []
 
     for _ in range(bird_count):
-        offset_x = random.randint(
+        offset_x = rng.randint(
             int(section_end * 0.3),
             max(int(section_end * 0.3), int(section_end * 0.8))
         )
@@ -581,7 +995,7 @@ def place_birds(path, params):
 
 MIN_PLATEAU_TILES = 2  # minimum flat tiles at elevated level before descending
 
-def generate_elevation(params, section_length):
+def generate_elevation(params, section_length, rng):
     """Generate a tile-grid elevation profile for the section.
 
     Returns a list of {"x": int, "level": 0|1} entries at TILE_SIZE intervals.
@@ -614,7 +1028,7 @@ def generate_elevation(params, section_length):
         can_ascend = (current == 0
                       and tiles_remaining >= MIN_PLATEAU_TILES + 1)
 
-        if random.random() < chance:
+        if rng.random() < chance:
             if current == 0 and can_ascend:
                 current = 1
                 tiles_at_current = 0
@@ -686,32 +1100,31 @@ def is_on_slope(elevation, offset_x):
 # Pattern generation
 # ---------------------------------------------------------------------------
 
-def generate_pattern(params):
-    """Generate a single section pattern."""
-    path = generate_path(params)
+def generate_pattern(params, rng, stats):
+    """Generate a single section pattern (placement counters go to stats)."""
+    path = generate_path(params, rng)
     section_length = path[-1]["x"]
-    elevation = generate_elevation(params, section_length)
-    elements = place_obstacles(path, params, elevation)
-    birds = place_birds(path, params)
-
-    # Widen the path around bird spawn points so the player has room to dodge.
-    # Also remove any obstacles that fall within the dodge zone.
-    if birds:
-        for bird in birds:
-            bx = bird["offsetX"]
-            dodge_half = bird["dodgeWidth"] / 2
-
-            # Widen corridor waypoints near the bird encounter
-            for wp in path:
-                dist = abs(wp["x"] - bx)
-                if dist < 120:
-                    wp["width"] = max(wp["width"], bird["dodgeWidth"])
-
-            # Remove obstacles that overlap the bird's clear zone
-            elements = [
-                e for e in elements
-                if abs(e["offsetX"] - bx) > dodge_half + 30
-            ]
+    elevation = generate_elevation(params, section_length, rng)
+    birds = place_birds(path, params, rng)
+
+    # Widen the path around bird spawn points so the player has room to dodge,
+    # and keep obstacles out of the dodge zone. Both happen before placement
+    # so obstacles are placed against the final corridor.
+    keep_out = []
+    for bird in birds:
+        bx = bird["offsetX"]
+        clear = int(bird["dodgeWidth"] / 2 + 30)
+
+        # Widen corridor waypoints near the bird encounter
+        for wp in path:
+            dist = abs(wp["x"] - bx)
+            if dist < 120:
+                wp["width"] = max(wp["width"], bird["dodgeWidth"])
+
+        keep_out.append((bx - clear, bx + clear))
+
+    corridor = CorridorTable(path, keep_out)
+    elements = place_obstacles(corridor, params, elevation, rng, stats)
 
     result = {
         "path": path,
@@ -723,18 +1136,43 @@ def generate_pattern(params):
     return result
 
 
-def generate_all():
-    """Generate patterns for all tiers."""
-    patterns = {}
-    for tier, params in TIER_PARAMS.items():
-        tier_patterns = []
-        for _ in range(params["count"]):
-            tier_patterns.append(generate_pattern(params))
-        patterns[tier] = tier_patterns
+def generate_indexed(job):
+    """Pattern `index` of `tier` from its own sub-seeded RNG, so the result
+    depends only on (seed, tier, index), not on which worker runs it."""
+    seed, tier, index = job
+    rng = random.Random(f"{seed}:{tier}:{index}")
+    stats = Counter()
+    return generate_pattern(TIER_PARAMS[tier], rng, stats), stats
+
+
+def generate_all(seed, jobs=1):
+    """Generate patterns for all tiers (on `jobs` worker processes)."""
+    work = [(seed, tier, i) for tier, params in TIER_PARAMS.items() for i in range(params["count"])]
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(generate_indexed, work, chunksize=max(1, len(work) // (jobs * 4))))
+    else:
+        results = [generate_indexed(job) for job in work]
+
+    patterns = {tier: [] for tier in TIER_PARAMS}
+    tier_stats = {tier: Counter() for tier in TIER_PARAMS}
+    for (_, tier, _), (pattern, stats) in zip(work, results):
+        patterns[tier].append(pattern)
+        tier_stats[tier] += stats
+    for tier, tier_patterns in patterns.items():
         print(f"  {tier}: {len(tier_patterns)} patterns generated")
+        print_placement_stats(tier_stats[tier])
     return patterns
 
 
+def print_placement_stats(stats):
+    print(f"    obstacles: {stats['placed']}/{stats['target']} placed, "
+          f"shortfall {stats['shortfall']} ({stats['over_capacity']} more drawn than sections could hold)")
+    for obs_type in sorted({key[0] for key in stats if isinstance(key, tuple)}):
+        print(f"    {obs_type}: {stats[(obs_type, 'attempts')]} attempts, "
+              f"{stats[(obs_type, 'rejections')]} rejections (no free x)")
+
+
 # ---------------------------------------------------------------------------
 # Validation
 # ---------------------------------------------------------------------------
@@ -745,6 +1183,7 @@ def validate_patterns(patterns):
     for tier, pats in patterns.items():
         for i, pat in enumerate(pats):
             path = pat["path"]
+            corridor = CorridorTable(path)
 
             # Check path waypoints are monotonically increasing in x
             for j in range(1, len(path)):
@@ -758,15 +1197,23 @@ def validate_patterns(patterns):
                     print(f"  WARNING: {tier}[{i}] path y out of range at waypoint {j}: {wp['y']}")
                     issues += 1
 
-            # Check ground hazards don't overlap corridor (worst-case height)
+            occupied = OccupancyIndex()
             for elem in pat["elements"]:
+                # Check obstacles keep their footprint clearance
+                if not occupied.clear_of(elem["type"], elem["offsetX"]):
+                    print(f"  WARNING: {tier}[{i}] {elem['type']} at x={elem['offsetX']} "
+                          f"crowds a neighboring obstacle")
+                    issues += 1
+                occupied.add(elem["type"], elem["offsetX"])
+
+                # Check ground hazards don't overlap corridor (worst-case height)
                 if elem["type"] == "ground":
                     hazard_top = GROUND_Y - MAX_GROUND_HAZARD_HEIGHT
 
-                    center_y, w = interpolate_path(path, elem["offsetX"])
-                    if center_y + w / 2 >= hazard_top:
+                    _, bottom = corridor.envelope(elem["offsetX"], elem["offsetX"] + MAX_GROUND_HAZARD_WIDTH)
+                    if bottom >= hazard_top:
                         print(f"  WARNING: {tier}[{i}] ground hazard at x={elem['offsetX']} "
-                              f"overlaps corridor (bottom={center_y + w/2:.0f}, "
+                              f"overlaps corridor (bottom={bottom:.0f}, "
                               f"hazard_top={hazard_top})")
                         issues += 1
 
@@ -775,23 +1222,16 @@ def validate_patterns(patterns):
                     sz = LARGE_SKY_BLOCKER_SIZE if elem["type"] == "skyBlocker" else SMALL_SKY_BLOCKER_SIZE
                     blocker_y = elem["y"]
                     blocker_bottom = blocker_y + sz
-                    for sx in range(max(0, elem["offsetX"]),
-                                    elem["offsetX"] + sz + 1,
-                                    10):
-                        center_y, w = interpolate_path(path, sx)
-                        ct = center_y - w / 2
-                        cb = center_y + w / 2
-                        if blocker_bottom > ct and blocker_y < cb:
-                            print(f"  WARNING: {tier}[{i}] {elem['type']} at x={elem['offsetX']} "
-                                  f"y={blocker_y:.0f} overlaps corridor")
-                            issues += 1
-                            break
+                    ct, cb = corridor.envelope(elem["offsetX"], elem["offsetX"] + sz)
+                    if blocker_bottom > ct and blocker_y < cb:
+                        print(f"  WARNING: {tier}[{i}] {elem['type']} at x={elem['offsetX']} "
+                              f"y={blocker_y:.0f} overlaps corridor")
+                        issues += 1
 
                 # Check bottom-open zappers don't overlap corridor
                 if elem["type"] == "zapperBottomOpen":
                     bar_h = elem["barHeight"]
-                    center_y, w = interpolate_path(path, elem["offsetX"])
-                    corridor_top = center_y - w / 2
+                    corridor_top, _ = corridor.envelope(elem["offsetX"], elem["offsetX"] + ZAPPER_WIDTH)
                     if bar_h >= corridor_top:
                         print(f"  WARNING: {tier}[{i}] bottomOpen zapper at x={elem['offsetX']} "
                               f"bar extends into corridor (barH={bar_h}, "
@@ -810,14 +1250,24 @@ def validate_patterns(patterns):
 # ---------------------------------------------------------------------------
 
 def main():
+    parser = argparse.ArgumentParser(description="Build-time section pattern generator")
+    parser.add_argument("--seed", type=int,
+                        help="Seed for a reproducible run (default: fresh system entropy, printed)")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Worker processes (output is identical for any value; default: 1)")
+    args = parser.parse_args()
+    if args.jobs < 1:
+        print("ERROR: --jobs must be >= 1", file=sys.stderr)
+        return 1
+
     # Resolve output path relative to this script's location
     script_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(script_dir)
     output_path = os.path.join(project_root, "js", "data", "patterns.json")
 
-    print("Generating section patterns...")
-    random.seed()  # use system entropy for variety
-    patterns = generate_all()
+    seed = args.seed if args.seed is not None else random.SystemRandom().randrange(1 << 32)
+    print(f"Generating section patterns (seed {seed})...")
+    patterns = generate_all(seed, args.jobs)
 
     print("\nValidating...")
     validate_patterns(patterns)
@@ -829,7 +1279,8 @@ def main():
     print(f"\nWrote {output_path}")
     total = sum(len(v) for v in patterns.values())
     print(f"Total: {total} patterns across {len(patterns)} tiers.")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
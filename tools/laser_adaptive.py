@@ -0,0 +1,183 @@
+"""
+Adaptive backend: coarse slots, refined only where the pattern gets tight.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import List, Optional
+
+from laser_patterns import EPS
+from laser_model import (
+    center_bounds,
+    grid_bounds,
+    pack_bits,
+    pattern_cursors,
+    pattern_result,
+    reach_rows,
+    row_mask,
+    safe_bitset,
+    step_frontier,
+    unpack_bits,
+)
+
+# ---------------------------------------------------------------------------
+# Adaptive backend
+# The timeline is split into ADAPTIVE_COARSE_DT slots, each solved at its own
+# level: level l steps dt_l = coarse / 2^l over rows of row_px_l px (halving
+# too, down to ADAPTIVE_MIN_ROW_PX), as int bitsets like the loop backend.
+# Pass 0 runs every slot at level 0; each later pass raises the slots around
+# tight ticks (reachable span under ADAPTIVE_TIGHT_PX, or the frontier dying)
+# to the next level, until nothing new is tight or --dt is reached. If nothing
+# is tight after pass 0, pass 1 still runs every slot one level finer, so a
+# verdict is only called converged once a finer pass has agreed with it.
+# Reachable sets are resampled where neighbouring slots differ in level.
+# Counts are whole px rows, comparable with the grid backends: a run of n
+# units spans (n - 1) * row_px + 1 rows.
+# Wide-open patterns stop after two passes; only squeezes pay for fine resolution.
+# ---------------------------------------------------------------------------
+
+ADAPTIVE_COARSE_DT = 1.0 / 15.0
+ADAPTIVE_COARSE_ROW_PX = 4.0
+ADAPTIVE_MIN_ROW_PX = 0.25
+ADAPTIVE_TIGHT_PX = 96.0
+ADAPTIVE_PAD_SLOTS = 8  # slots refined on each side of a tight one (~0.5 s)
+
+
+@dataclass(frozen=True)
+class AdaptivePass:
+    first_frontier_empty_time: Optional[float]
+    min_reachable_px: float
+    min_safe_px: float
+    final_reachable_px: float
+    final_safe_px: float
+    slot_min_px: List[float]  # min reachable span per slot (inf after the frontier dies)
+
+
+def adaptive_levels(finest_dt):
+    """(dt, row_px) per level, halving from the coarse level until dt <= finest_dt."""
+    levels = [(ADAPTIVE_COARSE_DT, ADAPTIVE_COARSE_ROW_PX)]
+    while levels[-1][0] > finest_dt + EPS:
+        dt, row_px = levels[-1]
+        levels.append((dt / 2, max(ADAPTIVE_MIN_ROW_PX, row_px / 2)))
+    return levels
+
+
+def resample_bits(bits, units_from, units_to, ratio):
+    """Move a bitset between row sizes; ratio = old row_px / new row_px (power of two).
+
+    Finer rows copy the row they fall in; a coarser row is set if any row it covers is.
+    """
+    if ratio == 1:
+        return bits
+    flags = unpack_bits(bits.to_bytes((units_from + 7) // 8, "little"), units_from)
+    if ratio > 1:
+        f = int(ratio)
+        out = bytes(flags[min(units_from - 1, (v + f // 2) // f)] for v in range(units_to))
+    else:
+        f = int(round(1 / ratio))
+        out = bytes(1 in flags[max(0, u * f - f // 2):u * f - f // 2 + f] for u in range(units_to))
+    return int.from_bytes(pack_bits(out), "little")
+
+
+def span_px(bits, row_px):
+    """Reachable span of a unit bitset in whole px rows: a run of n units covers (n - 1) * row_px + 1."""
+    units = bin(bits).count("1")
+    runs = bin(bits & ~(bits << 1)).count("1")
+    return (units - runs) * row_px + runs
+
+
+def adaptive_pass(cursors, cfg, duration, levels, slot_levels):
+    min_y, max_y = center_bounds(cfg)
+    grids = [(row_px, int(math.floor((max_y - min_y) / row_px + EPS)) + 1) for _, row_px in levels]
+
+    level = slot_levels[0]
+    row_px, units = grids[level]
+    reachable = safe = safe_bitset(cursors, 0.0, cfg, min_y, row_px, units)
+    min_reachable = min_safe = span_px(reachable, row_px)
+    slot_min = [math.inf] * len(slot_levels)
+
+    for j, slot_level in enumerate(slot_levels):
+        if slot_level != level:
+            reachable = resample_bits(reachable, units, grids[slot_level][1], row_px / grids[slot_level][0])
+            level = slot_level
+            row_px, units = grids[level]
+        dt = levels[level][0]
+        up_rows, down_rows = reach_rows(cfg, dt, row_px)
+        mask = row_mask(units)
+        for i in range(1, round(ADAPTIVE_COARSE_DT / dt) + 1):
+            t = j * ADAPTIVE_COARSE_DT + i * dt
+            if t > duration + EPS:
+                break
+            safe = safe_bitset(cursors, t, cfg, min_y, row_px, units)
+            reachable = step_frontier(reachable, safe, up_rows, down_rows, mask)
+            span = span_px(reachable, row_px)
+            slot_min[j] = min(slot_min[j], span)
+            min_reachable = min(min_reachable, span)
+            min_safe = min(min_safe, span_px(safe, row_px))
+            if not reachable:
+                return AdaptivePass(t, 0.0, min_safe, 0.0, span_px(safe, row_px), slot_min)
+    return AdaptivePass(None, min_reachable, min_safe, span_px(reachable, row_px),
+                        span_px(safe, row_px), slot_min)
+
+
+def same_verdict(a, b, dt):
+    if a.first_frontier_empty_time is None or b.first_frontier_empty_time is None:
+        return a.first_frontier_empty_time is None and b.first_frontier_empty_time is None
+    return abs(a.first_frontier_empty_time - b.first_frontier_empty_time) <= dt + EPS
+
+
+def refine_slots(slot_levels, slot_min, top):
+    """Raise every slot within ADAPTIVE_PAD_SLOTS of a tight one to level top + 1."""
+    refined = list(slot_levels)
+    for j, span in enumerate(slot_min):
+        if span >= ADAPTIVE_TIGHT_PX:
+            continue
+        for k in range(max(0, j - ADAPTIVE_PAD_SLOTS), min(len(slot_levels), j + ADAPTIVE_PAD_SLOTS + 1)):
+            refined[k] = top + 1
+    return refined
+
+
+def analyze_pattern_adaptive(pattern, cfg, dt, collect_timeline=False):
+    if collect_timeline:
+        raise ValueError("adaptive backend: slots use different row sizes, so there is no per-tick timeline")
+    duration = float(pattern["duration"])
+    cursors = pattern_cursors(pattern)
+    levels = adaptive_levels(dt)
+    slot_levels = [0] * max(1, math.ceil(duration / ADAPTIVE_COARSE_DT - EPS))
+
+    passes = []
+    for top in range(len(levels)):
+        passes.append(adaptive_pass(cursors, cfg, duration, levels, slot_levels))
+        if top == len(levels) - 1:
+            break
+        refined = refine_slots(slot_levels, passes[-1].slot_min_px, top)
+        if refined == slot_levels and top > 0:
+            break
+        # Nothing tight on the first pass: still check the verdict one level finer everywhere.
+        slot_levels = refined if refined != slot_levels else [1] * len(slot_levels)
+
+    top = len(passes) - 1
+    converged = top
+    while converged > 0 and same_verdict(passes[converged - 1], passes[top], levels[converged - 1][0]):
+        converged -= 1
+    # None both when the finest two passes disagree and when --dt allowed a single pass.
+    converged_dt = levels[converged][0] if converged < top else None
+
+    final = passes[-1]
+    grid_min_y, grid_max_y = grid_bounds(cfg)
+    return pattern_result(
+        pattern,
+        first_frontier_empty_time=final.first_frontier_empty_time,
+        min_reachable_count=final.min_reachable_px,
+        min_safe_count=final.min_safe_px,
+        final_reachable_count=final.final_reachable_px,
+        final_safe_count=final.final_safe_px,
+        grid_min_y=grid_min_y,
+        grid_max_y=grid_max_y,
+        converged_dt=converged_dt,
+        adaptive_passes=len(passes),
+        finest_dt=levels[top][0],
+        finest_span_s=min(duration, slot_levels.count(top) * ADAPTIVE_COARSE_DT),
+    )
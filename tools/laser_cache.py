@@ -0,0 +1,68 @@
+"""
+Result cache keyed by everything that determines a pattern's result.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, fields, replace
+
+from laser_export import PROJECT_ROOT, canonical_json, write_atomic
+from laser_model import BitTimeline, PatternResult
+
+# ---------------------------------------------------------------------------
+# Result cache
+# Results are stored under a hash of everything that determines them, so an
+# edited pattern simply misses and untouched ones are read back. Summaries are
+# JSON; timelines (only kept when images were requested) are the raw packed
+# bits of both BitTimelines, safe first.
+# ---------------------------------------------------------------------------
+
+# AIDEV-NOTE: bump whenever analyzer output changes for the same inputs. Field
+# additions to PatternResult / SimConfig change the key on their own (see below).
+RESULT_CACHE_VERSION = 8
+DEFAULT_CACHE_DIR = os.path.join(PROJECT_ROOT, ".cache", "laser_solvability")
+
+
+def result_cache_key(pattern, cfg, dt, backend):
+    payload = {
+        "version": RESULT_CACHE_VERSION,
+        "schema": [f.name for f in fields(PatternResult)],
+        "pattern": pattern,
+        "cfg": asdict(cfg),
+        "dt": dt,
+        "backend": backend,
+    }
+    return hashlib.sha256(canonical_json(payload).encode()).hexdigest()
+
+
+def load_cached_result(cache_dir, key, need_timeline):
+    """Cached PatternResult for `key`, or None on a miss."""
+    summary_path = os.path.join(cache_dir, key + ".json")
+    bits_path = os.path.join(cache_dir, key + ".bits")
+    if not os.path.exists(summary_path) or (need_timeline and not os.path.exists(bits_path)):
+        return None
+    with open(summary_path, "r", encoding="utf-8") as f:
+        result = PatternResult(**json.load(f))
+    if not need_timeline:
+        return result
+    with open(bits_path, "rb") as f:
+        bits = f.read()
+    safe = BitTimeline(result.grid_min_y, result.grid_max_y)
+    reachable = BitTimeline(result.grid_min_y, result.grid_max_y)
+    half = len(bits) // 2
+    safe.data = bytearray(bits[:half])
+    reachable.data = bytearray(bits[half:])
+    return replace(result, safe_timeline=safe, reachable_timeline=reachable)
+
+
+def store_cached_result(cache_dir, key, result):
+    os.makedirs(cache_dir, exist_ok=True)
+    if result.safe_timeline is not None:
+        bits = bytes(result.safe_timeline.data) + bytes(result.reachable_timeline.data)
+        write_atomic(os.path.join(cache_dir, key + ".bits"), bits)
+    summary = asdict(replace(result, safe_timeline=None, reachable_timeline=None))
+    del summary["safe_timeline"], summary["reachable_timeline"]
+    write_atomic(os.path.join(cache_dir, key + ".json"), canonical_json(summary).encode())
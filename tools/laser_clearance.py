@@ -0,0 +1,144 @@
+"""
+Clearance field: room around the player in rows and seconds, plus heatmaps.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional: only the NumPy paths need it
+    np = None
+
+from laser_grid import SAFE_MATRIX_CHUNK_TICKS
+from laser_images import IMAGE_WRITERS, TIMELINE_PALETTE, output_basename
+
+# ---------------------------------------------------------------------------
+# Clearance field
+# For every safe (t, y) cell: rows to the nearest blocked row in that tick
+# (nearest-blocked-on-each-side, one forward and one backward running
+# max/min along y) and time until that row is next blocked (a backward
+# running min along t; rows never blocked again count the time left to the
+# end of the timeline). Both passes are linear and run as NumPy accumulates
+# over SAFE_MATRIX_CHUNK_TICKS-tick chunks, last chunk first so the time pass
+# can carry its next-blocked row across chunk boundaries. Percentiles are
+# taken exactly, from per-value histograms, over reachable cells (where a
+# player can actually be) that a beam bounds: px over ticks with a beam in
+# the column, seconds over rows that are blocked again later. The rest are
+# only counted, as the share of reachable cells that are beam-free / never
+# blocked again. Grid edges are clamps, not hazards.
+# ---------------------------------------------------------------------------
+
+CLEARANCE_PERCENTILES = (10, 50, 90)
+CLEARANCE_BUCKET_PX = 8
+CLEARANCE_BUCKETS = 8
+CLEARANCE_TIGHT_RGB = (255, 40, 0)
+CLEARANCE_MID_RGB = (255, 220, 0)
+CLEARANCE_WIDE_RGB = (40, 255, 80)
+
+
+@dataclass
+class ClearanceField:
+    px_percentiles: Optional[Tuple[float, ...]]  # rows to the nearest blocked row (None: no beam)
+    s_percentiles: Optional[Tuple[float, ...]]  # seconds until the row is blocked (None: never)
+    beam_free_fraction: float  # reachable cells in ticks without any beam
+    never_blocked_fraction: float  # reachable cells whose row is never blocked again
+    index_rows: Optional[List[bytes]] = None  # CLEARANCE_PALETTE heatmap, like timeline_index_rows
+
+
+def clearance_ramp(frac):
+    """Tight (red) -> mid (yellow) -> wide (green) for frac in [0, 1]."""
+    lo, hi, f = ((CLEARANCE_TIGHT_RGB, CLEARANCE_MID_RGB, frac * 2) if frac < 0.5
+                 else (CLEARANCE_MID_RGB, CLEARANCE_WIDE_RGB, frac * 2 - 1))
+    return tuple(round(a + (b - a) * f) for a, b in zip(lo, hi))
+
+
+# Index 0 = blocked; 1..N = reachable by clearance bucket; N+1..2N = the same
+# buckets at half brightness for safe but unreachable cells.
+CLEARANCE_PALETTE = (
+    [TIMELINE_PALETTE[0]]
+    + [clearance_ramp(b / (CLEARANCE_BUCKETS - 1)) for b in range(CLEARANCE_BUCKETS)]
+    + [tuple(c // 2 for c in clearance_ramp(b / (CLEARANCE_BUCKETS - 1))) for b in range(CLEARANCE_BUCKETS)]
+)
+
+
+def timeline_matrix(timeline, start, stop):
+    """Ticks start..stop-1 of a BitTimeline as a (ticks, rows) bool array."""
+    packed = np.frombuffer(bytes(timeline.data[start * timeline.stride:stop * timeline.stride]), dtype=np.uint8)
+    bits = np.unpackbits(packed.reshape(stop - start, timeline.stride), axis=1, bitorder="little")
+    return bits[:, :timeline.height].astype(bool)
+
+
+def vertical_clearance(blocked):
+    """Rows from each cell to the nearest blocked row in its tick (0 on blocked
+    cells, the grid height in ticks without a beam)."""
+    height = blocked.shape[1]
+    rows = np.arange(height, dtype=np.int32)
+    above = np.maximum.accumulate(np.where(blocked, rows, -height), axis=1)
+    below = np.minimum.accumulate(np.where(blocked, rows, 2 * height)[:, ::-1], axis=1)[:, ::-1]
+    return np.minimum(np.minimum(rows - above, below - rows), height)
+
+
+def ticks_until_blocked(blocked, start, carry):
+    """Ticks until each cell's row is next blocked, given `carry` (the next blocked
+    tick per row after this chunk). Returns (ticks, new carry)."""
+    ticks = np.arange(start, start + len(blocked), dtype=np.int32)[:, None]
+    nxt = np.minimum.accumulate(np.where(blocked, ticks, carry)[::-1], axis=0)[::-1]
+    return nxt - ticks, nxt[0]
+
+
+def histogram_percentiles(hist, percentiles, scale):
+    """Nearest-rank percentiles of the values counted in `hist`, times `scale`
+    (None if it counts nothing)."""
+    cumulative = np.cumsum(hist)
+    if cumulative[-1] == 0:
+        return None
+    return tuple(float(np.searchsorted(cumulative, math.ceil(p / 100 * cumulative[-1]))) * scale
+                 for p in percentiles)
+
+
+def clearance_field(result, dt, heatmap=False):
+    """ClearanceField for a result with timelines (index_rows only if `heatmap`)."""
+    n_ticks = len(result.safe_timeline)
+    height = result.safe_timeline.height
+    px_hist = np.zeros(height + 1, dtype=np.int64)
+    tick_hist = np.zeros(n_ticks + 1, dtype=np.int64)
+    heat = np.zeros((n_ticks, height), dtype=np.uint8) if heatmap else None
+    reachable_cells = 0
+    carry = np.full(height, n_ticks, dtype=np.int32)
+    for start in reversed(range(0, n_ticks, SAFE_MATRIX_CHUNK_TICKS)):
+        stop = min(start + SAFE_MATRIX_CHUNK_TICKS, n_ticks)
+        blocked = ~timeline_matrix(result.safe_timeline, start, stop)
+        reachable = timeline_matrix(result.reachable_timeline, start, stop)
+        px = vertical_clearance(blocked)
+        ticks, carry = ticks_until_blocked(blocked, start, carry)
+        reachable_cells += np.count_nonzero(reachable)
+        beam_ticks = reachable & blocked.any(axis=1)[:, None]
+        px_hist += np.bincount(px[beam_ticks], minlength=height + 1)
+        tick_hist += np.bincount(ticks[reachable & (ticks + np.arange(start, stop)[:, None] < n_ticks)],
+                                 minlength=n_ticks + 1)
+        if heatmap:
+            bucket = np.minimum(px // CLEARANCE_BUCKET_PX, CLEARANCE_BUCKETS - 1)
+            heat[start:stop] = np.where(blocked, 0, 1 + bucket + CLEARANCE_BUCKETS * ~reachable)
+    cells = max(1, reachable_cells)
+    return ClearanceField(
+        px_percentiles=histogram_percentiles(px_hist, CLEARANCE_PERCENTILES, 1.0),
+        s_percentiles=histogram_percentiles(tick_hist, CLEARANCE_PERCENTILES, dt),
+        beam_free_fraction=1 - px_hist.sum() / cells,
+        never_blocked_fraction=1 - tick_hist.sum() / cells,
+        index_rows=[row.tobytes() for row in heat.T] if heatmap else None,
+    )
+
+
+def render_clearance_image(result, index_rows, out_dir, image_format="bmp"):
+    if not index_rows or not index_rows[0]:
+        return None
+    os.makedirs(out_dir, exist_ok=True)
+    base = output_basename(result.pattern_id, result.name)
+    out_path = os.path.join(out_dir, "{}_clearance.{}".format(base, image_format))
+    IMAGE_WRITERS[image_format](out_path, CLEARANCE_PALETTE, index_rows)
+    return out_path
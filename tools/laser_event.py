@@ -0,0 +1,287 @@
+"""
+Event backend: exact in continuous time between keyframe breakpoints.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from laser_model import (
+    BitTimeline,
+    LaserCursor,
+    STATE_ACTIVE,
+    blocked_interval_at_column,
+    center_bounds,
+    compile_pattern,
+    grid_bounds,
+    keyframe_sample,
+    local_time,
+    merge_intervals,
+    pattern_result,
+    segment_sample,
+    tick_times,
+)
+from laser_intervals import (
+    intersect_intervals,
+    interval_span,
+    rasterize_intervals,
+    safe_intervals_at,
+)
+
+# ---------------------------------------------------------------------------
+# Event backend
+# Steps from keyframe breakpoint to breakpoint instead of by a fixed dt.
+# Inside a segment each beam that keeps its x endpoints crosses the player
+# column at a linearly moving Y, so a reachable component's edges have
+# closed forms (velocities in px/s, tau = time since segment start):
+#   top(tau)    = max(top0 - up * tau,      hi(tau) of every band above)
+#   bottom(tau) = min(bottom0 + down * tau, lo(tau) of every band below)
+# Beams whose x endpoints move (H4's orbit) are split until linear to within
+# EVENT_LINEAR_TOL_PX. Results do not depend on dt; it only spaces the
+# image columns. Counts are covered span in px, like the interval backend.
+# ---------------------------------------------------------------------------
+
+EVENT_LINEAR_TOL_PX = 0.01
+EVENT_MAX_SPLIT_DEPTH = 16
+EVENT_PROBE_FRACS = (0.25, 0.5, 0.75)
+
+
+def laser_breakpoints(laser, duration):
+    last_t = laser.times[-1]
+    if not laser.loop or last_t <= 0:
+        return [t for t in laser.times if 0 <= t <= duration]
+    out = []
+    for cycle in range(int(duration // last_t) + 1):
+        start = cycle * last_t
+        out += [start + t for t in laser.times if start + t <= duration]
+    return out
+
+
+def pattern_breakpoints(lasers, duration):
+    times = {0.0, duration}
+    for laser in lasers:
+        times.update(laser_breakpoints(laser, duration))
+    return sorted(times)
+
+
+def laser_piece_sampler(laser, t0, t1):
+    """Sampler for the single keyframe segment that governs the laser over (t0, t1)."""
+    mid = (t0 + t1) / 2
+    local = local_time(laser, mid)
+    cycle_start = mid - local
+    if local <= laser.times[0] or local >= laser.times[-1]:
+        fixed = keyframe_sample(laser, 0 if local <= laser.times[0] else -1)
+        return lambda t: fixed
+    i = bisect.bisect_right(laser.times, local) - 1
+    return lambda t: segment_sample(laser, i, t - cycle_start)
+
+
+def linear_band(samples, span, strict):
+    """Fit (lo0, lo_rate, hi0, hi_rate) through endpoint samples; None if not linear."""
+    first, last = samples[0], samples[-1]
+    lo_rate = (last[0] - first[0]) / span if span > 0 else 0.0
+    hi_rate = (last[1] - first[1]) / span if span > 0 else 0.0
+    for frac, (lo, hi) in zip(EVENT_PROBE_FRACS, samples[1:-1]):
+        lo_err = abs(lo - (first[0] + lo_rate * span * frac))
+        hi_err = abs(hi - (first[1] + hi_rate * span * frac))
+        if strict and max(lo_err, hi_err) > EVENT_LINEAR_TOL_PX:
+            return None
+    return (first[0], lo_rate, first[1], hi_rate)
+
+
+def segment_bands(lasers, t0, t1, cfg, strict=True):
+    """Linear blocked bands over (t0, t1), or None if a beam is not linear there."""
+    span = t1 - t0
+    probe_times = [t0] + [t0 + span * f for f in EVENT_PROBE_FRACS] + [t1]
+    bands = []
+    for laser in lasers:
+        sample_at = laser_piece_sampler(laser, t0, t1)
+        if sample_at(t0).state != STATE_ACTIVE:
+            continue
+        samples = [blocked_interval_at_column(sample_at(t), cfg) for t in probe_times]
+        if not any(samples):
+            continue
+        if not all(samples):
+            if strict:
+                return None
+            fallback = next(s for s in samples if s)
+            samples = [s or fallback for s in samples]
+        band = linear_band(samples, span, strict)
+        if band is None:
+            return None
+        bands.append(band)
+    return bands
+
+
+def event_segments(lasers, duration, cfg):
+    """Yield (t0, t1, bands) with every beam linear inside each segment."""
+    times = pattern_breakpoints(lasers, duration)
+    stack = [(t0, t1, 0) for t0, t1 in zip(reversed(times[:-1]), reversed(times[1:]))]
+    while stack:
+        t0, t1, depth = stack.pop()
+        strict = depth < EVENT_MAX_SPLIT_DEPTH
+        bands = segment_bands(lasers, t0, t1, cfg, strict=strict)
+        if bands is not None:
+            yield t0, t1, bands
+            continue
+        mid = (t0 + t1) / 2
+        stack.append((mid, t1, depth + 1))
+        stack.append((t0, mid, depth + 1))
+
+
+def bands_at(bands, tau):
+    return [(lo0 + lo_rate * tau, hi0 + hi_rate * tau) for lo0, lo_rate, hi0, hi_rate in bands]
+
+
+def safe_from_bands(bands, tau, min_y, max_y):
+    safe = []
+    cursor = min_y
+    for lo, hi in merge_intervals(bands_at(bands, tau)):
+        if lo > cursor:
+            safe.append([cursor, min(lo, max_y)])
+        cursor = max(cursor, hi)
+    if cursor < max_y:
+        safe.append([cursor, max_y])
+    return [iv for iv in safe if iv[1] > iv[0]]
+
+
+def band_edge_crossings(bands, span, min_y, max_y):
+    """Times in (0, span) where two band edges (or a band edge and a bound) cross."""
+    edges = [(min_y, 0.0), (max_y, 0.0)]
+    for lo0, lo_rate, hi0, hi_rate in bands:
+        edges += [(lo0, lo_rate), (hi0, hi_rate)]
+    out = []
+    for i, (v1, r1) in enumerate(edges):
+        for v2, r2 in edges[i + 1:]:
+            if r1 != r2:
+                tau = (v2 - v1) / (r1 - r2)
+                if 0 < tau < span:
+                    out.append(tau)
+    return out
+
+
+@dataclass
+class EventComponent:
+    """One reachable interval evolving through a segment.
+
+    top_lines / bottom_lines are (value at tau=0, rate) pairs; the component's
+    top edge is their max and bottom edge their min.
+    """
+    top_lines: List[Tuple[float, float]]
+    bottom_lines: List[Tuple[float, float]]
+    death_tau: float
+
+    def at(self, tau):
+        top = max(v + r * tau for v, r in self.top_lines)
+        bottom = min(v + r * tau for v, r in self.bottom_lines)
+        return [top, bottom]
+
+
+def component_death_tau(top_lines, bottom_lines):
+    """First tau where top >= bottom; top - bottom is convex so pairs suffice."""
+    earliest = math.inf
+    for v1, r1 in top_lines:
+        for v2, r2 in bottom_lines:
+            gap = v2 - v1
+            closing = r1 - r2
+            if gap <= 0:
+                return 0.0
+            if closing > 0:
+                earliest = min(earliest, gap / closing)
+    return earliest
+
+
+def build_component(interval, bands, cfg, min_y, max_y):
+    top0, bottom0 = interval
+    top_lines = [(top0, -cfg.terminal_vel_up), (min_y, 0.0)]
+    bottom_lines = [(bottom0, cfg.terminal_vel_down), (max_y, 0.0)]
+    for lo0, lo_rate, hi0, hi_rate in bands:
+        if lo0 + hi0 < top0 + bottom0:
+            top_lines.append((hi0, hi_rate))
+        else:
+            bottom_lines.append((lo0, lo_rate))
+    return EventComponent(top_lines, bottom_lines, component_death_tau(top_lines, bottom_lines))
+
+
+def reachable_at(components, tau):
+    return merge_intervals([c.at(tau) for c in components if c.death_tau > tau])
+
+
+class EventRun:
+    """Reachable intervals and running minima of one event-backend pass."""
+
+    def __init__(self, cfg, duration, dt, collect_timeline):
+        self.cfg = cfg
+        self.duration = duration
+        self.min_y, self.max_y = center_bounds(cfg)
+        self.grid_min_y, self.grid_max_y = grid_bounds(cfg)
+        self.reachable = [[self.min_y, self.max_y]]
+        self.min_reachable = self.min_safe = math.inf
+        self.first_frontier_empty_time = None
+        self.columns = [0.0] + tick_times(duration, dt) if collect_timeline else []
+        self.safe_timeline = BitTimeline(self.grid_min_y, self.grid_max_y) if collect_timeline else None
+        self.reachable_timeline = BitTimeline(self.grid_min_y, self.grid_max_y) if collect_timeline else None
+
+    def advance(self, t0, t1, bands):
+        span = t1 - t0
+        self.reachable = intersect_intervals(self.reachable, safe_from_bands(bands, 0.0, self.min_y, self.max_y))
+        components = [build_component(iv, bands, self.cfg, self.min_y, self.max_y) for iv in self.reachable]
+        self.track_minima(components, bands, span)
+        all_dead_tau = max((c.death_tau for c in components), default=0.0)
+        if self.first_frontier_empty_time is None and all_dead_tau <= span:
+            self.first_frontier_empty_time = t0 + all_dead_tau
+        self.capture(t0, t1, bands, components)
+        self.reachable = reachable_at(components, span)
+
+    def track_minima(self, components, bands, span):
+        """Spans only reach a minimum at segment ends, deaths and band-edge crossings."""
+        deaths = [c.death_tau for c in components if c.death_tau <= span]
+        for tau in [0.0, span] + deaths:
+            self.min_reachable = min(self.min_reachable, interval_span(reachable_at(components, tau)))
+        for tau in [0.0, span] + band_edge_crossings(bands, span, self.min_y, self.max_y):
+            self.min_safe = min(self.min_safe, interval_span(safe_from_bands(bands, tau, self.min_y, self.max_y)))
+
+    def capture(self, t0, t1, bands, components):
+        span = t1 - t0
+        while self.columns and (self.columns[0] < t1 or t1 >= self.duration):
+            tau = min(span, max(0.0, self.columns.pop(0) - t0))
+            safe = safe_from_bands(bands, tau, self.min_y, self.max_y)
+            self.safe_timeline.append(rasterize_intervals(safe, self.grid_min_y, self.grid_max_y))
+            reachable = reachable_at(components, tau)
+            self.reachable_timeline.append(rasterize_intervals(reachable, self.grid_min_y, self.grid_max_y))
+
+    def clear(self, final_safe):
+        self.reachable = intersect_intervals(self.reachable, final_safe)
+        self.min_reachable = min(self.min_reachable, interval_span(self.reachable))
+        if not self.reachable and self.first_frontier_empty_time is None:
+            self.first_frontier_empty_time = self.duration
+
+    def result(self, pattern, final_safe):
+        return pattern_result(
+            pattern,
+            first_frontier_empty_time=self.first_frontier_empty_time,
+            min_reachable_count=self.min_reachable,
+            min_safe_count=self.min_safe,
+            final_reachable_count=interval_span(self.reachable),
+            final_safe_count=interval_span(final_safe),
+            safe_timeline=self.safe_timeline,
+            reachable_timeline=self.reachable_timeline,
+            grid_min_y=self.grid_min_y,
+            grid_max_y=self.grid_max_y,
+        )
+
+
+def analyze_pattern_event(pattern, cfg, dt, collect_timeline=False):
+    duration = float(pattern["duration"])
+    run = EventRun(cfg, duration, dt, collect_timeline)
+    lasers = compile_pattern(pattern)
+    for t0, t1, bands in event_segments(lasers, duration, cfg):
+        run.advance(t0, t1, bands)
+    # Segments end on the left limit of t = duration; a beam switching on
+    # exactly there still has to be cleared.
+    final_safe = safe_intervals_at([LaserCursor(laser) for laser in lasers], duration, cfg, run.min_y, run.max_y)
+    run.clear(final_safe)
+    return run.result(pattern, final_safe)
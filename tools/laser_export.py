@@ -0,0 +1,142 @@
+"""
+Pattern source: the JS export bridge.
+
+Runs tools/export_laser_patterns.mjs and snapshots its JSON so Node only
+runs after one of the export's source files changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import subprocess
+
+from laser_patterns import SimConfig, build_all_patterns
+
+# ---------------------------------------------------------------------------
+# Pattern source (JS export bridge)
+# The export's JSON is snapshotted next to the result cache together with a
+# fingerprint of every module it imports. A snapshot is reused while all
+# mtimes/sizes match, or, failing that, while all content hashes match, so
+# Node only runs after a real edit.
+# ---------------------------------------------------------------------------
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXPORT_SCRIPT = os.path.join(PROJECT_ROOT, "tools", "export_laser_patterns.mjs")
+PATTERN_SNAPSHOT_NAME = "patterns_snapshot.json"
+RELATIVE_IMPORT_RE = re.compile(r"""\bfrom\s+['"](\.{1,2}/[^'"]+)['"]""")
+
+
+def canonical_json(value):
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def write_atomic(path, data):
+    """Write via a temp file + rename so concurrent workers never see partial files."""
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def export_source_files(entry=EXPORT_SCRIPT):
+    """The export script plus every module it reaches through relative imports."""
+    pending, seen = [os.path.normpath(entry)], set()
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        with open(path, "r", encoding="utf-8") as f:
+            source = f.read()
+        base = os.path.dirname(path)
+        pending.extend(os.path.normpath(os.path.join(base, m)) for m in RELATIVE_IMPORT_RE.findall(source))
+    return sorted(seen)
+
+
+def file_fingerprint(path):
+    st = os.stat(path)
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": digest}
+
+
+def snapshot_is_fresh(sources):
+    """True if every recorded source file is unchanged (stat first, hash on mismatch)."""
+    for path, recorded in sources.items():
+        if not os.path.exists(path):
+            return False
+        st = os.stat(path)
+        if (st.st_mtime_ns, st.st_size) == (recorded["mtime_ns"], recorded["size"]):
+            continue
+        if file_fingerprint(path)["sha256"] != recorded["sha256"]:
+            return False
+    return True
+
+
+def run_export_bridge():
+    try:
+        proc = subprocess.run(["node", EXPORT_SCRIPT], capture_output=True, text=True, cwd=PROJECT_ROOT)
+    except FileNotFoundError:
+        raise RuntimeError("node not found on PATH (needed to export js/data/laserPatterns.js; "
+                           "use --source python to check the ported copies)")
+    if proc.returncode != 0:
+        raise RuntimeError("export_laser_patterns.mjs failed:\n{}".format(proc.stderr.strip()))
+    return json.loads(proc.stdout)
+
+
+def load_exported_payload(cache_dir, refresh=False):
+    """{config, patterns} from the JS export, via the snapshot when it is fresh.
+
+    cache_dir=None runs Node every time without writing a snapshot.
+    """
+    if not cache_dir:
+        return run_export_bridge()
+    snapshot_path = os.path.join(cache_dir, PATTERN_SNAPSHOT_NAME)
+    if not refresh and os.path.exists(snapshot_path):
+        with open(snapshot_path, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        if snapshot_is_fresh(snapshot["sources"]):
+            return snapshot["payload"]
+    sources = {path: file_fingerprint(path) for path in export_source_files()}
+    payload = run_export_bridge()
+    os.makedirs(cache_dir, exist_ok=True)
+    write_atomic(snapshot_path, canonical_json({"sources": sources, "payload": payload}).encode())
+    return payload
+
+
+def sim_config_from_export(config):
+    hitbox_center = config["PLAYER_HITBOX_OFFSET_Y"] + config["PLAYER_HEIGHT"] / 2.0
+    feet_y = config["PLAYER_RENDER_HEIGHT"] - config["PLAYER_SPRITE_BOTTOM_PAD"]
+    return SimConfig(
+        ground_y=config["GROUND_Y"],
+        player_height=config["PLAYER_HEIGHT"],
+        player_width=config["PLAYER_WIDTH"],
+        player_col_x=config["PLAYER_START_X"] + config["PLAYER_WIDTH"] / 2.0,
+        laser_beam_thickness=config["LASER_BEAM_THICKNESS"],
+        terminal_vel_up=config["TERMINAL_VEL_UP"],
+        terminal_vel_down=config["TERMINAL_VEL_DOWN"],
+        gravity=config["GRAVITY"],
+        thrust=config["THRUST"],
+        clamp_min_y=hitbox_center,
+        clamp_max_y=config["GROUND_Y"] - feet_y + hitbox_center,
+    )
+
+
+def load_patterns(source, cache_dir, pattern_id=None, refresh=False):
+    """(cfg, patterns) from the JS export ("js") or the hand-ported copies ("python").
+
+    Raises RuntimeError when the export fails and ValueError when `pattern_id` is not found.
+    """
+    if source == "js":
+        payload = load_exported_payload(cache_dir, refresh=refresh)
+        cfg, patterns = sim_config_from_export(payload["config"]), payload["patterns"]
+    else:
+        cfg, patterns = SimConfig(), build_all_patterns()
+    if pattern_id:
+        patterns = [p for p in patterns if p.get("id") == pattern_id]
+        if not patterns:
+            raise ValueError("Pattern '{}' not found.".format(pattern_id))
+    return cfg, patterns
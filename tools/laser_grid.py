@@ -0,0 +1,256 @@
+"""
+Fixed-dt grid backends: the pure-Python reference and its NumPy port.
+
+Also holds the batched NumPy laser sampling that sweeps, margins, clearance
+and the Monte Carlo run reuse.
+"""
+
+from __future__ import annotations
+
+import math
+
+try:
+    import numpy as np
+except ImportError:  # optional: only the NumPy paths need it
+    np = None
+
+from laser_patterns import EPS
+from laser_model import (
+    BitTimeline,
+    STATE_ACTIVE,
+    compile_pattern,
+    compute_safe_rows,
+    count_true,
+    grid_bounds,
+    pattern_cursors,
+    pattern_result,
+    reach_rows,
+    row_mask,
+    step_frontier,
+    tick_times,
+)
+
+# ---------------------------------------------------------------------------
+# Analyze a single pattern
+# ---------------------------------------------------------------------------
+
+def analyze_pattern(pattern, cfg, dt, collect_timeline=False):
+    grid_min_y, grid_max_y = grid_bounds(cfg)
+    duration = float(pattern["duration"])
+    cursors = pattern_cursors(pattern)
+
+    safe = compute_safe_rows(cursors, 0.0, cfg, grid_min_y, grid_max_y)
+    reachable = safe[:]
+
+    safe_timeline = BitTimeline(grid_min_y, grid_max_y) if collect_timeline else None
+    reachable_timeline = BitTimeline(grid_min_y, grid_max_y) if collect_timeline else None
+    if collect_timeline:
+        safe_timeline.append(safe)
+        reachable_timeline.append(reachable)
+
+    t = 0.0
+    first_frontier_empty_time = None
+    min_reachable_count = count_true(reachable, grid_min_y, grid_max_y)
+    min_safe_count = min_reachable_count
+
+    up_step = cfg.terminal_vel_up * dt
+    down_step = cfg.terminal_vel_down * dt
+
+    while t + dt <= duration + EPS:
+        t += dt
+        safe = compute_safe_rows(cursors, t, cfg, grid_min_y, grid_max_y)
+        candidate = [False] * (grid_max_y + 1)
+
+        for y in range(grid_min_y, grid_max_y + 1):
+            if not reachable[y]:
+                continue
+            lo = max(grid_min_y, min(grid_max_y, int(math.floor(y - up_step))))
+            hi = max(grid_min_y, min(grid_max_y, int(math.ceil(y + down_step))))
+            for yy in range(lo, hi + 1):
+                candidate[yy] = True
+
+        for y in range(grid_min_y, grid_max_y + 1):
+            reachable[y] = candidate[y] and safe[y]
+
+        safe_count = count_true(safe, grid_min_y, grid_max_y)
+        reachable_count = count_true(reachable, grid_min_y, grid_max_y)
+        min_safe_count = min(min_safe_count, safe_count)
+        min_reachable_count = min(min_reachable_count, reachable_count)
+        if reachable_count == 0 and first_frontier_empty_time is None:
+            first_frontier_empty_time = t
+
+        if collect_timeline:
+            safe_timeline.append(safe)
+            reachable_timeline.append(reachable)
+
+    final_safe_count = count_true(
+        compute_safe_rows(cursors, duration, cfg, grid_min_y, grid_max_y),
+        grid_min_y, grid_max_y,
+    )
+    final_reachable_count = count_true(reachable, grid_min_y, grid_max_y)
+
+    return pattern_result(
+        pattern,
+        first_frontier_empty_time=first_frontier_empty_time,
+        min_reachable_count=min_reachable_count,
+        min_safe_count=min_safe_count,
+        final_reachable_count=final_reachable_count,
+        final_safe_count=final_safe_count,
+        safe_timeline=safe_timeline,
+        reachable_timeline=reachable_timeline,
+        grid_min_y=grid_min_y,
+        grid_max_y=grid_max_y,
+    )
+
+
+# ---------------------------------------------------------------------------
+# NumPy backend (optional dependency)
+# Safe rows use the same float operations as the pure-Python path, batched
+# over ticks/rows; the per-tick reach step then runs on int bitsets (as in the
+# loop backend), so every PatternResult field matches analyze_pattern exactly.
+# ---------------------------------------------------------------------------
+
+SAFE_MATRIX_CHUNK_TICKS = 1024  # bounds NumPy working memory on long or fine-dt runs
+
+
+def sample_laser_batch(laser, times):
+    """LaserCursor.sample over a whole array of times: returns (x1, y1, x2, y2, active) arrays."""
+    kt = np.array(laser.times)
+    coords = [np.array(c) for c in (laser.x1, laser.y1, laser.x2, laser.y2)]
+    active = np.array(laser.states) == STATE_ACTIVE
+    if len(kt) == 1:
+        ones = np.ones(len(times))
+        return tuple(c[0] * ones for c in coords) + (active[0] & (ones > 0),)
+
+    last_t = kt[-1]
+    t = np.mod(times, last_t) if laser.loop and last_t > 0 else times
+    i = np.clip(np.searchsorted(kt, t, side="right") - 1, 0, len(kt) - 2)
+    seg = kt[i + 1] - kt[i]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        frac = np.where(seg > 0, (t - kt[i]) / seg, 0.0)
+
+    before = t <= kt[0]
+    after = t >= last_t
+    out = []
+    for c in coords:
+        lerp = c[i] + (c[i + 1] - c[i]) * frac
+        out.append(np.where(before, c[0], np.where(after, c[-1], lerp)))
+    state = np.where(before, active[0], np.where(after, active[-1], active[i]))
+    return tuple(out) + (state,)
+
+
+def blocked_interval_batch(x1, y1, x2, y2, cfg):
+    """Vectorized blocked_interval_at_column: returns (lo, hi, hit) arrays."""
+    dx, dy = x2 - x1, y2 - y1
+    half_danger_y = cfg.laser_beam_thickness / 2 + cfg.player_height / 2
+    half_danger_x = cfg.laser_beam_thickness / 2 + cfg.player_width / 2
+    vertical = np.abs(dx) < EPS
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        frac = (cfg.player_col_x - x1) / dx
+    y_at_col = y1 + dy * frac
+    lo = np.where(vertical, np.minimum(y1, y2) - half_danger_y, y_at_col - half_danger_y)
+    hi = np.where(vertical, np.maximum(y1, y2) + half_danger_y, y_at_col + half_danger_y)
+    hit = np.where(
+        vertical,
+        np.abs(cfg.player_col_x - x1) <= half_danger_x,
+        (frac >= 0) & (frac <= 1),
+    )
+    return lo, hi, hit
+
+
+def compute_safe_matrix(lasers, times, cfg, grid_min_y, grid_max_y):
+    """compute_safe_rows for every time at once: bool array (len(times), grid_max_y + 1).
+
+    Blocked rows are blanked with a per-tick difference array. Blanking each
+    clamped interval separately equals blanking the merged intervals, since
+    overlapping real intervals cover the same integer rows either way.
+    """
+    times = np.asarray(times, dtype=float)
+    n_ticks = len(times)
+    width = grid_max_y + 2
+    tick_base = np.arange(n_ticks) * width
+    starts, ends = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)]
+
+    for laser in lasers:
+        x1, y1, x2, y2, active = sample_laser_batch(laser, times)
+        lo_raw, hi_raw, hit = blocked_interval_batch(x1, y1, x2, y2, cfg)
+        lo = np.clip(np.ceil(lo_raw), grid_min_y, grid_max_y).astype(np.int64)
+        hi = np.clip(np.floor(hi_raw), grid_min_y, grid_max_y).astype(np.int64)
+        use = active & hit & (hi >= lo)
+        starts.append(tick_base[use] + lo[use])
+        ends.append(tick_base[use] + hi[use] + 1)
+
+    diff = np.bincount(np.concatenate(starts), minlength=n_ticks * width)
+    diff -= np.bincount(np.concatenate(ends), minlength=n_ticks * width)
+    blocked = np.cumsum(diff.reshape(n_ticks, width), axis=1)[:, :grid_max_y + 1] > 0
+    safe = ~blocked
+    safe[:, :grid_min_y] = False
+    return safe
+
+
+def dilation_source_bounds(cfg, dt, grid_min_y, grid_max_y):
+    """Per target row, the [first, last + 1) range of source rows that can reach it.
+
+    Each source row y reaches [clamp(floor(y - up)), clamp(ceil(y + down))];
+    both bounds are monotone in y, so the sources of a row are contiguous.
+    """
+    ys = np.arange(grid_max_y + 1, dtype=float)
+    reach_lo = np.clip(np.floor(ys - cfg.terminal_vel_up * dt), grid_min_y, grid_max_y)
+    reach_hi = np.clip(np.ceil(ys + cfg.terminal_vel_down * dt), grid_min_y, grid_max_y)
+    targets = np.arange(grid_max_y + 1)
+    first = np.searchsorted(reach_hi, targets, side="left")
+    stop = np.searchsorted(reach_lo, targets, side="right")
+    return first, stop
+
+
+def packed_rows(block, grid_min_y):
+    """Rows grid_min_y.. of a safe matrix block as one little-endian bytes column per tick."""
+    packed = np.packbits(block[:, grid_min_y:], axis=1, bitorder="little")
+    return packed.tobytes(), packed.shape[1]
+
+
+def analyze_pattern_numpy(pattern, cfg, dt, collect_timeline=False):
+    grid_min_y, grid_max_y = grid_bounds(cfg)
+    duration = float(pattern["duration"])
+
+    lasers = compile_pattern(pattern)
+    times = [0.0] + tick_times(duration, dt)
+    safe_counts = np.empty(len(times), dtype=np.int64)
+    reachable_counts = np.empty(len(times), dtype=np.int64)
+
+    up_rows, down_rows = reach_rows(cfg, dt)
+    mask = row_mask(grid_max_y - grid_min_y + 1)
+    reachable = None
+    safe_timeline = BitTimeline(grid_min_y, grid_max_y) if collect_timeline else None
+    reachable_timeline = BitTimeline(grid_min_y, grid_max_y) if collect_timeline else None
+
+    for start in range(0, len(times), SAFE_MATRIX_CHUNK_TICKS):
+        block = compute_safe_matrix(lasers, times[start:start + SAFE_MATRIX_CHUNK_TICKS], cfg, grid_min_y, grid_max_y)
+        safe_counts[start:start + len(block)] = np.count_nonzero(block, axis=1)
+        data, stride = packed_rows(block, grid_min_y)
+        if collect_timeline:
+            safe_timeline.data += data
+        for k, offset in enumerate(range(0, len(data), stride), start):
+            safe = int.from_bytes(data[offset:offset + stride], "little")
+            reachable = safe if reachable is None else step_frontier(reachable, safe, up_rows, down_rows, mask)
+            reachable_counts[k] = bin(reachable).count("1")
+            if collect_timeline:
+                reachable_timeline.append_packed(reachable)
+
+    empty_ticks = np.flatnonzero(reachable_counts[1:] == 0)
+    first_frontier_empty_time = times[empty_ticks[0] + 1] if len(empty_ticks) else None
+    final_safe = compute_safe_matrix(lasers, [duration], cfg, grid_min_y, grid_max_y)
+
+    return pattern_result(
+        pattern,
+        first_frontier_empty_time=first_frontier_empty_time,
+        min_reachable_count=int(reachable_counts.min()),
+        min_safe_count=int(safe_counts.min()),
+        final_reachable_count=int(reachable_counts[-1]),
+        final_safe_count=int(np.count_nonzero(final_safe)),
+        safe_timeline=safe_timeline,
+        reachable_timeline=reachable_timeline,
+        grid_min_y=grid_min_y,
+        grid_max_y=grid_max_y,
+    )
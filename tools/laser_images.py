@@ -0,0 +1,133 @@
+"""
+Timeline images as BMP or palette PNG, without external dependencies.
+"""
+
+from __future__ import annotations
+
+import operator
+import os
+import struct
+import zlib
+
+# ---------------------------------------------------------------------------
+# Image output (BMP / palette PNG — no external dependencies)
+# ---------------------------------------------------------------------------
+
+def sanitize_filename(name):
+    out = []
+    for ch in name:
+        if ch.isalnum() or ch in ("-", "_"):
+            out.append(ch)
+        elif ch.isspace():
+            out.append("_")
+    return "".join(out).strip("_") or "pattern"
+
+
+TIMELINE_PALETTE = [
+    (50, 0, 0),       # blocked
+    (220, 180, 0),    # safe but unreachable
+    (50, 255, 80),    # safe and reachable
+    (255, 255, 255),  # witness trajectory
+]
+WITNESS_PALETTE_INDEX = 3
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_COMPRESSION_LEVEL = 9
+
+
+def channel_table(palette, channel):
+    """bytes.translate table mapping a palette index to one colour channel."""
+    return bytes(palette[i][channel] if i < len(palette) else 0 for i in range(256))
+
+
+def write_bmp(path, palette, index_rows):
+    """Write a 24-bit BMP from palette-index rows (top-to-bottom) in a single write."""
+    width, height = len(index_rows[0]), len(index_rows)
+    row_padding = (4 - (width * 3) % 4) % 4
+    pixel_data_size = (width * 3 + row_padding) * height
+
+    out = bytearray(b"BM")
+    out += struct.pack("<IHHI", 54 + pixel_data_size, 0, 0, 54)
+    out += struct.pack(
+        "<IiiHHIIiiII",
+        40, width, -height,    # BITMAPINFOHEADER; negative height = top-down rows
+        1, 24, 0, pixel_data_size,
+        2835, 2835, 0, 0,      # ~72 DPI, no colour table
+    )
+
+    # BMP stores BGR: expand each index row one channel at a time.
+    blue, green, red = (channel_table(palette, c) for c in (2, 1, 0))
+    row = bytearray(width * 3)
+    pad = bytes(row_padding)
+    for indices in index_rows:
+        row[0::3] = indices.translate(blue)
+        row[1::3] = indices.translate(green)
+        row[2::3] = indices.translate(red)
+        out += row
+        out += pad
+
+    with open(path, "wb") as f:
+        f.write(out)
+
+
+def png_chunk(tag, data):
+    crc = zlib.crc32(tag + data) & 0xFFFFFFFF
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", crc)
+
+
+def write_png(path, palette, index_rows):
+    """Write an 8-bit palette PNG from palette-index rows (top-to-bottom)."""
+    width, height = len(index_rows[0]), len(index_rows)
+    header = struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0)  # 8-bit indexed colour
+    scanlines = b"".join(b"\x00" + indices for indices in index_rows)  # filter type 0 per row
+    data = b"".join([
+        PNG_SIGNATURE,
+        png_chunk(b"IHDR", header),
+        png_chunk(b"PLTE", b"".join(bytes(rgb) for rgb in palette)),
+        png_chunk(b"IDAT", zlib.compress(scanlines, PNG_COMPRESSION_LEVEL)),
+        png_chunk(b"IEND", b""),
+    ])
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+IMAGE_WRITERS = {
+    "bmp": write_bmp,
+    "png": write_png,
+}
+
+
+def output_basename(pattern_id, name):
+    return sanitize_filename("{}_{}".format(pattern_id, name))
+
+
+def timeline_index_rows(result, witness_ys=None):
+    """TIMELINE_PALETTE index rows (top-to-bottom, one byte per tick column).
+
+    witness_ys (one Y per tick) is drawn over the timeline when given.
+    """
+    height = result.grid_max_y - result.grid_min_y + 1
+    width = len(result.safe_timeline)
+    # Column-major: safe + reachable per pixel gives the palette index directly.
+    safe = b"".join(result.safe_timeline.column_flags(x) for x in range(width))
+    reachable = b"".join(result.reachable_timeline.column_flags(x) for x in range(width))
+    indices = bytearray(map(operator.add, safe, reachable))
+    for x, y in enumerate((witness_ys or [])[:width]):
+        indices[x * height + y - result.grid_min_y] = WITNESS_PALETTE_INDEX
+    return [bytes(indices[iy::height]) for iy in range(height)]
+
+
+def render_pattern_timeline_image(result, out_dir, image_format="bmp", witness_ys=None):
+    if not result.safe_timeline or not result.reachable_timeline:
+        return None
+
+    width = len(result.safe_timeline)
+    height = result.grid_max_y - result.grid_min_y + 1
+    if width <= 0 or height <= 0:
+        return None
+
+    os.makedirs(out_dir, exist_ok=True)
+    base = output_basename(result.pattern_id, result.name)
+    out_path = os.path.join(out_dir, "{}.{}".format(base, image_format))
+    IMAGE_WRITERS[image_format](out_path, TIMELINE_PALETTE, timeline_index_rows(result, witness_ys))
+    return out_path
@@ -0,0 +1,116 @@
+"""
+Interval backend: reachable and safe space as sorted float intervals.
+"""
+
+from __future__ import annotations
+
+import math
+
+from laser_model import (
+    BitTimeline,
+    blocked_intervals_at,
+    center_bounds,
+    grid_bounds,
+    merge_intervals,
+    pattern_cursors,
+    pattern_result,
+    tick_times,
+)
+
+# ---------------------------------------------------------------------------
+# Interval backend
+# Reachable and safe space are sorted lists of float [lo, hi] center-Y
+# intervals, so per-tick cost scales with the number of lasers rather than
+# the pixel height, and beam edges are exact instead of snapped to rows.
+# Counts in the result are covered span in px rather than row counts.
+# ---------------------------------------------------------------------------
+
+def safe_intervals_at(cursors, t, cfg, min_y, max_y):
+    """Complement of the merged blocked intervals within [min_y, max_y]."""
+    safe = []
+    cursor = min_y
+    for lo, hi in merge_intervals(blocked_intervals_at(cursors, t, cfg)):
+        if lo > cursor:
+            safe.append([cursor, min(lo, max_y)])
+        cursor = max(cursor, hi)
+        if cursor >= max_y:
+            break
+    if cursor < max_y:
+        safe.append([cursor, max_y])
+    return [iv for iv in safe if iv[1] > iv[0]]
+
+
+def expand_intervals(intervals, up_step, down_step, min_y, max_y):
+    grown = [(max(min_y, lo - up_step), min(max_y, hi + down_step)) for lo, hi in intervals]
+    return merge_intervals(grown)
+
+
+def intersect_intervals(a, b):
+    """Intersection of two sorted, disjoint interval lists."""
+    out = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        lo = max(a[i][0], b[j][0])
+        hi = min(a[i][1], b[j][1])
+        if hi > lo:
+            out.append([lo, hi])
+        if a[i][1] < b[j][1]:
+            i += 1
+        else:
+            j += 1
+    return out
+
+
+def interval_span(intervals):
+    return sum(hi - lo for lo, hi in intervals)
+
+
+def rasterize_intervals(intervals, grid_min_y, grid_max_y):
+    """Bool rows (like compute_safe_rows) covered by the intervals, for rendering."""
+    rows = [False] * (grid_max_y + 1)
+    for lo, hi in intervals:
+        for y in range(max(grid_min_y, int(math.ceil(lo))), min(grid_max_y, int(math.floor(hi))) + 1):
+            rows[y] = True
+    return rows
+
+
+def analyze_pattern_intervals(pattern, cfg, dt, collect_timeline=False):
+    min_y, max_y = center_bounds(cfg)
+    grid_min_y, grid_max_y = grid_bounds(cfg)
+    duration = float(pattern["duration"])
+    up_step = cfg.terminal_vel_up * dt
+    down_step = cfg.terminal_vel_down * dt
+    cursors = pattern_cursors(pattern)
+
+    reachable = safe_intervals_at(cursors, 0.0, cfg, min_y, max_y)
+    min_reachable = min_safe = interval_span(reachable)
+    first_frontier_empty_time = None
+    safe_timeline = BitTimeline(grid_min_y, grid_max_y) if collect_timeline else None
+    reachable_timeline = BitTimeline(grid_min_y, grid_max_y) if collect_timeline else None
+    if collect_timeline:
+        safe_timeline.append(rasterize_intervals(reachable, grid_min_y, grid_max_y))
+        reachable_timeline.append(rasterize_intervals(reachable, grid_min_y, grid_max_y))
+
+    for t in tick_times(duration, dt):
+        safe = safe_intervals_at(cursors, t, cfg, min_y, max_y)
+        reachable = intersect_intervals(expand_intervals(reachable, up_step, down_step, min_y, max_y), safe)
+        min_safe = min(min_safe, interval_span(safe))
+        min_reachable = min(min_reachable, interval_span(reachable))
+        if not reachable and first_frontier_empty_time is None:
+            first_frontier_empty_time = t
+        if collect_timeline:
+            safe_timeline.append(rasterize_intervals(safe, grid_min_y, grid_max_y))
+            reachable_timeline.append(rasterize_intervals(reachable, grid_min_y, grid_max_y))
+
+    return pattern_result(
+        pattern,
+        first_frontier_empty_time=first_frontier_empty_time,
+        min_reachable_count=min_reachable,
+        min_safe_count=min_safe,
+        final_reachable_count=interval_span(reachable),
+        final_safe_count=interval_span(safe_intervals_at(cursors, duration, cfg, min_y, max_y)),
+        safe_timeline=safe_timeline,
+        reachable_timeline=reachable_timeline,
+        grid_min_y=grid_min_y,
+        grid_max_y=grid_max_y,
+    )
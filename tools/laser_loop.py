@@ -0,0 +1,185 @@
+"""
+Loop backend: solves one common loop period and detects a steady state.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, replace
+from fractions import Fraction
+from typing import List, Optional
+
+from laser_patterns import EPS
+from laser_model import (
+    BitTimeline,
+    LaserCursor,
+    compile_pattern,
+    grid_bounds,
+    pattern_result,
+    reach_rows,
+    row_mask,
+    safe_bits_at,
+    step_frontier,
+)
+from laser_grid import analyze_pattern
+
+# ---------------------------------------------------------------------------
+# Loop backend
+# Every looping laser repeats with its last keyframe t, so once non-looping
+# lasers have finished the whole pattern repeats with the LCM of those cycles.
+# Ticks are spaced period / ceil(period / dt) so each cycle reuses the same
+# per-phase safe sets. One cycle is a monotone map on reachable sets: if the
+# set at a cycle boundary contains the set at an earlier boundary, every later
+# tick contains its counterpart from the earlier cycles, so the frontier never
+# empties. Rows are int bitsets (bit k = row grid_min_y + k) with the same
+# floor/ceil reach as the python backend. The verdict, minima and final counts
+# cover the pattern's duration like every other backend; the run only goes
+# past it to decide survives_indefinitely. Patterns without a common period
+# get the python backend's result, flagged loop_fallback.
+# ---------------------------------------------------------------------------
+
+LOOP_PERIOD_MAX_S = 600.0
+LOOP_PERIOD_MAX_DENOMINATOR = 1000
+LOOP_MAX_CYCLES = 256
+
+
+def common_loop_period(lasers):
+    """LCM of the looping lasers' cycles in seconds, or None if there is no short one."""
+    cycles = []
+    for laser in lasers:
+        if not laser.loop or laser.times[-1] <= 0:
+            continue
+        cycle = Fraction(laser.times[-1]).limit_denominator(LOOP_PERIOD_MAX_DENOMINATOR)
+        if abs(float(cycle) - laser.times[-1]) > EPS:
+            return None
+        cycles.append(cycle)
+    if not cycles:
+        return 1.0  # static once the non-looping lasers finish: any period works
+    denominator = 1
+    for cycle in cycles:
+        denominator = denominator * cycle.denominator // math.gcd(denominator, cycle.denominator)
+    numerator = 1
+    for cycle in cycles:
+        n = cycle.numerator * (denominator // cycle.denominator)
+        numerator = numerator * n // math.gcd(numerator, n)
+    period = numerator / denominator
+    return period if period <= LOOP_PERIOD_MAX_S else None
+
+
+def settle_time(lasers, period):
+    """First multiple of `period` after every non-looping laser has reached its last keyframe."""
+    last = max((laser.times[-1] for laser in lasers if not laser.loop), default=0.0)
+    return math.ceil(last / period - EPS) * period
+
+
+@dataclass(frozen=True)
+class LoopSchedule:
+    """Safe bitsets per tick: the lead-in up to the settle time, then one cycle of phases."""
+    step: float
+    lead_in: List[int]
+    phases: List[int]
+
+    def safe_at(self, k):
+        return self.lead_in[k] if k < len(self.lead_in) else self.phases[(k - len(self.lead_in)) % len(self.phases)]
+
+    def cycle_start(self, k):
+        return k >= len(self.lead_in) and (k - len(self.lead_in)) % len(self.phases) == 0
+
+    def cycles(self, k):
+        return (k - len(self.lead_in)) // len(self.phases)
+
+
+@dataclass
+class LoopStats:
+    """Counts over the ticks inside the pattern's duration, the verdict's window."""
+    min_safe: float = math.inf
+    min_reachable: float = math.inf
+    final_safe: int = 0
+    final_reachable: int = 0
+    empty_time: Optional[float] = None
+
+    def add(self, t, safe, reachable):
+        self.final_safe, self.final_reachable = bin(safe).count("1"), bin(reachable).count("1")
+        self.min_safe = min(self.min_safe, self.final_safe)
+        self.min_reachable = min(self.min_reachable, self.final_reachable)
+        if self.final_reachable == 0 and self.empty_time is None and t > 0:
+            self.empty_time = t
+
+
+def loop_schedule(lasers, cfg, period, dt, grid_min_y, grid_max_y):
+    steps = max(1, math.ceil(period / dt - EPS))
+    step = period / steps
+    start = settle_time(lasers, period)
+    cursors = [LaserCursor(laser) for laser in lasers]
+    lead_in = [safe_bits_at(cursors, k * step, cfg, grid_min_y, grid_max_y)
+               for k in range(round(start / period) * steps)]
+    phases = [safe_bits_at(cursors, start + k * step, cfg, grid_min_y, grid_max_y) for k in range(steps)]
+    return LoopSchedule(step, lead_in, phases)
+
+
+def loop_verdict(schedule, k, reachable, boundaries):
+    """(done, survives) after tick k; records each cycle boundary's frontier."""
+    if reachable == 0 and k > 0:
+        return True, False
+    if schedule.cycle_start(k):
+        if any(earlier & ~reachable == 0 for earlier in boundaries):
+            return True, True
+        if len(boundaries) == LOOP_MAX_CYCLES:
+            return True, None
+        boundaries.append(reachable)
+    return False, None
+
+
+def run_loop(schedule, cfg, mask, duration, timelines):
+    """Step through the pattern's duration, and on until the frontier empties or a
+    cycle boundary repeats. Returns (stats, (cycles, survives_indefinitely))."""
+    up_rows, down_rows = reach_rows(cfg, schedule.step)
+    last_tick = math.floor(duration / schedule.step + EPS)
+    stats, boundaries, verdict = LoopStats(), [], None
+    k = 0
+    safe = reachable = schedule.safe_at(0)
+    while True:
+        if timelines is not None:
+            timelines[0].append_packed(safe)
+            timelines[1].append_packed(reachable)
+        if k <= last_tick:
+            stats.add(k * schedule.step, safe, reachable)
+        if verdict is None:
+            done, survives = loop_verdict(schedule, k, reachable, boundaries)
+            verdict = (schedule.cycles(k), survives) if done else None
+        if verdict is not None and k >= last_tick:
+            return stats, verdict
+        k += 1
+        safe = schedule.safe_at(k)
+        reachable = step_frontier(reachable, safe, up_rows, down_rows, mask)
+
+
+def analyze_pattern_loop(pattern, cfg, dt, collect_timeline=False):
+    lasers = compile_pattern(pattern)
+    period = common_loop_period(lasers)
+    if period is None:
+        return replace(analyze_pattern(pattern, cfg, dt, collect_timeline), loop_fallback=True)
+
+    grid_min_y, grid_max_y = grid_bounds(cfg)
+    schedule = loop_schedule(lasers, cfg, period, dt, grid_min_y, grid_max_y)
+    timelines = None
+    if collect_timeline:
+        timelines = (BitTimeline(grid_min_y, grid_max_y), BitTimeline(grid_min_y, grid_max_y))
+    mask = row_mask(grid_max_y - grid_min_y + 1)
+    stats, (cycles, survives) = run_loop(schedule, cfg, mask, float(pattern["duration"]), timelines)
+
+    return pattern_result(
+        pattern,
+        first_frontier_empty_time=stats.empty_time,
+        min_reachable_count=stats.min_reachable,
+        min_safe_count=stats.min_safe,
+        final_reachable_count=stats.final_reachable,
+        final_safe_count=stats.final_safe,
+        safe_timeline=timelines[0] if timelines else None,
+        reachable_timeline=timelines[1] if timelines else None,
+        grid_min_y=grid_min_y,
+        grid_max_y=grid_max_y,
+        loop_period=period,
+        loop_cycles=cycles,
+        survives_indefinitely=survives,
+    )
@@ -0,0 +1,179 @@
+"""
+Solvability margins: how far each tolerance can be pushed per pattern.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, replace
+from typing import Dict, Optional
+
+try:
+    import numpy as np
+except ImportError:  # optional: only the NumPy paths need it
+    np = None
+
+from laser_patterns import SimConfig
+from laser_model import center_bounds, compile_pattern, grid_bounds, pattern_cursors, tick_times
+from laser_grid import dilation_source_bounds, sample_laser_batch
+from laser_intervals import expand_intervals, intersect_intervals, safe_intervals_at
+from laser_sweep import batched_safe_block, stack_configs
+
+# ---------------------------------------------------------------------------
+# Solvability margins
+# How far each tolerance can be pushed before a pattern becomes impossible,
+# found by bisection on the numpy grid model. Laser samples are taken once
+# per pattern and shared by every probe; each probe only rebuilds the safe
+# matrix when the probed parameter changes it, and stops at the first tick
+# whose frontier is empty. The grid rounds every tick's reach up to a whole
+# row, so slowing the player down never fails there; velocity is probed on
+# the interval model's exact reach instead, over safe intervals computed once.
+# Timing slack d makes every beam block its rows from d before to d after it
+# really does, i.e. inputs may land up to d late (or early) and the pattern is
+# still survivable. A margin is math.inf ("unbounded") when the pattern
+# survives the whole probed range, e.g. a row that is never blocked.
+# ---------------------------------------------------------------------------
+
+MARGIN_PX_TOLERANCE = 0.5
+MARGIN_VELOCITY_TOLERANCE = 0.005
+MARGIN_MAX_VELOCITY_REDUCTION = 0.99
+
+
+@dataclass(frozen=True)
+class MarginJob:
+    pattern: Dict
+    cfg: SimConfig
+    dt: float
+
+
+@dataclass(frozen=True)
+class PatternMargins:
+    pattern_id: str
+    name: str
+    # All None when the pattern is unsolvable as is; math.inf when unbounded.
+    beam_thickness_px: Optional[float]  # extra beam thickness
+    player_height_px: Optional[float]  # extra player height
+    velocity_reduction: Optional[float]  # fraction of both terminal velocities
+    timing_slack_s: Optional[float]  # see the section comment
+
+
+def bisect_margin(survives, hi, tolerance):
+    """Largest x in [0, hi] (to within tolerance) with survives(x), assuming
+    monotonicity; math.inf if even hi survives."""
+    if survives(hi):
+        return math.inf
+    lo = 0.0
+    while hi - lo > tolerance:
+        mid = (lo + hi) / 2
+        if survives(mid):
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+
+def erode_in_time(safe_matrix, pad_ticks):
+    """Rows stay safe only if safe for pad_ticks ticks on either side."""
+    if pad_ticks == 0:
+        return safe_matrix
+    n_ticks = len(safe_matrix)
+    blocked = np.zeros((n_ticks + 1, safe_matrix.shape[1]), dtype=np.int32)
+    np.cumsum(~safe_matrix, axis=0, out=blocked[1:])
+    ticks = np.arange(n_ticks)
+    lo = np.maximum(ticks - pad_ticks, 0)
+    hi = np.minimum(ticks + pad_ticks + 1, n_ticks)
+    return (blocked[hi] - blocked[lo]) == 0
+
+
+def frontier_survives(safe_matrix, cfg, dt, grid_min_y, grid_max_y):
+    """analyze_pattern_numpy's reachability pass, stopping as soon as the frontier empties."""
+    first, stop = dilation_source_bounds(cfg, dt, grid_min_y, grid_max_y)
+    prefix = np.zeros(grid_max_y + 2, dtype=np.int64)
+    reachable = safe_matrix[0]
+    for safe in safe_matrix[1:]:
+        np.cumsum(reachable, out=prefix[1:])
+        reachable = (prefix[stop] > prefix[first]) & safe
+        if not reachable.any():
+            return False
+    return True
+
+
+def interval_frontier_survives(safe_ticks, up_step, down_step, min_y, max_y):
+    """analyze_pattern_intervals' reachability pass, stopping as soon as the frontier empties."""
+    reachable = safe_ticks[0]
+    for safe in safe_ticks[1:]:
+        reachable = intersect_intervals(expand_intervals(reachable, up_step, down_step, min_y, max_y), safe)
+        if not reachable:
+            return False
+    return True
+
+
+def velocity_margin(pattern, cfg, dt, times):
+    """Largest fraction of both terminal velocities that can be lost, on exact reach."""
+    min_y, max_y = center_bounds(cfg)
+    cursors = pattern_cursors(pattern)
+    safe_ticks = [safe_intervals_at(cursors, t, cfg, min_y, max_y) for t in times]
+
+    def survives_slower(fraction):
+        up_step = cfg.terminal_vel_up * (1 - fraction) * dt
+        down_step = cfg.terminal_vel_down * (1 - fraction) * dt
+        return interval_frontier_survives(safe_ticks, up_step, down_step, min_y, max_y)
+
+    return bisect_margin(survives_slower, MARGIN_MAX_VELOCITY_REDUCTION, MARGIN_VELOCITY_TOLERANCE)
+
+
+def pattern_margins(job):
+    cfg, dt = job.cfg, job.dt
+    times = np.array([0.0] + tick_times(float(job.pattern["duration"]), dt))
+    samples = [sample_laser_batch(laser, times) for laser in compile_pattern(job.pattern)]
+
+    def safe_matrix(probe):
+        grid_min_y, grid_max_y = grid_bounds(probe)
+        rows = grid_max_y + 1
+        valid = (np.arange(rows) >= grid_min_y)[:, None]
+        block = batched_safe_block(samples, 0, len(times), stack_configs([probe]),
+                                   np.array([grid_min_y]), np.array([grid_max_y]), valid)
+        return block[:, :, 0], grid_min_y, grid_max_y
+
+    def survives(probe, pad_ticks=0):
+        matrix, grid_min_y, grid_max_y = safe_matrix(probe)
+        return frontier_survives(erode_in_time(matrix, pad_ticks), probe, dt, grid_min_y, grid_max_y)
+
+    base_matrix, grid_min_y, grid_max_y = safe_matrix(cfg)
+
+    def survives_padded(pad_ticks):
+        return frontier_survives(erode_in_time(base_matrix, int(pad_ticks)), cfg, dt, grid_min_y, grid_max_y)
+
+    pattern_id = job.pattern.get("id", "unknown")
+    name = job.pattern.get("name", pattern_id)
+    if not frontier_survives(base_matrix, cfg, dt, grid_min_y, grid_max_y):
+        return PatternMargins(pattern_id, name, None, None, None, None)
+    slack_ticks = bisect_margin(survives_padded, len(times), 1)
+    return PatternMargins(
+        pattern_id, name,
+        beam_thickness_px=bisect_margin(
+            lambda extra: survives(replace(cfg, laser_beam_thickness=cfg.laser_beam_thickness + extra)),
+            cfg.ground_y, MARGIN_PX_TOLERANCE),
+        player_height_px=bisect_margin(
+            lambda extra: survives(replace(cfg, player_height=cfg.player_height + extra)),
+            cfg.ground_y - cfg.player_height, MARGIN_PX_TOLERANCE),
+        velocity_reduction=velocity_margin(job.pattern, cfg, dt, times),
+        timing_slack_s=math.floor(slack_ticks) * dt if slack_ticks < math.inf else math.inf,
+    )
+
+
+def format_margin(template, value):
+    return "unbounded" if value == math.inf else template.format(value)
+
+
+def print_margins(margins):
+    print("Solvability Margins")
+    print("===================")
+    for m in margins:
+        if m.beam_thickness_px is None:
+            print("[FAIL] {:<3} {} | unsolvable as is".format(m.pattern_id, m.name))
+            continue
+        print("[PASS] {:<3} {} | beam {}, height {}, velocity {}, timing {}".format(
+            m.pattern_id, m.name,
+            format_margin("+{:g}px", m.beam_thickness_px), format_margin("+{:g}px", m.player_height_px),
+            format_margin("-{:.1f}%", m.velocity_reduction * 100), format_margin("+/-{:.3f}s", m.timing_slack_s)))
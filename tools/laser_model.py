@@ -0,0 +1,436 @@
+"""
+Laser model shared by every backend.
+
+Compiled laser timelines, displayed state, blocked intervals at the player
+column, safe rows, bit-packed timeline capture and the pattern result.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+from dataclasses import dataclass
+from typing import NamedTuple, Optional, Tuple
+
+from laser_patterns import EPS
+
+# ---------------------------------------------------------------------------
+# Compiled laser timelines
+# Keyframe dicts are flattened once per pattern into parallel float tuples,
+# so sampling needs no float() conversions, dict building or scan from
+# keyframe 0. Sequential ticks go through a LaserCursor (amortized O(1));
+# whole tick arrays go through sample_laser_batch (NumPy backend).
+# ---------------------------------------------------------------------------
+
+STATE_OFF = 0
+STATE_WARN = 1
+STATE_ACTIVE = 2
+STATE_CODES = {"off": STATE_OFF, "warn": STATE_WARN, "active": STATE_ACTIVE}
+
+
+@dataclass(frozen=True)
+class CompiledLaser:
+    times: Tuple[float, ...]
+    x1: Tuple[float, ...]
+    y1: Tuple[float, ...]
+    x2: Tuple[float, ...]
+    y2: Tuple[float, ...]
+    states: Tuple[int, ...]
+    loop: bool
+    active_starts: Tuple[float, ...]
+
+
+class LaserSample(NamedTuple):
+    x1: float
+    y1: float
+    x2: float
+    y2: float
+    state: int
+
+
+def compile_laser(laser):
+    keyframes = laser["keyframes"]
+    for k in keyframes:
+        if k["state"] not in STATE_CODES:
+            raise ValueError("Unknown laser state '{}' at t={}".format(k["state"], k["t"]))
+    return CompiledLaser(
+        times=tuple(float(k["t"]) for k in keyframes),
+        x1=tuple(float(k["x1"]) for k in keyframes),
+        y1=tuple(float(k["y1"]) for k in keyframes),
+        x2=tuple(float(k["x2"]) for k in keyframes),
+        y2=tuple(float(k["y2"]) for k in keyframes),
+        states=tuple(STATE_CODES[k["state"]] for k in keyframes),
+        loop=laser.get("loop", True),
+        active_starts=active_start_times(keyframes, laser.get("loop", True)),
+    )
+
+
+def compile_pattern(pattern):
+    """Compiled lasers of a pattern; lasers without keyframes never block, so they are dropped."""
+    return [compile_laser(laser) for laser in pattern["lasers"] if laser["keyframes"]]
+
+
+def local_time(laser, elapsed):
+    last_t = laser.times[-1]
+    if laser.loop and last_t > 0:
+        return elapsed % last_t
+    return elapsed
+
+
+def keyframe_sample(laser, i):
+    return LaserSample(laser.x1[i], laser.y1[i], laser.x2[i], laser.y2[i], laser.states[i])
+
+
+def segment_sample(laser, i, t):
+    """Interpolate keyframe segment i at local time t."""
+    times = laser.times
+    seg = times[i + 1] - times[i]
+    frac = (t - times[i]) / seg if seg > 0 else 0.0
+    return LaserSample(
+        laser.x1[i] + (laser.x1[i + 1] - laser.x1[i]) * frac,
+        laser.y1[i] + (laser.y1[i + 1] - laser.y1[i]) * frac,
+        laser.x2[i] + (laser.x2[i + 1] - laser.x2[i]) * frac,
+        laser.y2[i] + (laser.y2[i + 1] - laser.y2[i]) * frac,
+        laser.states[i],
+    )
+
+
+class LaserCursor:
+    """Samples one compiled laser; amortized O(1) while elapsed moves forward.
+
+    Loop wraps and backward jumps re-seek with a bisect instead of a scan.
+    """
+
+    def __init__(self, laser):
+        self.laser = laser
+        self.index = 0
+
+    def sample(self, elapsed):
+        laser = self.laser
+        times = laser.times
+        t = local_time(laser, elapsed)
+        if t <= times[0]:
+            return keyframe_sample(laser, 0)
+        if t >= times[-1]:
+            return keyframe_sample(laser, -1)
+        if t < times[self.index]:
+            self.index = bisect.bisect_right(times, t) - 1
+        while times[self.index + 1] <= t:
+            self.index += 1
+        return segment_sample(laser, self.index, t)
+
+
+def pattern_cursors(pattern):
+    return [LaserCursor(laser) for laser in compile_pattern(pattern)]
+
+
+# ---------------------------------------------------------------------------
+# Displayed laser state (port of enforceWarnWindowState)
+# The game shows a non-active keyframe as 'warn' only during the
+# REQUIRED_WARN_DURATION before an off->active edge, and as 'off' otherwise.
+# Blocking only ever looks at 'active', which this never changes, so the
+# analyzers skip it; sample_laser exists for the JS parity check.
+# ---------------------------------------------------------------------------
+
+REQUIRED_WARN_DURATION = 1.0  # must match js/laserPattern.js
+
+
+def active_start_times(keyframes, loop):
+    """Local times where a laser turns active (port of collectActiveStartTimes)."""
+    if not keyframes:
+        return ()
+    starts = set()
+    if keyframes[0]["state"] == "active":
+        starts.add(0.0)
+    for prev, nxt in zip(keyframes, keyframes[1:]):
+        if prev["state"] != "active" and nxt["state"] == "active":
+            starts.add(float(nxt["t"]))
+    if loop and len(keyframes) > 1:
+        if keyframes[-1]["state"] != "active" and keyframes[0]["state"] == "active":
+            starts.add(0.0)
+    return tuple(sorted(starts))
+
+
+def time_until_next_active_start(laser, t):
+    cycle = laser.times[-1]
+    best = math.inf
+    for start in laser.active_starts:
+        dt = start - t
+        if laser.loop and cycle > 0:
+            if dt <= 0:
+                dt += cycle
+            best = min(best, dt)
+        elif dt > 0:
+            best = min(best, dt)
+    return best
+
+
+def displayed_state(laser, raw_state, t):
+    if raw_state == STATE_ACTIVE:
+        return STATE_ACTIVE
+    dt = time_until_next_active_start(laser, t)
+    return STATE_WARN if 0 < dt <= REQUIRED_WARN_DURATION else STATE_OFF
+
+
+def sample_laser(cursor, elapsed):
+    """Beam geometry and the state the game displays (port of sampleLaser)."""
+    laser = cursor.laser
+    s = cursor.sample(elapsed)
+    return s._replace(state=displayed_state(laser, s.state, local_time(laser, elapsed)))
+
+
+# ---------------------------------------------------------------------------
+# Blocked interval at player column
+# ---------------------------------------------------------------------------
+
+def blocked_interval_at_column(sample, cfg):
+    x1, y1, x2, y2 = sample.x1, sample.y1, sample.x2, sample.y2
+    dx, dy = x2 - x1, y2 - y1
+    half_danger_y = cfg.laser_beam_thickness / 2 + cfg.player_height / 2
+
+    if abs(dx) < EPS:
+        half_danger_x = cfg.laser_beam_thickness / 2 + cfg.player_width / 2
+        if abs(cfg.player_col_x - x1) > half_danger_x:
+            return None
+        lo = min(y1, y2) - half_danger_y
+        hi = max(y1, y2) + half_danger_y
+        return (lo, hi)
+
+    frac = (cfg.player_col_x - x1) / dx
+    if frac < 0 or frac > 1:
+        return None
+    y_at_col = y1 + dy * frac
+    return (y_at_col - half_danger_y, y_at_col + half_danger_y)
+
+
+def merge_intervals(intervals):
+    if not intervals:
+        return []
+    intervals = sorted(intervals, key=lambda p: p[0])
+    out = [list(intervals[0])]
+    for lo, hi in intervals[1:]:
+        prev = out[-1]
+        if lo <= prev[1]:
+            prev[1] = max(prev[1], hi)
+        else:
+            out.append([lo, hi])
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Compute safe rows at a moment in time
+# ---------------------------------------------------------------------------
+
+def blocked_intervals_at(cursors, t, cfg):
+    intervals = []
+    for cursor in cursors:
+        s = cursor.sample(t)
+        if s.state != STATE_ACTIVE:
+            continue
+        blocked = blocked_interval_at_column(s, cfg)
+        if blocked is not None:
+            intervals.append(blocked)
+    return intervals
+
+
+def compute_safe_rows(cursors, t, cfg, grid_min_y, grid_max_y):
+    safe = [False] * (grid_max_y + 1)
+    for y in range(grid_min_y, grid_max_y + 1):
+        safe[y] = True
+
+    for lo_raw, hi_raw in merge_intervals(blocked_intervals_at(cursors, t, cfg)):
+        lo = max(grid_min_y, min(grid_max_y, int(math.ceil(lo_raw))))
+        hi = max(grid_min_y, min(grid_max_y, int(math.floor(hi_raw))))
+        if hi < lo:
+            continue
+        for y in range(lo, hi + 1):
+            safe[y] = False
+    return safe
+
+
+def count_true(arr, lo, hi):
+    return sum(1 for i in range(lo, hi + 1) if arr[i])
+
+
+# ---------------------------------------------------------------------------
+# Timeline capture
+# Columns are bit-packed as they are produced (one bit per grid row), so a
+# captured timeline costs ~46 bytes per tick instead of two list[bool] copies.
+# ---------------------------------------------------------------------------
+
+BITS_TO_ASCII = bytes.maketrans(b"\x00\x01", b"01")
+ASCII_TO_BITS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def pack_bits(flags):
+    """Pack a bytes of 0/1 flags into little-endian bits (flag k -> bit k)."""
+    value = int(flags.translate(BITS_TO_ASCII)[::-1], 2) if flags else 0
+    return value.to_bytes((len(flags) + 7) // 8, "little")
+
+
+def unpack_bits(packed, count):
+    """Inverse of pack_bits: `count` 0/1 flag bytes."""
+    value = int.from_bytes(packed, "little")
+    return format(value, "0{}b".format(count)).encode()[::-1].translate(ASCII_TO_BITS)
+
+
+class BitTimeline:
+    """Append-only sequence of bool columns over rows grid_min_y..grid_max_y.
+
+    append() takes a column indexed by absolute Y (like compute_safe_rows);
+    column_flags() gives back one 0/1 byte per grid row, top row first.
+    """
+
+    def __init__(self, grid_min_y, grid_max_y):
+        self.grid_min_y = grid_min_y
+        self.height = grid_max_y - grid_min_y + 1
+        self.stride = (self.height + 7) // 8
+        self.data = bytearray()
+
+    def __len__(self):
+        return len(self.data) // self.stride
+
+    def append(self, column):
+        rows = column[self.grid_min_y:self.grid_min_y + self.height]
+        self.data += pack_bits(bytes(rows))
+
+    def append_packed(self, value):
+        """Append a column given as an int bitset (bit k = row grid_min_y + k)."""
+        self.data += value.to_bytes(self.stride, "little")
+
+    def column_flags(self, i):
+        start = i * self.stride
+        return unpack_bits(self.data[start:start + self.stride], self.height)
+
+
+# ---------------------------------------------------------------------------
+# Pattern result
+# ---------------------------------------------------------------------------
+
+@dataclass
+class PatternResult:
+    pattern_id: str
+    name: str
+    duration: float
+    first_frontier_empty_time: Optional[float]
+    # Row counts for the grid backends; covered span in px for "intervals",
+    # "event" and "physics".
+    min_reachable_count: float
+    min_safe_count: float
+    final_reachable_count: float
+    final_safe_count: float
+    safe_timeline: Optional[BitTimeline] = None
+    reachable_timeline: Optional[BitTimeline] = None
+    grid_min_y: int = 0
+    grid_max_y: int = 0
+    # "loop" backend only: common laser cycle, whole cycles simulated, and
+    # whether a cycle-boundary repeat proved the pattern never empties (even
+    # past its duration); loop_fallback when there is no common cycle and the
+    # python backend's result was used.
+    loop_period: Optional[float] = None
+    loop_cycles: Optional[int] = None
+    survives_indefinitely: Optional[bool] = None
+    loop_fallback: Optional[bool] = None
+    # "adaptive" backend only: coarsest dt from which every finer level agreed
+    # (None if the finest two disagree or only one pass ran), the number of
+    # passes, the finest dt used, and for how long.
+    converged_dt: Optional[float] = None
+    adaptive_passes: Optional[int] = None
+    finest_dt: Optional[float] = None
+    finest_span_s: Optional[float] = None
+    # --clearance on backends with timelines: CLEARANCE_PERCENTILES of the
+    # clearance field over beam-bounded reachable cells, and the share of
+    # reachable cells left out (see clearance_field).
+    clearance_px: Optional[Tuple[float, ...]] = None
+    clearance_s: Optional[Tuple[float, ...]] = None
+    clearance_beam_free: Optional[float] = None
+    clearance_never_blocked: Optional[float] = None
+
+    @property
+    def solvable(self) -> bool:
+        return self.first_frontier_empty_time is None
+
+
+def pattern_result(pattern, **fields):
+    """PatternResult for `pattern`; fields are everything but its id, name and duration."""
+    return PatternResult(
+        pattern_id=pattern.get("id", "unknown"),
+        name=pattern.get("name", pattern.get("id", "unknown")),
+        duration=float(pattern["duration"]),
+        **fields,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Shared grid, tick and bitset helpers
+# Used by several backends and by the generator's survival checks. Bitsets
+# are ints with bit k = row grid_min_y + k (or unit k of a finer grid).
+# ---------------------------------------------------------------------------
+
+def center_bounds(cfg):
+    """(min_y, max_y): the player's center Y range in px."""
+    return cfg.player_height / 2, cfg.ground_y - cfg.player_height / 2
+
+
+def grid_bounds(cfg):
+    """(grid_min_y, grid_max_y): the integer center rows inside center_bounds."""
+    min_y, max_y = center_bounds(cfg)
+    return int(math.ceil(min_y)), int(math.floor(max_y))
+
+
+def reach_rows(cfg, dt, row_px=1.0):
+    """(up_rows, down_rows) the frontier spreads per tick on rows of row_px px.
+
+    Rounded up, like analyze_pattern: floor(y - up) = y - ceil(up) on integer rows.
+    """
+    return math.ceil(cfg.terminal_vel_up * dt / row_px), math.ceil(cfg.terminal_vel_down * dt / row_px)
+
+
+def row_mask(rows):
+    return (1 << rows) - 1
+
+
+def step_frontier(reachable, safe, up_rows, down_rows, mask):
+    """Rows reachable one tick later: spread by the reach, keep the safe ones."""
+    return dilate_bits(reachable, up_rows, down_rows, mask) & safe
+
+
+def tick_times(duration, dt):
+    """Tick times visited by analyze_pattern (same float accumulation)."""
+    times = []
+    t = 0.0
+    while t + dt <= duration + EPS:
+        t += dt
+        times.append(t)
+    return times
+
+
+def safe_bits_at(cursors, t, cfg, grid_min_y, grid_max_y):
+    rows = compute_safe_rows(cursors, t, cfg, grid_min_y, grid_max_y)
+    return int.from_bytes(pack_bits(bytes(rows[grid_min_y:grid_max_y + 1])), "little")
+
+
+def dilate_bits(bits, up_rows, down_rows, mask):
+    """Rows reachable in one tick: each set bit spreads up_rows lower and down_rows higher."""
+    done = 0
+    while done < down_rows:
+        step = min(done + 1, down_rows - done)
+        bits |= bits << step
+        done += step
+    done = 0
+    while done < up_rows:
+        step = min(done + 1, up_rows - done)
+        bits |= bits >> step
+        done += step
+    return bits & mask
+
+
+def safe_bitset(cursors, t, cfg, origin_y, row_px, units):
+    """Bitset of y units (unit u = center Y origin_y + u * row_px) not inside an active beam."""
+    safe = (1 << units) - 1
+    for lo, hi in merge_intervals(blocked_intervals_at(cursors, t, cfg)):
+        u_lo = max(0, math.ceil((lo - origin_y) / row_px))
+        u_hi = min(units - 1, math.floor((hi - origin_y) / row_px))
+        if u_hi >= u_lo:
+            safe &= ~(((1 << (u_hi - u_lo + 1)) - 1) << u_lo)
+    return safe
@@ -0,0 +1,295 @@
+"""
+Monte Carlo survival of noisy players following each pattern's witness path.
+"""
+
+from __future__ import annotations
+
+import math
+import statistics
+import zlib
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+try:
+    import numpy as np
+except ImportError:  # optional: only the NumPy paths need it
+    np = None
+
+from laser_patterns import SimConfig
+from laser_model import (
+    compile_pattern,
+    grid_bounds,
+    pattern_cursors,
+    reach_rows,
+    row_mask,
+    safe_bits_at,
+    step_frontier,
+    tick_times,
+)
+from laser_grid import blocked_interval_batch, sample_laser_batch
+from laser_witness import witness_trajectory
+
+# ---------------------------------------------------------------------------
+# Monte Carlo survival
+# Simulates noisy players following the pattern's witness path under the
+# game's real physics (applyPhysics: thrust/gravity, terminal velocities,
+# clamps). The path followed is the witness's viable corridor center (the
+# middle of the run of cells that are reachable and can still reach the
+# witness's end), since the witness itself hugs beam edges. Each trajectory is
+# a bang-bang controller: hold thrust while the state it last saw,
+# extrapolated over its own delay plus MONTE_CARLO_LOOKAHEAD_S, is below the
+# path at that time. Human noise:
+#   - reaction delay: it acts on state seen that long ago (Gaussian per trajectory, >= 0),
+#   - timing jitter: each tick it aims at a Gaussian-jittered time on the path,
+#   - thrust-hold error: each tick its input flips with a fixed probability.
+# With all noise off, every shipped pattern's path is followed without dying.
+# All trajectories of a pattern advance together along a NumPy axis and are
+# tested against blocked_interval_batch over the compiled laser timelines.
+# Survival is reported with a Wilson score interval.
+# ---------------------------------------------------------------------------
+
+MONTE_CARLO_LOOKAHEAD_S = 0.2
+MONTE_CARLO_REACTION_MEAN_S = 0.12
+MONTE_CARLO_REACTION_SD_S = 0.03
+MONTE_CARLO_JITTER_SD_S = 0.03
+MONTE_CARLO_JITTER_QUANTILES = 256  # jitter drawn from this many equiprobable Gaussian quantiles
+MONTE_CARLO_HOLD_ERROR_P = 0.05
+MONTE_CARLO_COMPACT_FRACTION = 0.75  # drop dead lanes once fewer than this share are alive
+MONTE_CARLO_Z = 1.96  # 95% confidence
+MONTE_CARLO_SEED = 0
+
+
+@dataclass(frozen=True)
+class MonteCarloJob:
+    pattern: Dict
+    cfg: SimConfig
+    dt: float
+    trajectories: int
+
+
+@dataclass(frozen=True)
+class MonteCarloResult:
+    pattern_id: str
+    name: str
+    trajectories: int
+    survivors: int
+    ci_low: float
+    ci_high: float
+    median_death_time: Optional[float]  # over trajectories that died
+
+    @property
+    def survival(self) -> float:
+        return self.survivors / self.trajectories
+
+
+def wilson_interval(successes, n, z=MONTE_CARLO_Z):
+    p = successes / n
+    denom = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def jitter_tick_offsets(dt):
+    """Ticks from k to the aimed path tick at each of MONTE_CARLO_JITTER_QUANTILES
+    equiprobable quantiles of the jittered lookahead."""
+    jitter = statistics.NormalDist(MONTE_CARLO_LOOKAHEAD_S, MONTE_CARLO_JITTER_SD_S)
+    quantiles = [jitter.inv_cdf((i + 0.5) / MONTE_CARLO_JITTER_QUANTILES)
+                 for i in range(MONTE_CARLO_JITTER_QUANTILES)]
+    return np.round(np.array(quantiles) / dt).astype(np.intp)
+
+
+def blocked_timeline_batch(pattern, cfg, times):
+    """Per laser, (lo, hi) arrays over `times` with lo > hi wherever it blocks nothing."""
+    bands = []
+    for laser in compile_pattern(pattern):
+        x1, y1, x2, y2, active = sample_laser_batch(laser, times)
+        lo, hi, hit = blocked_interval_batch(x1, y1, x2, y2, cfg)
+        blocks = active & hit
+        bands.append((np.where(blocks, lo, np.inf), np.where(blocks, hi, -np.inf)))
+    return bands
+
+
+def run_bounds(bits, r):
+    """[lo, hi] of the run of set bits containing bit r."""
+    above = bits >> r
+    hi = r + ((~above) & (above + 1)).bit_length() - 2
+    lo = ((~bits) & ((1 << r) - 1)).bit_length()
+    return lo, hi
+
+
+def corridor_targets(pattern, cfg, dt, witness):
+    """Per witness tick, the center Y of the viable run (reachable and still able to
+    reach the witness's last tick) that the witness passes through."""
+    grid_min_y, grid_max_y = grid_bounds(cfg)
+    mask = row_mask(grid_max_y - grid_min_y + 1)
+    up_rows, down_rows = reach_rows(cfg, dt)
+    cursors = pattern_cursors(pattern)
+    reachable = []
+    for k, t in enumerate(witness["times"]):
+        safe = safe_bits_at(cursors, t, cfg, grid_min_y, grid_max_y)
+        reachable.append(step_frontier(reachable[-1], safe, up_rows, down_rows, mask) if k else safe)
+    viable = reachable[-1]
+    centers = [0.0] * len(reachable)
+    for k in range(len(reachable) - 1, -1, -1):
+        if k < len(reachable) - 1:
+            viable = step_frontier(viable, reachable[k], down_rows, up_rows, mask)
+        lo, hi = run_bounds(viable, witness["ys"][k] - grid_min_y)
+        centers[k] = grid_min_y + (lo + hi) / 2
+    return centers
+
+
+def path_targets(pattern, cfg, dt, witness, n_ticks):
+    """Per tick, the clamped center Y of the witness's viable corridor."""
+    centers = corridor_targets(pattern, cfg, dt, witness)
+    # A dead-ended witness is held at its last Y; those runs die where it did (or sooner).
+    target = np.full(n_ticks, centers[-1])
+    target[:len(centers)] = centers
+    return np.clip(target, cfg.clamp_min_y, cfg.clamp_max_y)
+
+
+def aim_table(target, dt):
+    """(padded path, offsets): the path at each jitter quantile is padded[k + offsets].
+
+    The observed tick plus the horizon is k + lookahead for every lane, so the
+    aimed tick's offset from k comes from one small table, and each tick only
+    gathers the path at those few offsets."""
+    offsets = jitter_tick_offsets(dt)
+    padded = np.pad(target, (max(0, -offsets.min()), max(0, offsets.max())), mode="edge")
+    return padded, offsets + max(0, -offsets.min())
+
+
+class TrialLanes:
+    """State of the trajectories still alive, sorted by reaction delay so each
+    delay's lanes are one slice of the state history."""
+
+    def __init__(self, delay, start_y, dt):
+        n = len(delay)
+        self.delay = delay
+        self.horizon = (delay + 1) * dt + MONTE_CARLO_LOOKAHEAD_S
+        self.history = int(delay.max()) + 1
+        self.y = np.full(n, start_y)
+        self.vy = np.zeros(n)
+        self.seen_y = np.tile(self.y, (self.history, 1))
+        self.seen_vy = np.zeros((self.history, n))
+        self.alive = np.ones(n, dtype=bool)
+        self.death_tick = np.zeros(n, dtype=np.int64)
+        self.deaths = []
+        self.groups = self.delay_groups()
+
+    def delay_groups(self):
+        values = np.unique(self.delay)
+        return list(zip(values, np.searchsorted(self.delay, values), np.searchsorted(self.delay, values + 1)))
+
+    def observed(self, k):
+        """(y, vy) each lane saw its own reaction delay before tick k."""
+        obs_y, obs_vy = np.empty(len(self.y)), np.empty(len(self.y))
+        for d, a, b in self.groups:
+            slot = (k - 1 - d) % self.history
+            obs_y[a:b], obs_vy[a:b] = self.seen_y[slot, a:b], self.seen_vy[slot, a:b]
+        return obs_y, obs_vy
+
+    def record(self, k):
+        self.seen_y[k % self.history], self.seen_vy[k % self.history] = self.y, self.vy
+
+    def kill(self, hit, k):
+        self.death_tick[self.alive & hit] = k
+        self.alive &= ~hit
+        if self.alive.sum() < len(self.alive) * MONTE_CARLO_COMPACT_FRACTION:
+            self.compact()
+
+    def compact(self):
+        """Drop dead lanes so later ticks only pay for survivors."""
+        alive = self.alive
+        self.deaths.append(self.death_tick[~alive])
+        self.y, self.vy, self.delay, self.horizon = self.y[alive], self.vy[alive], self.delay[alive], self.horizon[alive]
+        self.seen_y, self.seen_vy = self.seen_y[:, alive], self.seen_vy[:, alive]
+        self.death_tick = self.death_tick[alive]
+        self.alive = alive[alive]
+        self.groups = self.delay_groups()
+
+    def all_deaths(self):
+        return np.concatenate(self.deaths + [self.death_tick[~self.alive]])
+
+
+def reaction_delays(rng, n, dt):
+    """Sorted per-trajectory reaction delays in ticks (Gaussian, >= 0)."""
+    return np.sort(np.maximum(0, np.round(
+        rng.normal(MONTE_CARLO_REACTION_MEAN_S, MONTE_CARLO_REACTION_SD_S, n) / dt))).astype(np.int64)
+
+
+def controller_presses(obs_y, obs_vy, horizon, aimed, rng):
+    """Bang-bang input: thrust while the seen state, extrapolated over the horizon,
+    is below the aimed path Y; each input flips with MONTE_CARLO_HOLD_ERROR_P."""
+    pressing = obs_y + obs_vy * horizon > aimed
+    pressing ^= rng.random(len(aimed)) < MONTE_CARLO_HOLD_ERROR_P
+    return pressing
+
+
+def apply_physics(lanes, pressing, cfg, dt):
+    """One applyPhysics step for every lane, in place."""
+    lanes.vy += np.where(pressing, -cfg.thrust * dt, cfg.gravity * dt)
+    np.clip(lanes.vy, -cfg.terminal_vel_up, cfg.terminal_vel_down, out=lanes.vy)
+    lanes.y += lanes.vy * dt
+    lanes.vy[(lanes.y < cfg.clamp_min_y) | (lanes.y > cfg.clamp_max_y)] = 0.0
+    np.clip(lanes.y, cfg.clamp_min_y, cfg.clamp_max_y, out=lanes.y)
+
+
+def beam_hits(bands, k, y):
+    hit = np.zeros(len(y), dtype=bool)
+    for lo, hi in bands:
+        if lo[k] <= hi[k]:
+            hit |= (y >= lo[k]) & (y <= hi[k])
+    return hit
+
+
+def run_trials(lanes, target, bands, cfg, dt, rng):
+    """Advance every lane through all ticks, recording where each one dies."""
+    padded, offsets = aim_table(target, dt)
+    for k in range(len(target)):
+        if k > 0:
+            obs_y, obs_vy = lanes.observed(k)
+            aimed = padded[k + offsets][rng.integers(0, MONTE_CARLO_JITTER_QUANTILES, len(obs_y), dtype=np.uint8)]
+            apply_physics(lanes, controller_presses(obs_y, obs_vy, lanes.horizon, aimed, rng), cfg, dt)
+            lanes.record(k)
+        lanes.kill(beam_hits(bands, k, lanes.y), k)
+
+
+def monte_carlo_result(witness, n, survivors, median_death_time):
+    ci_low, ci_high = wilson_interval(survivors, n)
+    return MonteCarloResult(
+        pattern_id=witness["pattern_id"],
+        name=witness["name"],
+        trajectories=n,
+        survivors=survivors,
+        ci_low=ci_low,
+        ci_high=ci_high,
+        median_death_time=median_death_time,
+    )
+
+
+def monte_carlo_survival(job):
+    cfg, dt, n = job.cfg, job.dt, job.trajectories
+    witness = witness_trajectory(job.pattern, cfg, dt)
+    if not witness["ys"]:
+        # Nothing is safe at t = 0, so every trajectory dies on the first tick.
+        return monte_carlo_result(witness, n, 0, 0.0)
+    times = np.array([0.0] + tick_times(float(job.pattern["duration"]), dt))
+    target = path_targets(job.pattern, cfg, dt, witness, len(times))
+    bands = blocked_timeline_batch(job.pattern, cfg, times)
+    rng = np.random.default_rng([MONTE_CARLO_SEED, zlib.crc32(witness["pattern_id"].encode())])
+    lanes = TrialLanes(reaction_delays(rng, n, dt), target[0], dt)
+    run_trials(lanes, target, bands, cfg, dt, rng)
+
+    deaths = lanes.all_deaths()
+    median_death_time = float(times[int(np.median(deaths))]) if len(deaths) else None
+    return monte_carlo_result(witness, n, int(lanes.alive.sum()), median_death_time)
+
+
+def print_monte_carlo(results):
+    print("Monte Carlo Survival")
+    print("====================")
+    for r in results:
+        deaths = "" if r.median_death_time is None else ", median death t={:.2f}s".format(r.median_death_time)
+        print("{:<3} {} | survival {:.2%} (95% CI {:.2%}-{:.2%}) over {} runs{}".format(
+            r.pattern_id, r.name, r.survival, r.ci_low, r.ci_high, r.trajectories, deaths))
@@ -0,0 +1,44 @@
+// Long-lived query server for tools/check_laser_parity.py.
+// Reads one JSON request per stdin line and answers with one JSON line:
+//   {"op":"load","patterns":[...]}            -> {"loaded":N}
+//   {"op":"query","pattern":i,"times":[...]}  -> {"bands":[[[lo,hi],...],...],
+//                                                 "samples":[[[x1,y1,x2,y2,state]|null,...],...]}
+// bands come from getSafeCenterBandsAtTime, samples from sampleLaser on the
+// runtime laser objects (so warn-window enforcement is included).
+
+import { createInterface } from 'node:readline';
+import { getSafeCenterBandsAtTime, prepareLaser, sampleLaser } from '../js/laserPattern.js';
+
+let patterns = [];
+let prepared = [];
+
+function sampleRow(lasers, t) {
+    return lasers.map((laser) => {
+        const s = sampleLaser(laser, t);
+        return s && [s.x1, s.y1, s.x2, s.y2, s.state];
+    });
+}
+
+function handle(request) {
+    if (request.op === 'load') {
+        patterns = request.patterns;
+        prepared = patterns.map((p) => p.lasers.map(prepareLaser));
+        return { loaded: patterns.length };
+    }
+    if (request.op === 'query') {
+        const def = patterns[request.pattern];
+        const lasers = prepared[request.pattern];
+        if (!def) throw new Error(`no loaded pattern at index ${request.pattern}`);
+        return {
+            bands: request.times.map((t) => getSafeCenterBandsAtTime(def, t).map((b) => [b.lo, b.hi])),
+            samples: request.times.map((t) => sampleRow(lasers, t)),
+        };
+    }
+    throw new Error(`unknown op '${request.op}'`);
+}
+
+const lines = createInterface({ input: process.stdin, crlfDelay: Infinity });
+for await (const line of lines) {
+    if (!line) continue;
+    process.stdout.write(JSON.stringify(handle(JSON.parse(line))) + '\n');
+}
@@ -0,0 +1,438 @@
+"""
+Game constants, the hand-ported laser patterns and the simulation config.
+
+These mirror js/config.js and js/data/laserPatterns.js; --source python
+checks them instead of the Node export.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Dict
+
+# ---------------------------------------------------------------------------
+# Game constants (must match js/config.js)
+# ---------------------------------------------------------------------------
+
+CANVAS_WIDTH = 800
+GROUND_Y = 400
+PLAYER_HEIGHT = 40
+PLAYER_WIDTH = 36
+PLAYER_START_X = 100
+PLAYER_RENDER_HEIGHT = 80
+PLAYER_SPRITE_BOTTOM_PAD = 16
+PLAYER_HITBOX_OFFSET_Y = 16
+LASER_BEAM_THICKNESS = 16
+GRAVITY = 1200
+THRUST = 1500
+TERMINAL_VEL_UP = 380
+TERMINAL_VEL_DOWN = 450
+
+EPS = 1e-6
+
+# ---------------------------------------------------------------------------
+# Pattern generation helpers (ported from js/data/laserPatterns.js)
+# ---------------------------------------------------------------------------
+
+def h_beam(t: float, y: float, state: str) -> Dict:
+    return {"t": t, "x1": 0, "y1": y, "x2": CANVAS_WIDTH, "y2": y, "state": state}
+
+
+def arc_sweep(pivot_x, pivot_y, length, t_start, t_end, angle_start, angle_end, num_steps, state):
+    kf = []
+    for i in range(num_steps + 1):
+        frac = i / num_steps
+        t = t_start + (t_end - t_start) * frac
+        a = angle_start + (angle_end - angle_start) * frac
+        kf.append({
+            "t": t,
+            "x1": pivot_x, "y1": pivot_y,
+            "x2": pivot_x + length * math.cos(a),
+            "y2": pivot_y + length * math.sin(a),
+            "state": state,
+        })
+    return kf
+
+
+# ---------------------------------------------------------------------------
+# M1: The Sweep
+# ---------------------------------------------------------------------------
+
+def build_m1():
+    return {
+        "id": "H3", "name": "H3: Sky Lanes", "tier": "hard",
+        "duration": 11.0,
+        "lasers": [{"loop": True, "keyframes": [
+            h_beam(0.00, GROUND_Y, "warn"),
+            h_beam(1.50, 200,      "active"),
+            h_beam(2.75, 0,        "warn"),
+            h_beam(4.25, 200,      "active"),
+            h_beam(5.50, GROUND_Y, "warn"),
+        ]}],
+    }
+
+
+# ---------------------------------------------------------------------------
+# M2: Crossing Edges
+# ---------------------------------------------------------------------------
+
+M2_SQ_LEFT = 80
+M2_SQ_TOP = 0
+M2_SQ_SIZE = GROUND_Y
+M2_CYCLE = 10.0
+M2_ACTIVE_START = 0.70
+M2_ACTIVE_END = 0.95
+M2_SAMPLES = 40
+
+M2_ACTIVE_WINDOWS = [
+    {"start": M2_ACTIVE_START, "end": M2_ACTIVE_END},
+    {"start": (M2_ACTIVE_START + 0.5) % 1, "end": (M2_ACTIVE_END + 0.5) % 1},
+]
+
+
+def square_edge_point(p):
+    turn = ((p % 1) + 1) % 1
+    q = turn * 4
+    left = M2_SQ_LEFT
+    top = M2_SQ_TOP
+    right = M2_SQ_LEFT + M2_SQ_SIZE
+    bottom = M2_SQ_TOP + M2_SQ_SIZE
+
+    if q < 1:
+        return (left + M2_SQ_SIZE * q, top)
+    if q < 2:
+        return (right, top + M2_SQ_SIZE * (q - 1))
+    if q < 3:
+        return (right - M2_SQ_SIZE * (q - 2), bottom)
+    return (left, bottom - M2_SQ_SIZE * (q - 3))
+
+
+def is_in_wrapped_window(p, start, end):
+    if start <= end:
+        return p >= start and p < end
+    return p >= start or p < end
+
+
+def is_in_any_active_window(p):
+    for w in M2_ACTIVE_WINDOWS:
+        if is_in_wrapped_window(p, w["start"], w["end"]):
+            return True
+    return False
+
+
+def build_m2_square_orbit_keyframes(phase_offset):
+    times = {0.0, M2_CYCLE}
+    for w in M2_ACTIVE_WINDOWS:
+        ts = (((w["start"] - phase_offset) % 1) + 1) % 1 * M2_CYCLE
+        te = (((w["end"] - phase_offset) % 1) + 1) % 1 * M2_CYCLE
+        times.add(ts)
+        times.add(te)
+    for i in range(1, M2_SAMPLES):
+        times.add((i / M2_SAMPLES) * M2_CYCLE)
+
+    sorted_times = sorted(times)
+    kf = []
+    for t in sorted_times:
+        p = ((t / M2_CYCLE) + phase_offset) % 1
+        ax, ay = square_edge_point(p)
+        bx, by = square_edge_point((p + 0.5) % 1)
+        state = "active" if is_in_any_active_window(p) else "off"
+        kf.append({"t": t, "x1": ax, "y1": ay, "x2": bx, "y2": by, "state": state})
+    return kf
+
+
+def build_m2():
+    return {
+        "id": "H4", "name": "H4: Orbit Cross", "tier": "hard",
+        "duration": 12.0,
+        "lasers": [
+            {"loop": True, "keyframes": build_m2_square_orbit_keyframes(0.00)},
+            {"loop": True, "keyframes": build_m2_square_orbit_keyframes(0.25)},
+        ],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Path-first helpers
+# ---------------------------------------------------------------------------
+
+def build_corridor_beam_keyframes(waypoints, gap, side, cycle_duration):
+    side_sign = -1 if side == "top" else 1
+
+    def y_for_center(center_y):
+        return center_y + side_sign * gap * 0.5
+
+    first = waypoints[0]
+    last = waypoints[-1]
+    keyframes = [
+        h_beam(0.0, y_for_center(first["center_y"]), "off"),
+        h_beam(first["t"], y_for_center(first["center_y"]), "active"),
+    ]
+    keyframes += [h_beam(w["t"], y_for_center(w["center_y"]), "active") for w in waypoints[1:]]
+    keyframes += [
+        h_beam(last["t"], y_for_center(last["center_y"]), "off"),
+        h_beam(cycle_duration, y_for_center(first["center_y"]), "off"),
+    ]
+    return keyframes
+
+
+def build_corridor_pattern(pattern_id, name, tier, duration, cycle_duration, gap, waypoints):
+    return {
+        "id": pattern_id,
+        "name": name,
+        "tier": tier,
+        "duration": duration,
+        "lasers": [
+            {"loop": True, "keyframes": build_corridor_beam_keyframes(waypoints, gap, "top", cycle_duration)},
+            {"loop": True, "keyframes": build_corridor_beam_keyframes(waypoints, gap, "bottom", cycle_duration)},
+        ],
+    }
+
+
+def is_in_window(t, window):
+    return t >= window["start"] and t < window["end"]
+
+
+def pulse_state_at(t, windows):
+    for window in windows:
+        if is_in_window(t, window):
+            return "active"
+    return "off"
+
+
+def build_pulse_beam_keyframes(y, windows, cycle_duration):
+    times = {0.0, cycle_duration}
+    for window in windows:
+        times.add(window["start"])
+        times.add(window["end"])
+    return [h_beam(t, y, pulse_state_at(t, windows)) for t in sorted(times)]
+
+
+def build_timed_gate_pattern(pattern_id, name, tier, duration, cycle_duration, beams):
+    return {
+        "id": pattern_id,
+        "name": name,
+        "tier": tier,
+        "duration": duration,
+        "lasers": [
+            {"loop": True, "keyframes": build_pulse_beam_keyframes(beam["y"], beam["windows"], cycle_duration)}
+            for beam in beams
+        ],
+    }
+
+
+def build_sine_waypoints(start_t, end_t, samples, center_y, amplitude, period):
+    waypoints = []
+    for i in range(samples + 1):
+        frac = i / samples
+        t = start_t + (end_t - start_t) * frac
+        phase = (t - start_t) / period
+        waypoints.append({
+            "t": t,
+            "center_y": center_y + amplitude * math.sin(phase * math.pi * 2),
+        })
+    return waypoints
+
+
+def build_down_up_sine_waypoints(start_t, end_t, samples, center_y, wave_amplitude, wave_period, trend_amplitude):
+    waypoints = []
+    for i in range(samples + 1):
+        frac = i / samples
+        t = start_t + (end_t - start_t) * frac
+        wave_phase = ((t - start_t) / wave_period) * math.pi * 2
+        wave = wave_amplitude * math.sin(wave_phase)
+        # Down then up over one cycle: 0 -> +trend_amplitude -> 0.
+        trend = trend_amplitude * (1 - math.cos(frac * math.pi * 2)) * 0.5
+        waypoints.append({
+            "t": t,
+            "center_y": center_y + trend + wave,
+        })
+    return waypoints
+
+
+# ---------------------------------------------------------------------------
+# H1: Ribbon Ride (gentle curved lane)
+# ---------------------------------------------------------------------------
+
+def build_h1():
+    return build_corridor_pattern(
+        pattern_id="H1",
+        name="H1: Serpent Run",
+        tier="hard",
+        duration=12.0,
+        cycle_duration=6.0,
+        gap=204,
+        waypoints=build_sine_waypoints(1.0, 5.0, 20, 200, 74, 4.4),
+    )
+
+
+# ---------------------------------------------------------------------------
+# H2: Double Curl (deeper curved lane)
+# ---------------------------------------------------------------------------
+
+def build_h2():
+    waypoints = build_sine_waypoints(1.0, 5.0, 24, 200, 52, 2.6)
+    return {
+        "id": "H2",
+        "name": "H2: Twin Arcs",
+        "tier": "hard",
+        "duration": 12.0,
+        "lasers": [
+            {"loop": True, "keyframes": build_corridor_beam_keyframes(waypoints, 160, "top", 6.0)},
+            {"loop": True, "keyframes": build_corridor_beam_keyframes(waypoints, 160, "bottom", 6.0)},
+            {"loop": True, "keyframes": build_corridor_beam_keyframes(waypoints, 300, "top", 6.0)},
+            {"loop": True, "keyframes": build_corridor_beam_keyframes(waypoints, 300, "bottom", 6.0)},
+        ],
+    }
+
+
+# ---------------------------------------------------------------------------
+# X1: Wave Riptide (moving safe path)
+# ---------------------------------------------------------------------------
+
+def build_x1():
+    waypoints = build_down_up_sine_waypoints(
+        start_t=1.0,
+        end_t=5.2,
+        samples=28,
+        center_y=170,
+        wave_amplitude=36,
+        wave_period=2.2,
+        trend_amplitude=66,
+    )
+    return {
+        "id": "X1",
+        "name": "X1: Cyclone Ribbon",
+        "tier": "extreme",
+        "duration": 12.0,
+        "lasers": [
+            {"loop": True, "keyframes": build_corridor_beam_keyframes(waypoints, 152, "top", 6.0)},
+            {"loop": True, "keyframes": build_corridor_beam_keyframes(waypoints, 152, "bottom", 6.0)},
+            {"loop": True, "keyframes": build_corridor_beam_keyframes(waypoints, 286, "top", 6.0)},
+            {"loop": True, "keyframes": build_corridor_beam_keyframes(waypoints, 286, "bottom", 6.0)},
+        ],
+    }
+
+
+def build_x2():
+    return build_timed_gate_pattern(
+        pattern_id="X2",
+        name="X2: Pulse Matrix",
+        tier="extreme",
+        duration=7.2,
+        cycle_duration=7.2,
+        beams=[
+            {"y": 80, "windows": [{"start": 1.0, "end": 1.8}, {"start": 4.6, "end": 5.4}]},
+            {"y": 140, "windows": [{"start": 2.4, "end": 3.2}, {"start": 6.0, "end": 6.8}]},
+            {"y": 200, "windows": [{"start": 1.0, "end": 1.8}, {"start": 4.6, "end": 5.4}]},
+            {"y": 260, "windows": [{"start": 2.4, "end": 3.2}, {"start": 6.0, "end": 6.8}]},
+            {"y": 320, "windows": [{"start": 1.0, "end": 1.8}, {"start": 4.6, "end": 5.4}]},
+        ],
+    )
+
+
+# ---------------------------------------------------------------------------
+# X3: Gap Shift Matrix
+# Six-laser extreme with forced adjacent gap sequence.
+# ---------------------------------------------------------------------------
+
+X3_ROWS_A = [40, 85, 130, 270, 315, 360]  # gap 3-4
+X3_ROWS_B = [40, 85, 225, 270, 315, 360]  # gap 2-3
+X3_ROWS_C = [40, 85, 130, 175, 315, 360]  # gap 4-5
+X3_ROWS_D = [40, 180, 225, 270, 315, 360]  # gap 1-2
+X3_ROWS_E = [40, 85, 130, 175, 220, 360]  # gap 5-6
+X3_EVENTS = [
+    {"t": 0.0, "rows": X3_ROWS_A, "state": "off"},
+    {"t": 1.0, "rows": X3_ROWS_A, "state": "active"},  # gap 3-4
+    {"t": 1.8, "rows": X3_ROWS_A, "state": "off"},
+    {"t": 2.6, "rows": X3_ROWS_B, "state": "active"},  # gap 2-3
+    {"t": 3.4, "rows": X3_ROWS_B, "state": "off"},
+    {"t": 4.2, "rows": X3_ROWS_C, "state": "active"},  # gap 4-5
+    {"t": 5.0, "rows": X3_ROWS_C, "state": "off"},
+    {"t": 5.8, "rows": X3_ROWS_D, "state": "active"},  # gap 1-2
+    {"t": 6.6, "rows": X3_ROWS_D, "state": "off"},
+    {"t": 7.4, "rows": X3_ROWS_E, "state": "active"},  # gap 5-6
+    {"t": 8.2, "rows": X3_ROWS_E, "state": "off"},
+    {"t": 9.0, "rows": X3_ROWS_A, "state": "active"},  # return to gap 3-4
+    {"t": 9.8, "rows": X3_ROWS_A, "state": "off"},
+    {"t": 10.4, "rows": X3_ROWS_A, "state": "off"},
+]
+
+
+def build_x3_gap_shift_keyframes(laser_index):
+    return [h_beam(event["t"], event["rows"][laser_index], event["state"]) for event in X3_EVENTS]
+
+
+def build_x3():
+    return {
+        "id": "X3",
+        "name": "X3: Gap Shift Matrix",
+        "tier": "extreme",
+        "duration": 10.4,
+        "lasers": [
+            {"loop": True, "keyframes": build_x3_gap_shift_keyframes(i)}
+            for i in range(6)
+        ],
+    }
+
+
+def build_m3():
+    return build_corridor_pattern(
+        pattern_id="M1",
+        name="M1: Breezy Bend",
+        tier="medium",
+        duration=12.0,
+        cycle_duration=6.5,
+        gap=232,
+        waypoints=build_sine_waypoints(1.0, 5.4, 20, 205, 66, 3.4),
+    )
+
+
+def build_m4():
+    return build_timed_gate_pattern(
+        pattern_id="M2",
+        name="M2: Easy Beat",
+        tier="medium",
+        duration=12.0,
+        cycle_duration=6.5,
+        beams=[
+            {"y": 130, "windows": [{"start": 1.1, "end": 1.9}, {"start": 4.2, "end": 5.0}]},
+            {"y": 270, "windows": [{"start": 2.2, "end": 3.0}, {"start": 5.2, "end": 6.0}]},
+        ],
+    )
+
+
+def build_all_patterns():
+    return [
+        build_m3(),
+        build_m4(),
+        build_h1(),
+        build_h2(),
+        build_m1(),
+        build_m2(),
+        build_x1(),
+        build_x2(),
+        build_x3(),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Simulation config
+# ---------------------------------------------------------------------------
+
+@dataclass
+class SimConfig:
+    ground_y: float = GROUND_Y
+    player_height: float = PLAYER_HEIGHT
+    player_width: float = PLAYER_WIDTH
+    player_col_x: float = PLAYER_START_X + PLAYER_WIDTH / 2.0
+    laser_beam_thickness: float = LASER_BEAM_THICKNESS
+    terminal_vel_up: float = TERMINAL_VEL_UP
+    terminal_vel_down: float = TERMINAL_VEL_DOWN
+    gravity: float = GRAVITY
+    thrust: float = THRUST
+    # Hitbox-center Y where applyPhysics clamps: sprite top at 0 / feet on the ground.
+    clamp_min_y: float = PLAYER_HITBOX_OFFSET_Y + PLAYER_HEIGHT / 2.0
+    clamp_max_y: float = (GROUND_Y - (PLAYER_RENDER_HEIGHT - PLAYER_SPRITE_BOTTOM_PAD)
+                          + PLAYER_HITBOX_OFFSET_Y + PLAYER_HEIGHT / 2.0)
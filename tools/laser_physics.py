@@ -0,0 +1,169 @@
+"""
+Physics backend: reachable (y, vy) states under the game's own update.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from fractions import Fraction
+
+from laser_model import (
+    BitTimeline,
+    grid_bounds,
+    pattern_cursors,
+    pattern_result,
+    safe_bitset,
+    tick_times,
+)
+
+# ---------------------------------------------------------------------------
+# Physics backend
+# Tracks reachable (y, vy) states with the game's own update: each tick the
+# player either thrusts or falls, vy is clamped to the terminal velocities,
+# y advances by vy * dt, and hitting the ceiling or ground zeroes vy. With
+# rational dt the accelerations put vy on a lattice of step dv and y on a
+# lattice of step dy (1/60 s: dv = 5 px/s, dy = 1/12 px), so the state set is
+# exact: one int bitset over y per occupied vy, every row advanced with a
+# single shift per action. Rows that empty are dropped. Counts are px spans
+# of the y projection; the start state is every safe y at every vy.
+# ---------------------------------------------------------------------------
+
+PHYSICS_MAX_DENOMINATOR = 10000
+PHYSICS_MAX_CELLS = 20_000_000
+
+
+def fraction_gcd(a, b):
+    return Fraction(math.gcd(a.numerator * b.denominator, b.numerator * a.denominator),
+                    a.denominator * b.denominator)
+
+
+@dataclass(frozen=True)
+class PhysicsLattice:
+    dy: float  # px per y unit
+    units: int  # y units 0..units-1 cover clamp_min_y..clamp_max_y
+    shift_per_k: int  # y units moved per tick per vy step
+    thrust_k: int  # vy steps lost per thrust tick
+    gravity_k: int  # vy steps gained per falling tick
+    min_k: int  # -TERMINAL_VEL_UP in vy steps
+    max_k: int  # TERMINAL_VEL_DOWN in vy steps
+
+
+def rational(value):
+    return Fraction(value).limit_denominator(PHYSICS_MAX_DENOMINATOR)
+
+
+def build_physics_lattice(cfg, dt):
+    step = rational(dt)
+    thrust_dv, gravity_dv = rational(cfg.thrust) * step, rational(cfg.gravity) * step
+    vel_up, vel_down = rational(cfg.terminal_vel_up), rational(cfg.terminal_vel_down)
+    span = rational(cfg.clamp_max_y) - rational(cfg.clamp_min_y)
+    dv = fraction_gcd(fraction_gcd(thrust_dv, gravity_dv), fraction_gcd(vel_up, vel_down))
+    dy = fraction_gcd(dv * step, span)
+    lattice = PhysicsLattice(
+        dy=float(dy),
+        units=int(span / dy) + 1,
+        shift_per_k=int(dv * step / dy),
+        thrust_k=int(thrust_dv / dv),
+        gravity_k=int(gravity_dv / dv),
+        min_k=-int(vel_up / dv),
+        max_k=int(vel_down / dv),
+    )
+    cells = lattice.units * (lattice.max_k - lattice.min_k + 1)
+    if cells > PHYSICS_MAX_CELLS:
+        raise ValueError("physics lattice for dt={} has {} cells (max {}); use a coarser --dt such as 1/60"
+                         .format(dt, cells, PHYSICS_MAX_CELLS))
+    return lattice
+
+
+def safe_units_at(cursors, t, cfg, lattice):
+    return safe_bitset(cursors, t, cfg, cfg.clamp_min_y, lattice.dy, lattice.units)
+
+
+def physics_step(rows, lattice):
+    """Advance {vy step: y bitset} one tick over both inputs (thrust / no thrust)."""
+    mask = (1 << lattice.units) - 1
+    nxt = {}
+    clamped_top = clamped_bottom = False
+    for k, bits in rows.items():
+        for k2 in {max(k - lattice.thrust_k, lattice.min_k), min(k + lattice.gravity_k, lattice.max_k)}:
+            shift = k2 * lattice.shift_per_k
+            if shift >= 0:
+                moved = bits << shift
+                clamped_bottom = clamped_bottom or moved > mask
+                moved &= mask
+            else:
+                clamped_top = clamped_top or bits & ((1 << -shift) - 1) != 0
+                moved = bits >> -shift
+            nxt[k2] = nxt.get(k2, 0) | moved
+    if clamped_top:
+        nxt[0] = nxt.get(0, 0) | 1
+    if clamped_bottom:
+        nxt[0] = nxt.get(0, 0) | (1 << (lattice.units - 1))
+    return nxt
+
+
+def unit_row_masks(cfg, lattice, grid_min_y, grid_max_y):
+    """Per image row y, the bitset of lattice units whose center rounds to y."""
+    masks = []
+    for y in range(grid_min_y, grid_max_y + 1):
+        lo = max(0, math.ceil((y - 0.5 - cfg.clamp_min_y) / lattice.dy))
+        hi = min(lattice.units, math.ceil((y + 0.5 - cfg.clamp_min_y) / lattice.dy))
+        masks.append(((1 << (hi - lo)) - 1) << lo if hi > lo else 0)
+    return masks
+
+
+def units_to_column(bits, row_masks, grid_min_y):
+    column = bytearray(grid_min_y)
+    column += bytes(1 if bits & m else 0 for m in row_masks)
+    return column
+
+
+def analyze_pattern_physics(pattern, cfg, dt, collect_timeline=False):
+    grid_min_y, grid_max_y = grid_bounds(cfg)
+    duration = float(pattern["duration"])
+    lattice = build_physics_lattice(cfg, dt)
+    cursors = pattern_cursors(pattern)
+
+    def span(bits):
+        return bin(bits).count("1") * lattice.dy
+
+    safe = safe_units_at(cursors, 0.0, cfg, lattice)
+    rows = {k: safe for k in range(lattice.min_k, lattice.max_k + 1)} if safe else {}
+    projection = safe
+    min_safe = min_reachable = span(safe)
+    first_frontier_empty_time = None
+
+    safe_timeline = BitTimeline(grid_min_y, grid_max_y) if collect_timeline else None
+    reachable_timeline = BitTimeline(grid_min_y, grid_max_y) if collect_timeline else None
+    row_masks = unit_row_masks(cfg, lattice, grid_min_y, grid_max_y) if collect_timeline else None
+    if collect_timeline:
+        safe_timeline.append(units_to_column(safe, row_masks, grid_min_y))
+        reachable_timeline.append(units_to_column(projection, row_masks, grid_min_y))
+
+    for t in tick_times(duration, dt):
+        safe = safe_units_at(cursors, t, cfg, lattice)
+        rows = {k: bits & safe for k, bits in physics_step(rows, lattice).items() if bits & safe}
+        projection = 0
+        for bits in rows.values():
+            projection |= bits
+        min_safe = min(min_safe, span(safe))
+        min_reachable = min(min_reachable, span(projection))
+        if not rows and first_frontier_empty_time is None:
+            first_frontier_empty_time = t
+        if collect_timeline:
+            safe_timeline.append(units_to_column(safe, row_masks, grid_min_y))
+            reachable_timeline.append(units_to_column(projection, row_masks, grid_min_y))
+
+    return pattern_result(
+        pattern,
+        first_frontier_empty_time=first_frontier_empty_time,
+        min_reachable_count=min_reachable,
+        min_safe_count=min_safe,
+        final_reachable_count=span(projection),
+        final_safe_count=span(safe_units_at(cursors, duration, cfg, lattice)),
+        safe_timeline=safe_timeline,
+        reachable_timeline=reachable_timeline,
+        grid_min_y=grid_min_y,
+        grid_max_y=grid_max_y,
+    )
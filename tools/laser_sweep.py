@@ -0,0 +1,213 @@
+"""
+Parameter sweeps: a grid of SimConfigs evaluated in one NumPy pass.
+"""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import json
+import math
+import sys
+from dataclasses import fields, replace
+
+try:
+    import numpy as np
+except ImportError:  # optional: only the NumPy paths need it
+    np = None
+
+from laser_patterns import EPS, SimConfig
+from laser_model import (
+    compile_pattern,
+    grid_bounds,
+    reach_rows,
+    row_mask,
+    step_frontier,
+    tick_times,
+)
+from laser_grid import blocked_interval_batch, sample_laser_batch
+
+# ---------------------------------------------------------------------------
+# Parameter sweeps
+# Every SimConfig in a sweep is evaluated in one NumPy pass: the config fields
+# become (configs, 1) arrays, so the numpy backend's batch helpers broadcast
+# to one row of results per config. Rows share a grid sized for the tallest
+# config and rows outside a config's own grid are simply never safe, so each
+# config gets exactly its analyze_pattern_numpy result. The safe matrix is
+# built for every config at once in chunks of at most SWEEP_CHUNK_CELLS cells.
+# Reachability uses the numpy backend's int bitsets, with every config of a
+# batch packed side by side into one int: config c owns a lane of bits, and a
+# zero guard at the top of each lane, at least one tick's reach wide, keeps
+# step_frontier from spreading rows into a neighbouring config. Configs are
+# batched by dt and reach_rows, so one dilation serves the whole batch.
+# ---------------------------------------------------------------------------
+
+SWEEP_CHUNK_CELLS = 1 << 20
+# Inputs of the grid model; gravity/thrust/clamps only matter to the physics backend.
+SWEEP_FIELDS = (
+    "ground_y", "player_height", "player_width", "player_col_x",
+    "laser_beam_thickness", "terminal_vel_up", "terminal_vel_down", "dt",
+)
+
+
+def parse_sweep_arg(text):
+    """'field=start:stop:step' (stop inclusive) or 'field=v1,v2,...' -> (field, values)."""
+    name, sep, spec = text.partition("=")
+    if not sep or name not in SWEEP_FIELDS:
+        raise ValueError("--sweep expects FIELD=START:STOP:STEP or FIELD=V1,V2,... "
+                         "with FIELD one of: {}".format(", ".join(SWEEP_FIELDS)))
+    if ":" not in spec:
+        return name, [float(v) for v in spec.split(",")]
+    start, stop, step = (float(v) for v in spec.split(":"))
+    if step <= 0 or stop < start:
+        raise ValueError("--sweep {}: need STEP > 0 and STOP >= START".format(name))
+    count = int(math.floor((stop - start) / step + EPS)) + 1
+    return name, [start + i * step for i in range(count)]
+
+
+def sweep_config(base, point):
+    """SimConfig for one sweep point; player_col_x follows a swept player_width."""
+    overrides = {k: v for k, v in point.items() if k != "dt"}
+    if "player_width" in overrides and "player_col_x" not in overrides:
+        overrides["player_col_x"] = base.player_col_x + (overrides["player_width"] - base.player_width) / 2.0
+    return replace(base, **overrides)
+
+
+def stack_configs(cfgs):
+    return SimConfig(**{
+        f.name: np.array([getattr(cfg, f.name) for cfg in cfgs], dtype=float)[:, None]
+        for f in fields(SimConfig)
+    })
+
+
+def batched_safe_block(samples, start, stop, stacked, grid_min, grid_max, valid):
+    """compute_safe_matrix for ticks [start, stop) and every config: (ticks, rows, configs)."""
+    rows, n_cfg = valid.shape
+    n_ticks = stop - start
+    width = rows + 1
+    diff = np.zeros(n_ticks * width * n_cfg, dtype=np.int32)
+    base = np.arange(n_ticks)[None, :] * width * n_cfg + np.arange(n_cfg)[:, None]
+
+    for x1, y1, x2, y2, active in samples:
+        coords = (c[None, start:stop] for c in (x1, y1, x2, y2))
+        lo_raw, hi_raw, hit = blocked_interval_batch(*coords, stacked)
+        lo = np.clip(np.ceil(lo_raw), grid_min[:, None], grid_max[:, None]).astype(np.int64)
+        hi = np.clip(np.floor(hi_raw), grid_min[:, None], grid_max[:, None]).astype(np.int64)
+        use = active[None, start:stop] & hit & (hi >= lo)
+        # One interval per (tick, config) per laser, so these indices never repeat.
+        diff[base[use] + lo[use] * n_cfg] += 1
+        diff[base[use] + (hi[use] + 1) * n_cfg] -= 1
+
+    blocked = np.cumsum(diff.reshape(n_ticks, width, n_cfg), axis=1)[:, :rows, :] > 0
+    return ~blocked & valid[None, :, :]
+
+
+def lane_bits(rows, up_rows, down_rows):
+    """Bits per config lane: the shared rows plus a zero guard at least one tick's
+    reach wide, rounded up to whole bytes."""
+    return -(-(rows + max(up_rows, down_rows)) // 8) * 8
+
+
+def packed_lanes(block, lane):
+    """(ticks, rows, configs) safe block -> one int per tick holding config c in bits [c * lane, (c + 1) * lane)."""
+    n_ticks, rows, n_cfg = block.shape
+    lanes = np.zeros((n_ticks, n_cfg, lane), dtype=bool)
+    lanes[:, :, :rows] = block.transpose(0, 2, 1)
+    packed = np.packbits(lanes, axis=2, bitorder="little").reshape(n_ticks, -1)
+    return [int.from_bytes(row.tobytes(), "little") for row in packed]
+
+
+def lane_counts(bitsets, n_cfg, lane):
+    """Set bits per config lane of each bitset: (ticks, configs)."""
+    n_bytes = n_cfg * lane // 8
+    raw = np.frombuffer(b"".join(bits.to_bytes(n_bytes, "little") for bits in bitsets), dtype=np.uint8)
+    return np.unpackbits(raw).reshape(len(bitsets), n_cfg, lane).sum(axis=2, dtype=np.int64)
+
+
+def first_empty_ticks(counts, start):
+    """Per config, the first tick > 0 of a (ticks, configs) count block starting at `start` with no rows; -1 if none."""
+    ticks = np.arange(start, start + len(counts))[:, None]
+    empty = (counts == 0) & (ticks > 0)
+    return np.where(empty.any(axis=0), np.argmax(empty, axis=0) + start, -1)
+
+
+def analyze_sweep_batch(pattern, cfgs, dt):
+    """analyze_pattern_numpy for many configs sharing one reach_rows at once.
+
+    Returns one (first_frontier_empty_time, min_reachable, min_safe) per config.
+    """
+    up_rows, down_rows = reach_rows(cfgs[0], dt)
+    if any(reach_rows(cfg, dt) != (up_rows, down_rows) for cfg in cfgs):
+        raise ValueError("analyze_sweep_batch: every config in a batch needs the same reach_rows")
+    stacked = stack_configs(cfgs)
+    grid_min, grid_max = (np.array(bounds) for bounds in zip(*(grid_bounds(cfg) for cfg in cfgs)))
+    rows = int(grid_max.max()) + 1
+    row_ids = np.arange(rows)
+    valid = (row_ids[:, None] >= grid_min[None, :]) & (row_ids[:, None] <= grid_max[None, :])
+
+    times = np.array([0.0] + tick_times(float(pattern["duration"]), dt))
+    samples = [sample_laser_batch(laser, times) for laser in compile_pattern(pattern)]
+    n_cfg, lane = len(cfgs), lane_bits(rows, up_rows, down_rows)
+    mask = row_mask(n_cfg * lane)
+    chunk = max(1, SWEEP_CHUNK_CELLS // (n_cfg * (rows + 1)))
+
+    reachable = None
+    empty_tick = np.full(n_cfg, -1)
+    min_reachable = np.full(n_cfg, rows)
+    min_safe = np.full(n_cfg, rows)
+    for start in range(0, len(times), chunk):
+        block = batched_safe_block(samples, start, min(start + chunk, len(times)), stacked, grid_min, grid_max, valid)
+        np.minimum(min_safe, np.count_nonzero(block, axis=1).min(axis=0), out=min_safe)
+        frontiers = []
+        for safe in packed_lanes(block, lane):
+            reachable = safe if reachable is None else step_frontier(reachable, safe, up_rows, down_rows, mask)
+            frontiers.append(reachable)
+        counts = lane_counts(frontiers, n_cfg, lane)
+        np.minimum(min_reachable, counts.min(axis=0), out=min_reachable)
+        empty_tick = np.where(empty_tick < 0, first_empty_ticks(counts, start), empty_tick)
+
+    return [
+        (times[tick] if tick >= 0 else None, int(reach), int(safe))
+        for tick, reach, safe in zip(empty_tick, min_reachable, min_safe)
+    ]
+
+
+def run_sweep(patterns, base_cfg, base_dt, specs):
+    """Evaluate every combination of `specs` for every pattern; one dict per (pattern, point)."""
+    names = [name for name, _ in specs]
+    points = [dict(zip(names, combo)) for combo in itertools.product(*(values for _, values in specs))]
+    batches = {}
+    for i, point in enumerate(points):
+        dt, cfg = point.get("dt", base_dt), sweep_config(base_cfg, point)
+        batches.setdefault((dt, reach_rows(cfg, dt)), []).append((i, cfg))
+
+    table = []
+    for pattern in patterns:
+        outcomes = [None] * len(points)
+        for (dt, _), members in batches.items():
+            indices, cfgs = zip(*members)
+            for i, outcome in zip(indices, analyze_sweep_batch(pattern, cfgs, dt)):
+                outcomes[i] = outcome
+        for point, (empty_time, min_reachable, min_safe) in zip(points, outcomes):
+            table.append(dict(
+                pattern=pattern.get("id", "unknown"), **point,
+                solvable=empty_time is None, min_reachable=min_reachable, min_safe=min_safe,
+                frontier_empty_time=empty_time,
+            ))
+    return table
+
+
+def write_sweep_table(table, path):
+    """JSON if `path` ends in .json, otherwise CSV; stdout when path is None."""
+    if path and path.endswith(".json"):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(table, f, indent=2)
+        return
+    out = open(path, "w", newline="", encoding="utf-8") if path else sys.stdout
+    try:
+        writer = csv.DictWriter(out, fieldnames=list(table[0]))
+        writer.writeheader()
+        writer.writerows(table)
+    finally:
+        if path:
+            out.close()
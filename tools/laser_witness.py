@@ -0,0 +1,105 @@
+"""
+Witness trajectories: one surviving (or longest-surviving) path per pattern.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+
+from laser_model import (
+    grid_bounds,
+    pattern_cursors,
+    reach_rows,
+    row_mask,
+    safe_bits_at,
+    step_frontier,
+    tick_times,
+)
+from laser_images import output_basename
+
+# ---------------------------------------------------------------------------
+# Witness trajectories
+# A surviving path (or, for a failing pattern, the path to the last tick with
+# a non-empty frontier) is recovered backwards from the reachable sets: any
+# row reachable at tick k + 1 has a reachable source at tick k within
+# [y - down, y + up]. Only every WITNESS_CHECKPOINT_TICKS-th reachable set is
+# kept (as an int bitset); the backward pass recomputes one segment at a time
+# from its checkpoint, so memory is O(ticks / checkpoint + checkpoint) sets.
+# Uses the grid model with the python backend's reach.
+# ---------------------------------------------------------------------------
+
+WITNESS_CHECKPOINT_TICKS = 64
+
+
+def nearest_set_bit(bits, target):
+    """Index of the set bit closest to `target` (bits must be non-zero)."""
+    below = bits & ((1 << (target + 1)) - 1)
+    above = bits >> target
+    best_below = below.bit_length() - 1 if below else None
+    best_above = target + (above & -above).bit_length() - 1 if above else None
+    if best_below is None:
+        return best_above
+    if best_above is None or target - best_below <= best_above - target:
+        return best_below
+    return best_above
+
+
+def witness_trajectory(pattern, cfg, dt):
+    """Backtracked witness: dict with tick times, one center Y per tick and whether it survives."""
+    grid_min_y, grid_max_y = grid_bounds(cfg)
+    height = grid_max_y - grid_min_y + 1
+    mask = row_mask(height)
+    up_rows, down_rows = reach_rows(cfg, dt)
+    times = [0.0] + tick_times(float(pattern["duration"]), dt)
+    cursors = pattern_cursors(pattern)
+
+    def safe_at(k):
+        return safe_bits_at(cursors, times[k], cfg, grid_min_y, grid_max_y)
+
+    def advance(reachable, k):
+        return step_frontier(reachable, safe_at(k), up_rows, down_rows, mask)
+
+    reachable = safe_at(0)
+    checkpoints = [reachable]
+    last = 0
+    for k in range(1, len(times)):
+        nxt = advance(reachable, k)
+        if not nxt:
+            break
+        reachable, last = nxt, k
+        if k % WITNESS_CHECKPOINT_TICKS == 0:
+            checkpoints.append(reachable)
+
+    rows = [0] * (last + 1)
+    if reachable:
+        rows[last] = nearest_set_bit(reachable, height // 2)
+    for seg_start in reversed(range(0, last + 1, WITNESS_CHECKPOINT_TICKS)):
+        segment = [checkpoints[seg_start // WITNESS_CHECKPOINT_TICKS]]
+        for k in range(seg_start + 1, min(seg_start + WITNESS_CHECKPOINT_TICKS, last + 1)):
+            segment.append(advance(segment[-1], k))
+        for k in range(seg_start + len(segment) - 1, seg_start - 1, -1):
+            if k == last:
+                continue
+            nxt = rows[k + 1]
+            lo, hi = max(0, nxt - down_rows), min(height - 1, nxt + up_rows)
+            sources = segment[k - seg_start] & (((1 << (hi - lo + 1)) - 1) << lo)
+            rows[k] = nearest_set_bit(sources, nxt)
+
+    return {
+        "pattern_id": pattern.get("id", "unknown"),
+        "name": pattern.get("name", pattern.get("id", "unknown")),
+        "dt": dt,
+        "survives": last == len(times) - 1 and reachable != 0,
+        "times": times[:last + 1],
+        "ys": [grid_min_y + r for r in rows] if reachable else [],
+    }
+
+
+def write_witness(witness, out_dir):
+    os.makedirs(out_dir, exist_ok=True)
+    base = output_basename(witness["pattern_id"], witness["name"])
+    out_path = os.path.join(out_dir, "{}.witness.json".format(base))
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(witness, f)
+    return out_path
@@ -3,753 +3,222 @@
 Offline laser pattern solvability checker.
 
 Tracks reachable Y positions at the player column over time to determine
-if a pattern is survivable. Optionally writes timeline images (PPM).
+if a pattern is survivable, and (with --clearance) how much clearance the player
+has along the way. Optionally writes timeline and clearance heatmap images
+(BMP or PNG).
+
+Patterns and config come from js/data/laserPatterns.js and js/config.js via
+tools/export_laser_patterns.mjs (needs Node); the export is snapshotted and
+only re-run when one of its source files changes. --source python checks the
+hand-ported copies in laser_patterns.py
+instead.
 
 Usage:
     python tools/verify_laser_solvability.py
     python tools/verify_laser_solvability.py --pattern M2
     python tools/verify_laser_solvability.py --image-dir debug/laser_solvability
+    python tools/verify_laser_solvability.py --backend numpy --dt 0.004166
+    python tools/verify_laser_solvability.py --backend intervals
+    python tools/verify_laser_solvability.py --backend event
+    python tools/verify_laser_solvability.py --backend loop
+    python tools/verify_laser_solvability.py --backend physics
+    python tools/verify_laser_solvability.py --backend adaptive --dt 0.002
+    python tools/verify_laser_solvability.py --sweep player_height=32:48:1 \
+        --sweep laser_beam_thickness=12:20:1 --sweep-out sweep.csv
+    python tools/verify_laser_solvability.py --clearance --image-dir debug/laser_solvability
+    python tools/verify_laser_solvability.py --margins
+    python tools/verify_laser_solvability.py --monte-carlo 100000
+    python tools/verify_laser_solvability.py --witness debug/witness --image-dir debug/witness
+    python tools/verify_laser_solvability.py --jobs 4
+    python tools/verify_laser_solvability.py --watch --image-dir debug/laser_solvability
+    python tools/verify_laser_solvability.py --no-cache
+    python tools/verify_laser_solvability.py --rebuild
+    python tools/verify_laser_solvability.py --source python
 """
 
 from __future__ import annotations
 
 import argparse
-import math
 import os
 import sys
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
-
-# ---------------------------------------------------------------------------
-# Game constants (must match js/config.js)
-# ---------------------------------------------------------------------------
-
-CANVAS_WIDTH = 800
-GROUND_Y = 400
-PLAYER_HEIGHT = 40
-PLAYER_WIDTH = 36
-PLAYER_START_X = 100
-LASER_BEAM_THICKNESS = 16
-TERMINAL_VEL_UP = 380
-TERMINAL_VEL_DOWN = 450
-
-EPS = 1e-6
-
-# ---------------------------------------------------------------------------
-# Pattern generation helpers (ported from js/data/laserPatterns.js)
-# ---------------------------------------------------------------------------
-
-def h_beam(t: float, y: float, state: str) -> Dict:
-    return {"t": t, "x1": 0, "y1": y, "x2": CANVAS_WIDTH, "y2": y, "state": state}
-
-
-def arc_sweep(pivot_x, pivot_y, length, t_start, t_end, angle_start, angle_end, num_steps, state):
-    kf = []
-    for i in range(num_steps + 1):
-        frac = i / num_steps
-        t = t_start + (t_end - t_start) * frac
-        a = angle_start + (angle_end - angle_start) * frac
-        kf.append({
-            "t": t,
-            "x1": pivot_x, "y1": pivot_y,
-            "x2": pivot_x + length * math.cos(a),
-            "y2": pivot_y + length * math.sin(a),
-            "state": state,
-        })
-    return kf
-
-
-# ---------------------------------------------------------------------------
-# M1: The Sweep
-# ---------------------------------------------------------------------------
-
-def build_m1():
-    return {
-        "id": "H3", "name": "H3: Sky Lanes", "tier": "hard",
-        "duration": 11.0,
-        "lasers": [{"loop": True, "keyframes": [
-            h_beam(0.00, GROUND_Y, "warn"),
-            h_beam(1.50, 200,      "active"),
-            h_beam(2.75, 0,        "warn"),
-            h_beam(4.25, 200,      "active"),
-            h_beam(5.50, GROUND_Y, "warn"),
-        ]}],
-    }
-
-
-# ---------------------------------------------------------------------------
-# M2: Crossing Edges
-# ---------------------------------------------------------------------------
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Dict, Optional
+
+try:
+    import numpy as np
+except ImportError:  # optional: only the NumPy paths need it
+    np = None
+
+from laser_patterns import SimConfig
+from laser_export import (
+    export_source_files,
+    load_exported_payload,
+    load_patterns,
+    sim_config_from_export,
+)
+from laser_grid import analyze_pattern, analyze_pattern_numpy
+from laser_intervals import analyze_pattern_intervals
+from laser_event import analyze_pattern_event
+from laser_loop import analyze_pattern_loop
+from laser_physics import analyze_pattern_physics, build_physics_lattice
+from laser_adaptive import analyze_pattern_adaptive
+from laser_images import IMAGE_WRITERS, render_pattern_timeline_image
+from laser_witness import witness_trajectory, write_witness
+from laser_clearance import (
+    CLEARANCE_BUCKETS,
+    CLEARANCE_BUCKET_PX,
+    CLEARANCE_PERCENTILES,
+    clearance_field,
+    render_clearance_image,
+)
+from laser_cache import DEFAULT_CACHE_DIR, load_cached_result, result_cache_key, store_cached_result
+from laser_sweep import parse_sweep_arg, run_sweep, write_sweep_table
+from laser_margins import MarginJob, pattern_margins, print_margins
+from laser_monte_carlo import MonteCarloJob, monte_carlo_survival, print_monte_carlo
+
+# ---------------------------------------------------------------------------
+# Backends
+# ---------------------------------------------------------------------------
+
+ANALYZERS = {
+    "python": analyze_pattern,
+    "numpy": analyze_pattern_numpy,
+    "intervals": analyze_pattern_intervals,
+    "event": analyze_pattern_event,
+    "loop": analyze_pattern_loop,
+    "physics": analyze_pattern_physics,
+    "adaptive": analyze_pattern_adaptive,
+}
+
+
+# ---------------------------------------------------------------------------
+# Parallel verification
+# Patterns are independent, so analysis + rendering fan out over a process
+# pool. Timelines stay in the worker; only the summary comes back.
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class VerifyJob:
+    pattern: Dict
+    cfg: SimConfig
+    dt: float
+    backend: str
+    image_dir: Optional[str] = None
+    image_format: str = "bmp"
+    cache_dir: Optional[str] = None  # None disables the result cache
+    rebuild: bool = False  # ignore cached entries but still refresh them
+    witness_dir: Optional[str] = None
+    clearance: bool = False
+
+
+def analyze_job(job):
+    """Run the job's analyzer, going through the result cache when enabled."""
+    need_timeline = bool(job.image_dir) or job.clearance
+    if not job.cache_dir:
+        return ANALYZERS[job.backend](job.pattern, job.cfg, job.dt, collect_timeline=need_timeline)
+    key = result_cache_key(job.pattern, job.cfg, job.dt, job.backend)
+    result = None if job.rebuild else load_cached_result(job.cache_dir, key, need_timeline)
+    if result is None:
+        result = ANALYZERS[job.backend](job.pattern, job.cfg, job.dt, collect_timeline=need_timeline)
+        store_cached_result(job.cache_dir, key, result)
+    return result
+
+
+def run_verify_job(job):
+    """Analyze, then optionally measure clearance, extract a witness and render one pattern.
+
+    Returns (result, image_paths, witness_path).
+    """
+    result = analyze_job(job)
+    witness = witness_path = clearance = None
+    image_paths = []
+    if job.clearance and result.safe_timeline is not None:
+        clearance = clearance_field(result, job.dt, heatmap=bool(job.image_dir))
+        result = replace(result, clearance_px=clearance.px_percentiles, clearance_s=clearance.s_percentiles,
+                         clearance_beam_free=clearance.beam_free_fraction,
+                         clearance_never_blocked=clearance.never_blocked_fraction)
+    if job.witness_dir:
+        witness = witness_trajectory(job.pattern, job.cfg, job.dt)
+        witness_path = write_witness(witness, job.witness_dir)
+    if job.image_dir:
+        witness_ys = witness["ys"] if witness else None
+        image_paths.append(render_pattern_timeline_image(result, job.image_dir, job.image_format, witness_ys))
+        if clearance:
+            image_paths.append(render_clearance_image(result, clearance.index_rows, job.image_dir, job.image_format))
+    image_paths = [path for path in image_paths if path]
+    return replace(result, safe_timeline=None, reachable_timeline=None), image_paths, witness_path
+
+
+def run_parallel(fn, jobs, workers, pool=None):
+    """Map `fn` over jobs on up to `workers` processes (reusing `pool` if given);
+    outcomes come back in job order."""
+    if workers <= 1 or len(jobs) <= 1:
+        return [fn(job) for job in jobs]
+    if pool:
+        return list(pool.map(fn, jobs))
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        return list(pool.map(fn, jobs))
+
+
+def run_verify_jobs(jobs, workers):
+    return run_parallel(run_verify_job, jobs, workers)
 
-M2_SQ_LEFT = 80
-M2_SQ_TOP = 0
-M2_SQ_SIZE = GROUND_Y
-M2_CYCLE = 10.0
-M2_ACTIVE_START = 0.70
-M2_ACTIVE_END = 0.95
-M2_SAMPLES = 40
-
-M2_ACTIVE_WINDOWS = [
-    {"start": M2_ACTIVE_START, "end": M2_ACTIVE_END},
-    {"start": (M2_ACTIVE_START + 0.5) % 1, "end": (M2_ACTIVE_END + 0.5) % 1},
-]
-
-
-def square_edge_point(p):
-    turn = ((p % 1) + 1) % 1
-    q = turn * 4
-    left = M2_SQ_LEFT
-    top = M2_SQ_TOP
-    right = M2_SQ_LEFT + M2_SQ_SIZE
-    bottom = M2_SQ_TOP + M2_SQ_SIZE
-
-    if q < 1:
-        return (left + M2_SQ_SIZE * q, top)
-    if q < 2:
-        return (right, top + M2_SQ_SIZE * (q - 1))
-    if q < 3:
-        return (right - M2_SQ_SIZE * (q - 2), bottom)
-    return (left, bottom - M2_SQ_SIZE * (q - 3))
-
-
-def is_in_wrapped_window(p, start, end):
-    if start <= end:
-        return p >= start and p < end
-    return p >= start or p < end
-
-
-def is_in_any_active_window(p):
-    for w in M2_ACTIVE_WINDOWS:
-        if is_in_wrapped_window(p, w["start"], w["end"]):
-            return True
-    return False
-
-
-def build_m2_square_orbit_keyframes(phase_offset):
-    times = {0.0, M2_CYCLE}
-    for w in M2_ACTIVE_WINDOWS:
-        ts = (((w["start"] - phase_offset) % 1) + 1) % 1 * M2_CYCLE
-        te = (((w["end"] - phase_offset) % 1) + 1) % 1 * M2_CYCLE
-        times.add(ts)
-        times.add(te)
-    for i in range(1, M2_SAMPLES):
-        times.add((i / M2_SAMPLES) * M2_CYCLE)
-
-    sorted_times = sorted(times)
-    kf = []
-    for t in sorted_times:
-        p = ((t / M2_CYCLE) + phase_offset) % 1
-        ax, ay = square_edge_point(p)
-        bx, by = square_edge_point((p + 0.5) % 1)
-        state = "active" if is_in_any_active_window(p) else "off"
-        kf.append({"t": t, "x1": ax, "y1": ay, "x2": bx, "y2": by, "state": state})
-    return kf
-
-
-def build_m2():
-    return {
-        "id": "H4", "name": "H4: Orbit Cross", "tier": "hard",
-        "duration": 12.0,
-        "lasers": [
-            {"loop": True, "keyframes": build_m2_square_orbit_keyframes(0.00)},
-            {"loop": True, "keyframes": build_m2_square_orbit_keyframes(0.25)},
-        ],
-    }
 
-
-# ---------------------------------------------------------------------------
-# Path-first helpers
-# ---------------------------------------------------------------------------
-
-def build_corridor_beam_keyframes(waypoints, gap, side, cycle_duration):
-    side_sign = -1 if side == "top" else 1
-
-    def y_for_center(center_y):
-        return center_y + side_sign * gap * 0.5
-
-    first = waypoints[0]
-    last = waypoints[-1]
-    keyframes = [
-        h_beam(0.0, y_for_center(first["center_y"]), "off"),
-        h_beam(first["t"], y_for_center(first["center_y"]), "active"),
-    ]
-    keyframes += [h_beam(w["t"], y_for_center(w["center_y"]), "active") for w in waypoints[1:]]
-    keyframes += [
-        h_beam(last["t"], y_for_center(last["center_y"]), "off"),
-        h_beam(cycle_duration, y_for_center(first["center_y"]), "off"),
-    ]
-    return keyframes
-
-
-def build_corridor_pattern(pattern_id, name, tier, duration, cycle_duration, gap, waypoints):
-    return {
-        "id": pattern_id,
-        "name": name,
-        "tier": tier,
-        "duration": duration,
-        "lasers": [
-            {"loop": True, "keyframes": build_corridor_beam_keyframes(waypoints, gap, "top", cycle_duration)},
-            {"loop": True, "keyframes": build_corridor_beam_keyframes(waypoints, gap, "bottom", cycle_duration)},
-        ],
-    }
-
-
-def is_in_window(t, window):
-    return t >= window["start"] and t < window["end"]
-
-
-def pulse_state_at(t, windows):
-    for window in windows:
-        if is_in_window(t, window):
-            return "active"
-    return "off"
-
-
-def build_pulse_beam_keyframes(y, windows, cycle_duration):
-    times = {0.0, cycle_duration}
-    for window in windows:
-        times.add(window["start"])
-        times.add(window["end"])
-    return [h_beam(t, y, pulse_state_at(t, windows)) for t in sorted(times)]
-
-
-def build_timed_gate_pattern(pattern_id, name, tier, duration, cycle_duration, beams):
-    return {
-        "id": pattern_id,
-        "name": name,
-        "tier": tier,
-        "duration": duration,
-        "lasers": [
-            {"loop": True, "keyframes": build_pulse_beam_keyframes(beam["y"], beam["windows"], cycle_duration)}
-            for beam in beams
-        ],
-    }
-
-
-def build_sine_waypoints(start_t, end_t, samples, center_y, amplitude, period):
-    waypoints = []
-    for i in range(samples + 1):
-        frac = i / samples
-        t = start_t + (end_t - start_t) * frac
-        phase = (t - start_t) / period
-        waypoints.append({
-            "t": t,
-            "center_y": center_y + amplitude * math.sin(phase * math.pi * 2),
-        })
-    return waypoints
-
-
-def build_down_up_sine_waypoints(start_t, end_t, samples, center_y, wave_amplitude, wave_period, trend_amplitude):
-    waypoints = []
-    for i in range(samples + 1):
-        frac = i / samples
-        t = start_t + (end_t - start_t) * frac
-        wave_phase = ((t - start_t) / wave_period) * math.pi * 2
-        wave = wave_amplitude * math.sin(wave_phase)
-        # Down then up over one cycle: 0 -> +trend_amplitude -> 0.
-        trend = trend_amplitude * (1 - math.cos(frac * math.pi * 2)) * 0.5
-        waypoints.append({
-            "t": t,
-            "center_y": center_y + trend + wave,
-        })
-    return waypoints
-
-
-# ---------------------------------------------------------------------------
-# H1: Ribbon Ride (gentle curved lane)
 # ---------------------------------------------------------------------------
-
-def build_h1():
-    return build_corridor_pattern(
-        pattern_id="H1",
-        name="H1: Serpent Run",
-        tier="hard",
-        duration=12.0,
-        cycle_duration=6.0,
-        gap=204,
-        waypoints=build_sine_waypoints(1.0, 5.0, 20, 200, 74, 4.4),
-    )
-
-
-# ---------------------------------------------------------------------------
-# H2: Double Curl (deeper curved lane)
+# Report
 # ---------------------------------------------------------------------------
 
-def build_h2():
-    waypoints = build_sine_waypoints(1.0, 5.0, 24, 200, 52, 2.6)
-    return {
-        "id": "H2",
-        "name": "H2: Twin Arcs",
-        "tier": "hard",
-        "duration": 12.0,
-        "lasers": [
-            {"loop": True, "keyframes": build_corridor_beam_keyframes(waypoints, 160, "top", 6.0)},
-            {"loop": True, "keyframes": build_corridor_beam_keyframes(waypoints, 160, "bottom", 6.0)},
-            {"loop": True, "keyframes": build_corridor_beam_keyframes(waypoints, 300, "top", 6.0)},
-            {"loop": True, "keyframes": build_corridor_beam_keyframes(waypoints, 300, "bottom", 6.0)},
-        ],
-    }
-
+def format_percentiles(template, values):
+    return "/".join(template.format(v) for v in values) if values is not None else "-"
 
-# ---------------------------------------------------------------------------
-# X1: Wave Riptide (moving safe path)
-# ---------------------------------------------------------------------------
 
-def build_x1():
-    waypoints = build_down_up_sine_waypoints(
-        start_t=1.0,
-        end_t=5.2,
-        samples=28,
-        center_y=170,
-        wave_amplitude=36,
-        wave_period=2.2,
-        trend_amplitude=66,
-    )
-    return {
-        "id": "X1",
-        "name": "X1: Cyclone Ribbon",
-        "tier": "extreme",
-        "duration": 12.0,
-        "lasers": [
-            {"loop": True, "keyframes": build_corridor_beam_keyframes(waypoints, 152, "top", 6.0)},
-            {"loop": True, "keyframes": build_corridor_beam_keyframes(waypoints, 152, "bottom", 6.0)},
-            {"loop": True, "keyframes": build_corridor_beam_keyframes(waypoints, 286, "top", 6.0)},
-            {"loop": True, "keyframes": build_corridor_beam_keyframes(waypoints, 286, "bottom", 6.0)},
-        ],
-    }
-
-
-def build_x2():
-    return build_timed_gate_pattern(
-        pattern_id="X2",
-        name="X2: Pulse Matrix",
-        tier="extreme",
-        duration=7.2,
-        cycle_duration=7.2,
-        beams=[
-            {"y": 80, "windows": [{"start": 1.0, "end": 1.8}, {"start": 4.6, "end": 5.4}]},
-            {"y": 140, "windows": [{"start": 2.4, "end": 3.2}, {"start": 6.0, "end": 6.8}]},
-            {"y": 200, "windows": [{"start": 1.0, "end": 1.8}, {"start": 4.6, "end": 5.4}]},
-            {"y": 260, "windows": [{"start": 2.4, "end": 3.2}, {"start": 6.0, "end": 6.8}]},
-            {"y": 320, "windows": [{"start": 1.0, "end": 1.8}, {"start": 4.6, "end": 5.4}]},
-        ],
-    )
+def loop_verdict_text(r):
+    if r.survives_indefinitely is None:
+        return "undecided"
+    if r.survives_indefinitely:
+        return "survives indefinitely"
+    return "frontier empties (past the pattern's duration)" if r.solvable else "frontier empties"
 
 
-# ---------------------------------------------------------------------------
-# X3: Gap Shift Matrix
-# Six-laser extreme with forced adjacent gap sequence.
-# ---------------------------------------------------------------------------
-
-X3_ROWS_A = [40, 85, 130, 270, 315, 360]  # gap 3-4
-X3_ROWS_B = [40, 85, 225, 270, 315, 360]  # gap 2-3
-X3_ROWS_C = [40, 85, 130, 175, 315, 360]  # gap 4-5
-X3_ROWS_D = [40, 180, 225, 270, 315, 360]  # gap 1-2
-X3_ROWS_E = [40, 85, 130, 175, 220, 360]  # gap 5-6
-X3_EVENTS = [
-    {"t": 0.0, "rows": X3_ROWS_A, "state": "off"},
-    {"t": 1.0, "rows": X3_ROWS_A, "state": "active"},  # gap 3-4
-    {"t": 1.8, "rows": X3_ROWS_A, "state": "off"},
-    {"t": 2.6, "rows": X3_ROWS_B, "state": "active"},  # gap 2-3
-    {"t": 3.4, "rows": X3_ROWS_B, "state": "off"},
-    {"t": 4.2, "rows": X3_ROWS_C, "state": "active"},  # gap 4-5
-    {"t": 5.0, "rows": X3_ROWS_C, "state": "off"},
-    {"t": 5.8, "rows": X3_ROWS_D, "state": "active"},  # gap 1-2
-    {"t": 6.6, "rows": X3_ROWS_D, "state": "off"},
-    {"t": 7.4, "rows": X3_ROWS_E, "state": "active"},  # gap 5-6
-    {"t": 8.2, "rows": X3_ROWS_E, "state": "off"},
-    {"t": 9.0, "rows": X3_ROWS_A, "state": "active"},  # return to gap 3-4
-    {"t": 9.8, "rows": X3_ROWS_A, "state": "off"},
-    {"t": 10.4, "rows": X3_ROWS_A, "state": "off"},
-]
-
-
-def build_x3_gap_shift_keyframes(laser_index):
-    return [h_beam(event["t"], event["rows"][laser_index], event["state"]) for event in X3_EVENTS]
-
-
-def build_x3():
-    return {
-        "id": "X3",
-        "name": "X3: Gap Shift Matrix",
-        "tier": "extreme",
-        "duration": 10.4,
-        "lasers": [
-            {"loop": True, "keyframes": build_x3_gap_shift_keyframes(i)}
-            for i in range(6)
-        ],
-    }
-
-
-def build_m3():
-    return build_corridor_pattern(
-        pattern_id="M1",
-        name="M1: Breezy Bend",
-        tier="medium",
-        duration=12.0,
-        cycle_duration=6.5,
-        gap=232,
-        waypoints=build_sine_waypoints(1.0, 5.4, 20, 205, 66, 3.4),
-    )
-
-
-def build_m4():
-    return build_timed_gate_pattern(
-        pattern_id="M2",
-        name="M2: Easy Beat",
-        tier="medium",
-        duration=12.0,
-        cycle_duration=6.5,
-        beams=[
-            {"y": 130, "windows": [{"start": 1.1, "end": 1.9}, {"start": 4.2, "end": 5.0}]},
-            {"y": 270, "windows": [{"start": 2.2, "end": 3.0}, {"start": 5.2, "end": 6.0}]},
-        ],
+def print_result(r):
+    status = "PASS" if r.solvable else "FAIL"
+    print(
+        "[{}] {:<3} {} | minReachable={:g}, minSafe={:g}, finalReachable={:g}/{:g}".format(
+            status, r.pattern_id, r.name,
+            r.min_reachable_count, r.min_safe_count,
+            r.final_reachable_count, r.final_safe_count,
+        )
     )
-
-
-def build_all_patterns():
-    return [
-        build_m3(),
-        build_m4(),
-        build_h1(),
-        build_h2(),
-        build_m1(),
-        build_m2(),
-        build_x1(),
-        build_x2(),
-        build_x3(),
-    ]
-
-
-# ---------------------------------------------------------------------------
-# Simulation config
-# ---------------------------------------------------------------------------
-
-@dataclass
-class SimConfig:
-    ground_y: float = GROUND_Y
-    player_height: float = PLAYER_HEIGHT
-    player_width: float = PLAYER_WIDTH
-    player_col_x: float = PLAYER_START_X + PLAYER_WIDTH / 2.0
-    laser_beam_thickness: float = LASER_BEAM_THICKNESS
-    terminal_vel_up: float = TERMINAL_VEL_UP
-    terminal_vel_down: float = TERMINAL_VEL_DOWN
-
-
-# ---------------------------------------------------------------------------
-# Keyframe sampling
-# ---------------------------------------------------------------------------
-
-def sample_laser(keyframes, elapsed, loop):
-    n = len(keyframes)
-    if n == 0:
-        return None
-    last_t = float(keyframes[-1]["t"])
-    t = elapsed
-    if loop and last_t > 0:
-        t = elapsed % last_t
-    if t <= float(keyframes[0]["t"]):
-        return keyframes[0]
-    if t >= last_t:
-        return keyframes[-1]
-
-    i = 0
-    while i < n - 1 and float(keyframes[i + 1]["t"]) <= t:
-        i += 1
-    a = keyframes[i]
-    b = keyframes[i + 1]
-    seg = float(b["t"]) - float(a["t"])
-    frac = (t - float(a["t"])) / seg if seg > 0 else 0.0
-    return {
-        "x1": float(a["x1"]) + (float(b["x1"]) - float(a["x1"])) * frac,
-        "y1": float(a["y1"]) + (float(b["y1"]) - float(a["y1"])) * frac,
-        "x2": float(a["x2"]) + (float(b["x2"]) - float(a["x2"])) * frac,
-        "y2": float(a["y2"]) + (float(b["y2"]) - float(a["y2"])) * frac,
-        "state": a["state"],
-    }
-
-
-# ---------------------------------------------------------------------------
-# Blocked interval at player column
-# ---------------------------------------------------------------------------
-
-def blocked_interval_at_column(sample, cfg):
-    x1, y1 = float(sample["x1"]), float(sample["y1"])
-    x2, y2 = float(sample["x2"]), float(sample["y2"])
-    dx, dy = x2 - x1, y2 - y1
-    half_danger_y = cfg.laser_beam_thickness / 2 + cfg.player_height / 2
-
-    if abs(dx) < EPS:
-        half_danger_x = cfg.laser_beam_thickness / 2 + cfg.player_width / 2
-        if abs(cfg.player_col_x - x1) > half_danger_x:
-            return None
-        lo = min(y1, y2) - half_danger_y
-        hi = max(y1, y2) + half_danger_y
-        return (lo, hi)
-
-    frac = (cfg.player_col_x - x1) / dx
-    if frac < 0 or frac > 1:
-        return None
-    y_at_col = y1 + dy * frac
-    return (y_at_col - half_danger_y, y_at_col + half_danger_y)
-
-
-def merge_intervals(intervals):
-    if not intervals:
-        return []
-    intervals = sorted(intervals, key=lambda p: p[0])
-    out = [list(intervals[0])]
-    for lo, hi in intervals[1:]:
-        prev = out[-1]
-        if lo <= prev[1]:
-            prev[1] = max(prev[1], hi)
+    if r.first_frontier_empty_time is not None:
+        print("       frontier empty at t={:.3f}s".format(r.first_frontier_empty_time))
+    if r.loop_period is not None:
+        print("       loop period {:g}s: {} after {} cycle(s)".format(
+            r.loop_period, loop_verdict_text(r), r.loop_cycles))
+    if r.loop_fallback:
+        print("       loop: no common laser period, grid fallback (python backend, duration only)")
+    if r.finest_dt is not None:
+        if r.adaptive_passes == 1:
+            converged = "single pass, not refined"
         else:
-            out.append([lo, hi])
-    return out
-
-
-# ---------------------------------------------------------------------------
-# Compute safe rows at a moment in time
-# ---------------------------------------------------------------------------
-
-def compute_safe_rows(pattern, t, cfg, grid_min_y, grid_max_y):
-    safe = [False] * (grid_max_y + 1)
-    for y in range(grid_min_y, grid_max_y + 1):
-        safe[y] = True
-
-    intervals = []
-    for laser in pattern["lasers"]:
-        s = sample_laser(laser["keyframes"], t, laser.get("loop", True))
-        if not s or s.get("state") != "active":
-            continue
-        blocked = blocked_interval_at_column(s, cfg)
-        if blocked is not None:
-            intervals.append(blocked)
-
-    for lo_raw, hi_raw in merge_intervals(intervals):
-        lo = max(grid_min_y, min(grid_max_y, int(math.ceil(lo_raw))))
-        hi = max(grid_min_y, min(grid_max_y, int(math.floor(hi_raw))))
-        if hi < lo:
-            continue
-        for y in range(lo, hi + 1):
-            safe[y] = False
-    return safe
-
-
-def count_true(arr, lo, hi):
-    return sum(1 for i in range(lo, hi + 1) if arr[i])
-
-
-# ---------------------------------------------------------------------------
-# Pattern result
-# ---------------------------------------------------------------------------
-
-@dataclass
-class PatternResult:
-    pattern_id: str
-    name: str
-    duration: float
-    first_frontier_empty_time: Optional[float]
-    min_reachable_count: int
-    min_safe_count: int
-    final_reachable_count: int
-    final_safe_count: int
-    safe_timeline: Optional[List[List[bool]]] = None
-    reachable_timeline: Optional[List[List[bool]]] = None
-    grid_min_y: int = 0
-    grid_max_y: int = 0
-
-    @property
-    def solvable(self) -> bool:
-        return self.first_frontier_empty_time is None
-
-
-# ---------------------------------------------------------------------------
-# Analyze a single pattern
-# ---------------------------------------------------------------------------
-
-def analyze_pattern(pattern, cfg, dt, collect_timeline=False):
-    grid_min_y = int(math.ceil(cfg.player_height / 2))
-    grid_max_y = int(math.floor(cfg.ground_y - cfg.player_height / 2))
-    duration = float(pattern["duration"])
-
-    safe0 = compute_safe_rows(pattern, 0.0, cfg, grid_min_y, grid_max_y)
-    reachable = safe0[:]
-
-    safe_timeline = [safe0[:]] if collect_timeline else None
-    reachable_timeline = [reachable[:]] if collect_timeline else None
-
-    t = 0.0
-    first_frontier_empty_time = None
-    min_reachable_count = count_true(reachable, grid_min_y, grid_max_y)
-    min_safe_count = min_reachable_count
-
-    up_step = cfg.terminal_vel_up * dt
-    down_step = cfg.terminal_vel_down * dt
-
-    while t + dt <= duration + EPS:
-        t += dt
-        safe = compute_safe_rows(pattern, t, cfg, grid_min_y, grid_max_y)
-        candidate = [False] * (grid_max_y + 1)
-
-        for y in range(grid_min_y, grid_max_y + 1):
-            if not reachable[y]:
-                continue
-            lo = max(grid_min_y, min(grid_max_y, int(math.floor(y - up_step))))
-            hi = max(grid_min_y, min(grid_max_y, int(math.ceil(y + down_step))))
-            for yy in range(lo, hi + 1):
-                candidate[yy] = True
-
-        for y in range(grid_min_y, grid_max_y + 1):
-            reachable[y] = candidate[y] and safe[y]
-
-        safe_count = count_true(safe, grid_min_y, grid_max_y)
-        reachable_count = count_true(reachable, grid_min_y, grid_max_y)
-        min_safe_count = min(min_safe_count, safe_count)
-        min_reachable_count = min(min_reachable_count, reachable_count)
-        if reachable_count == 0 and first_frontier_empty_time is None:
-            first_frontier_empty_time = t
-
-        if collect_timeline:
-            safe_timeline.append(safe[:])
-            reachable_timeline.append(reachable[:])
-
-    final_safe_count = count_true(
-        compute_safe_rows(pattern, duration, cfg, grid_min_y, grid_max_y),
-        grid_min_y, grid_max_y,
-    )
-    final_reachable_count = count_true(reachable, grid_min_y, grid_max_y)
-
-    return PatternResult(
-        pattern_id=pattern.get("id", "unknown"),
-        name=pattern.get("name", pattern.get("id", "unknown")),
-        duration=duration,
-        first_frontier_empty_time=first_frontier_empty_time,
-        min_reachable_count=min_reachable_count,
-        min_safe_count=min_safe_count,
-        final_reachable_count=final_reachable_count,
-        final_safe_count=final_safe_count,
-        safe_timeline=safe_timeline,
-        reachable_timeline=reachable_timeline,
-        grid_min_y=grid_min_y,
-        grid_max_y=grid_max_y,
-    )
-
-
-# ---------------------------------------------------------------------------
-# Image output (PPM — no external dependencies)
-# ---------------------------------------------------------------------------
-
-def sanitize_filename(name):
-    out = []
-    for ch in name:
-        if ch.isalnum() or ch in ("-", "_"):
-            out.append(ch)
-        elif ch.isspace():
-            out.append("_")
-    return "".join(out).strip("_") or "pattern"
-
-
-import struct
-
-def write_bmp(path, width, height, pixels_rgb):
-    """Write a 24-bit BMP file. pixels_rgb is row-major top-to-bottom RGB bytes."""
-    row_data_size = width * 3
-    row_padding = (4 - (row_data_size % 4)) % 4
-    padded_row_size = row_data_size + row_padding
-    pixel_data_size = padded_row_size * height
-
-    file_size = 54 + pixel_data_size
-
-    with open(path, "wb") as f:
-        # File header (14 bytes)
-        f.write(b"BM")
-        f.write(struct.pack("<I", file_size))
-        f.write(struct.pack("<HH", 0, 0))
-        f.write(struct.pack("<I", 54))
-
-        # DIB header (40 bytes — BITMAPINFOHEADER)
-        f.write(struct.pack("<I", 40))
-        f.write(struct.pack("<i", width))
-        f.write(struct.pack("<i", -height))  # negative = top-down row order
-        f.write(struct.pack("<HH", 1, 24))
-        f.write(struct.pack("<I", 0))        # no compression
-        f.write(struct.pack("<I", pixel_data_size))
-        f.write(struct.pack("<i", 2835))     # ~72 DPI horizontal
-        f.write(struct.pack("<i", 2835))     # ~72 DPI vertical
-        f.write(struct.pack("<I", 0))
-        f.write(struct.pack("<I", 0))
-
-        # Pixel data (BMP stores BGR)
-        pad = b"\x00" * row_padding
-        for row in range(height):
-            row_start = row * width * 3
-            for col in range(width):
-                idx = row_start + col * 3
-                r, g, b = pixels_rgb[idx], pixels_rgb[idx + 1], pixels_rgb[idx + 2]
-                f.write(bytes([b, g, r]))
-            if row_padding:
-                f.write(pad)
-
-
-def render_pattern_timeline_image(result, out_dir):
-    if not result.safe_timeline or not result.reachable_timeline:
-        return None
-
-    width = len(result.safe_timeline)
-    height = result.grid_max_y - result.grid_min_y + 1
-    if width <= 0 or height <= 0:
-        return None
-
-    blocked_color = (50, 0, 0)
-    safe_unreachable_color = (220, 180, 0)
-    safe_reachable_color = (50, 255, 80)
-
-    pixels = bytearray(width * height * 3)
-    for x in range(width):
-        safe_col = result.safe_timeline[x]
-        reach_col = result.reachable_timeline[x]
-        for iy, y in enumerate(range(result.grid_min_y, result.grid_max_y + 1)):
-            idx = (iy * width + x) * 3
-            if not safe_col[y]:
-                r, g, b = blocked_color
-            elif reach_col[y]:
-                r, g, b = safe_reachable_color
-            else:
-                r, g, b = safe_unreachable_color
-            pixels[idx] = r
-            pixels[idx + 1] = g
-            pixels[idx + 2] = b
-
-    os.makedirs(out_dir, exist_ok=True)
-    base = sanitize_filename("{}_{}".format(result.pattern_id, result.name))
-    out_path = os.path.join(out_dir, "{}.bmp".format(base))
-    write_bmp(out_path, width, height, bytes(pixels))
-    return out_path
+            converged = "dt={:.4f}s".format(r.converged_dt) if r.converged_dt is not None else "not converged"
+        print("       adaptive: verdict {}; finest dt={:.4f}s over {:.2f}s".format(
+            converged, r.finest_dt, r.finest_span_s))
+    if r.clearance_beam_free is not None:
+        print("       clearance p{}: {} px to nearest beam ({:.0%} of reachable cells beam-free), "
+              "{} s until row blocked ({:.0%} never blocked again)".format(
+                  "/".join(str(p) for p in CLEARANCE_PERCENTILES),
+                  format_percentiles("{:g}", r.clearance_px), r.clearance_beam_free,
+                  format_percentiles("{:.2f}", r.clearance_s), r.clearance_never_blocked))
 
 
-# ---------------------------------------------------------------------------
-# Report
-# ---------------------------------------------------------------------------
-
 def print_report(results, strict):
     print("Laser Solvability Report")
     print("========================")
-    unsolved = 0
-
     for r in results:
-        status = "PASS" if r.solvable else "FAIL"
-        if not r.solvable:
-            unsolved += 1
-        print(
-            "[{}] {:<3} {} | minReachable={}, minSafe={}, finalReachable={}/{}".format(
-                status, r.pattern_id, r.name,
-                r.min_reachable_count, r.min_safe_count,
-                r.final_reachable_count, r.final_safe_count,
-            )
-        )
-        if r.first_frontier_empty_time is not None:
-            print("       frontier empty at t={:.3f}s".format(r.first_frontier_empty_time))
+        print_result(r)
+    unsolved = sum(1 for r in results if not r.solvable)
 
     print("------------------------")
     print("Patterns checked: {}".format(len(results)))
@@ -760,45 +229,226 @@ def print_report(results, strict):
     return 0
 
 
+# ---------------------------------------------------------------------------
+# Watch mode
+# Polls the export's source files (js/data/laserPatterns.js, js/config.js and
+# whatever else the export imports) by mtime/size. After a save the patterns
+# are re-exported through the snapshot, and only those whose result cache key
+# (pattern definition + config + dt + backend) changed are re-verified and
+# re-rendered. The process, NumPy, the snapshot and the worker pool stay warm
+# between saves, so one edited pattern costs one Node export plus one analysis.
+# ---------------------------------------------------------------------------
+
+WATCH_POLL_S = 0.2
+WATCH_SETTLE_S = 0.05  # let editors finish multi-step saves before exporting
+
+
+def source_stamps(paths):
+    stamps = {}
+    for path in paths:
+        try:
+            st = os.stat(path)
+            stamps[path] = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            stamps[path] = None
+    return stamps
+
+
+def verify_changed(job_for, cache_dir, pattern_id, known, workers, pool):
+    """Re-verify patterns whose key differs from `known` (pattern id -> key), updating it in place."""
+    stamp, started = time.strftime("%H:%M:%S"), time.monotonic()
+    try:
+        payload = load_exported_payload(cache_dir)
+        cfg = sim_config_from_export(payload["config"])
+        patterns = [p for p in payload["patterns"] if not pattern_id or p.get("id") == pattern_id]
+        jobs = [job_for(p, cfg) for p in patterns]
+        keys = {job.pattern.get("id"): result_cache_key(job.pattern, job.cfg, job.dt, job.backend) for job in jobs}
+        changed = [job for job in jobs if known.get(job.pattern.get("id")) != keys[job.pattern.get("id")]]
+        outcomes = run_parallel(run_verify_job, changed, workers, pool)
+    except (RuntimeError, ValueError) as e:
+        print("[{}] ERROR: {}".format(stamp, e), flush=True)
+        return
+    removed = sorted(set(known) - set(keys))
+    known.clear()
+    known.update(keys)
+
+    print("[{}] {} changed, {} unchanged, {} removed ({:.2f}s)".format(
+        stamp, len(changed), len(jobs) - len(changed), len(removed),
+        time.monotonic() - started))
+    for r, paths, _ in outcomes:
+        print_result(r)
+        for path in paths:
+            print("       image: {}".format(path))
+    for removed_id in removed:
+        print("       removed: {}".format(removed_id))
+    sys.stdout.flush()
+
+
+def watch_patterns(job_for, cache_dir, pattern_id, workers):
+    """Verify once, then re-verify changed patterns on every save until Ctrl+C."""
+    known = {}
+    stamps = None
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    print("Watching laser pattern sources (Ctrl+C to stop)", flush=True)
+    try:
+        while True:
+            try:
+                sources = export_source_files()
+            except OSError:
+                sources = []  # mid-save rename; try again next poll
+            current = source_stamps(sources)
+            if sources and current != stamps:
+                if stamps is not None:
+                    time.sleep(WATCH_SETTLE_S)
+                    current = source_stamps(sources)
+                stamps = current
+                verify_changed(job_for, cache_dir, pattern_id, known, workers, pool)
+            time.sleep(WATCH_POLL_S)
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 
-def main():
+def build_parser():
     parser = argparse.ArgumentParser(description="Offline laser solvability checker")
     parser.add_argument("--pattern", help="Only check one pattern ID (e.g. M2)")
+    parser.add_argument("--source", choices=("js", "python"), default="js",
+                        help="js: real patterns/config via the Node export (snapshotted); "
+                             "python: the hand-ported copies in laser_patterns.py")
     parser.add_argument("--dt", type=float, default=1.0 / 60.0, help="Simulation step in seconds")
     parser.add_argument("--strict", action="store_true", help="Exit non-zero if any pattern fails")
-    parser.add_argument("--image-dir", help="Output directory for timeline images (PPM)")
-    args = parser.parse_args()
-
+    parser.add_argument("--image-dir", help="Output directory for timeline images")
+    parser.add_argument("--image-format", choices=sorted(IMAGE_WRITERS), default="bmp",
+                        help="Timeline image format (png is much smaller)")
+    parser.add_argument("--backend", choices=sorted(ANALYZERS), default="python",
+                        help="Reachability engine (numpy: same results, much faster; "
+                             "intervals: exact float beam edges, counts in px; "
+                             "event: steps between keyframes, independent of --dt; "
+                             "loop: verdict over the pattern duration, then runs whole laser cycles "
+                             "until the frontier repeats or empties to decide whether it survives "
+                             "indefinitely; "
+                             "physics: (y, vy) states under GRAVITY/THRUST, counts in px; "
+                             "adaptive: coarse pass refined down to --dt only around tight spots, counts in px)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes for analysis and rendering (default: all cores)")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR,
+                        help="Result cache directory (default: .cache/laser_solvability)")
+    parser.add_argument("--no-cache", action="store_true", help="Neither read nor write the result cache")
+    parser.add_argument("--sweep", action="append", metavar="FIELD=START:STOP:STEP",
+                        help="Sweep a SimConfig field or dt (repeatable; all combinations run in one "
+                             "NumPy pass per pattern). Also accepts FIELD=V1,V2,...")
+    parser.add_argument("--sweep-out", help="Sweep table path (.json for JSON, else CSV; default stdout)")
+    parser.add_argument("--witness", metavar="DIR",
+                        help="Write one surviving (or longest) y(t) path per pattern as JSON; "
+                             "drawn in white on --image-dir timelines")
+    parser.add_argument("--clearance", action="store_true",
+                        help="Report clearance percentiles (px to nearest beam, s until row blocked) and, "
+                             "with --image-dir, render clearance heatmaps (NumPy)")
+    parser.add_argument("--margins", action="store_true",
+                        help="Bisect how much extra beam thickness / player height, velocity reduction "
+                             "and timing slack each pattern tolerates (NumPy grid model)")
+    parser.add_argument("--monte-carlo", type=int, metavar="N",
+                        help="Estimate survival odds from N noisy physics trajectories per pattern "
+                             "following its witness corridor (NumPy)")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running; re-verify (and re-render) only patterns whose JS definition "
+                             "or config changed after each save")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Re-export patterns, recompute every pattern and overwrite its cache entry")
+    return parser
+
+
+def validate_args(args):
+    """Parsed --sweep specs; ValueError on an invalid option or combination."""
     if args.dt <= 0:
-        print("ERROR: --dt must be > 0", file=sys.stderr)
-        return 1
-
-    cfg = SimConfig()
-    patterns = build_all_patterns()
-
-    if args.pattern:
-        patterns = [p for p in patterns if p.get("id") == args.pattern]
-        if not patterns:
-            print("ERROR: Pattern '{}' not found.".format(args.pattern), file=sys.stderr)
-            return 1
-
-    collect_timeline = bool(args.image_dir)
-    results = [analyze_pattern(p, cfg, args.dt, collect_timeline=collect_timeline) for p in patterns]
-
-    rc = print_report(results, strict=args.strict)
-
+        raise ValueError("--dt must be > 0")
+    if args.jobs < 1:
+        raise ValueError("--jobs must be >= 1")
+    if args.backend == "numpy" and np is None:
+        raise ValueError("--backend numpy requires NumPy (pip install numpy)")
+    if (args.sweep or args.margins or args.monte_carlo or args.clearance) and np is None:
+        raise ValueError("--sweep, --margins, --monte-carlo and --clearance require NumPy (pip install numpy)")
+    if args.backend == "adaptive" and (args.image_dir or args.clearance or args.witness):
+        raise ValueError("--backend adaptive has no per-tick timeline: drop --image-dir, --clearance and --witness")
+    if args.monte_carlo is not None and args.monte_carlo < 1:
+        raise ValueError("--monte-carlo must be >= 1")
+    sweep_specs = [parse_sweep_arg(text) for text in args.sweep or []]
+    if args.watch and (args.source != "js" or sweep_specs or args.margins or args.monte_carlo):
+        raise ValueError("--watch needs --source js and no --sweep, --margins or --monte-carlo")
+    return sweep_specs
+
+
+def load_inputs(args, cache_dir):
+    """(cfg, patterns) to check; RuntimeError / ValueError when they cannot be used."""
+    cfg, patterns = load_patterns(args.source, cache_dir, args.pattern, refresh=args.rebuild)
+    if args.backend == "physics":
+        build_physics_lattice(cfg, args.dt)
+    return cfg, patterns
+
+
+def run_batch_mode(args, cfg, patterns, sweep_specs):
+    """Run --sweep, --margins or --monte-carlo; False when none was requested."""
+    if sweep_specs:
+        table = run_sweep(patterns, cfg, args.dt, sweep_specs)
+        write_sweep_table(table, args.sweep_out)
+        if args.sweep_out:
+            print("Sweep: {} rows -> {}".format(len(table), args.sweep_out))
+    elif args.margins:
+        print_margins(run_parallel(pattern_margins, [MarginJob(p, cfg, args.dt) for p in patterns], args.jobs))
+    elif args.monte_carlo:
+        jobs = [MonteCarloJob(p, cfg, args.dt, args.monte_carlo) for p in patterns]
+        print_monte_carlo(run_parallel(monte_carlo_survival, jobs, args.jobs))
+    else:
+        return False
+    return True
+
+
+def print_output_paths(args, outcomes):
     if args.image_dir:
         print("\nTimeline Images")
         print("---------------")
-        for r in results:
-            path = render_pattern_timeline_image(r, args.image_dir)
-            if path:
+        for r, paths, _ in outcomes:
+            for path in paths:
                 print("{}: {}".format(r.pattern_id, path))
-        print("\nColor key: green=reachable safe, yellow=safe but unreachable, dark-red=blocked")
+        print("\nColor key: green=reachable safe, yellow=safe but unreachable, dark-red=blocked"
+              + (", white=witness" if args.witness else ""))
+        if args.clearance:
+            print("Clearance key: red->yellow->green = 0..{}+px to nearest beam (dimmed: unreachable), "
+                  "dark-red=blocked".format(CLEARANCE_BUCKET_PX * (CLEARANCE_BUCKETS - 1)))
+    if args.witness:
+        print("\nWitness Trajectories")
+        print("--------------------")
+        for r, _, path in outcomes:
+            print("{}: {}".format(r.pattern_id, path))
 
+
+def main():
+    args = build_parser().parse_args()
+    cache_dir = None if args.no_cache else args.cache_dir
+    try:
+        sweep_specs = validate_args(args)
+        cfg, patterns = load_inputs(args, cache_dir)
+    except (RuntimeError, ValueError) as e:
+        print("ERROR: {}".format(e), file=sys.stderr)
+        return 1
+    if run_batch_mode(args, cfg, patterns, sweep_specs):
+        return 0
+
+    def job_for(pattern, job_cfg):
+        return VerifyJob(pattern, job_cfg, args.dt, args.backend, args.image_dir, args.image_format,
+                         cache_dir, args.rebuild, args.witness, args.clearance)
+
+    if args.watch:
+        return watch_patterns(job_for, cache_dir, args.pattern, args.jobs)
+    outcomes = run_verify_jobs([job_for(p, cfg) for p in patterns], args.jobs)
+    rc = print_report([result for result, _, _ in outcomes], strict=args.strict)
+    print_output_paths(args, outcomes)
     return rc
 
 